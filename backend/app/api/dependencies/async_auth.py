@@ -0,0 +1,26 @@
+"""
+Dependencia de autenticación - modo asíncrono (ASYNC_API)
+Extrae el usuario actual desde JWT token con el repositorio AsyncSession
+"""
+from fastapi import Depends
+from ...auth import verify_token
+from ..dependencies.auth import security, validar_usuario_activo
+from ..dependencies.async_container import get_async_usuario_repository
+from ...infrastructure.database.async_usuario_repository import AsyncSQLUsuarioRepository
+from ...infrastructure.cache.usuario_cache import usuario_cache
+from ...domain.entities.usuario import Usuario
+
+
+async def get_current_user_async(
+    credentials = Depends(security),
+    usuario_repo: AsyncSQLUsuarioRepository = Depends(get_async_usuario_repository)
+) -> Usuario:
+    """
+    Igual que get_current_user_from_token pero sin bloquear el event loop
+    """
+    token_data = verify_token(credentials.credentials)
+    usuario = usuario_cache.get(token_data["email"])
+    if usuario is None:
+        usuario = await usuario_repo.find_by_email(email=token_data["email"])
+        usuario_cache.set(usuario)
+    return validar_usuario_activo(usuario)
@@ -0,0 +1,131 @@
+"""
+Container de Inyección de Dependencias - modo asíncrono (ASYNC_API)
+Repositorios y casos de uso sobre AsyncSession
+"""
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Infrastructure imports
+from ...infrastructure.config.async_database import get_async_db, AsyncSessionLocal
+from ...infrastructure.database.async_usuario_repository import AsyncSQLUsuarioRepository
+from ...infrastructure.database.async_transaccion_repository import AsyncSQLTransaccionRepository
+from ...infrastructure.database.async_sueldo_repository import AsyncSQLSueldoRepository
+
+# Application imports
+from ...application.use_cases.usuario.crear_usuario import AsyncCrearUsuarioUseCase
+from ...application.use_cases.usuario.login_usuario import AsyncLoginUsuarioUseCase
+from ...application.use_cases.transaccion.crear_transaccion import CrearTransaccionUseCase
+from ...application.use_cases.transaccion.obtener_transacciones import ObtenerTransaccionesUseCase
+from ...application.use_cases.transaccion.actualizar_transaccion import ActualizarTransaccionUseCase
+from ...application.use_cases.transaccion.eliminar_transaccion import EliminarTransaccionUseCase
+from ...application.use_cases.transaccion.importar_transacciones import AsyncImportarTransaccionesUseCase
+from ...application.use_cases.transaccion.exportar_transacciones import AsyncExportarTransaccionesUseCase
+from ...application.use_cases.transaccion.lote_transacciones import LoteTransaccionesUseCase
+from ...application.use_cases.balance.calcular_balance import CalcularBalanceUseCase
+from ...application.use_cases.sueldo.crear_sueldo import AsyncCrearSueldoUseCase
+from ...application.use_cases.sueldo.obtener_sueldo import AsyncObtenerSueldoUseCase
+from ...application.use_cases.sueldo.obtener_sueldos import AsyncObtenerSueldosUseCase
+from ...application.use_cases.sueldo.actualizar_sueldo import AsyncActualizarSueldoUseCase
+
+
+class AsyncUseCaseAdapter:
+    """
+    Expone un caso de uso basado en Session como corrutinas
+    Cada llamada corre con AsyncSession.run_sync: el código síncrono del caso de uso
+    se ejecuta sobre la conexión asíncrona sin ocupar un hilo del threadpool
+    """
+
+    def __init__(self, db: AsyncSession, use_case_cls):
+        self.db = db
+        self.use_case_cls = use_case_cls
+
+    def __getattr__(self, nombre):
+        async def llamar(*args, **kwargs):
+            return await self.db.run_sync(lambda sesion: getattr(self.use_case_cls(sesion), nombre)(*args, **kwargs))
+        return llamar
+
+
+# ========== REPOSITORY DEPENDENCIES ==========
+
+def get_async_usuario_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLUsuarioRepository:
+    """Inyectar repositorio asíncrono de usuarios"""
+    return AsyncSQLUsuarioRepository(db)
+
+def get_async_transaccion_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLTransaccionRepository:
+    """Inyectar repositorio asíncrono de transacciones"""
+    return AsyncSQLTransaccionRepository(db)
+
+def get_async_sueldo_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLSueldoRepository:
+    """Inyectar repositorio asíncrono de sueldos"""
+    return AsyncSQLSueldoRepository(db)
+
+
+# ========== USE CASE DEPENDENCIES ==========
+
+def get_async_crear_usuario_use_case(usuario_repo = Depends(get_async_usuario_repository)) -> AsyncCrearUsuarioUseCase:
+    """Inyectar caso de uso CrearUsuario (async)"""
+    return AsyncCrearUsuarioUseCase(usuario_repo)
+
+def get_async_login_usuario_use_case(usuario_repo = Depends(get_async_usuario_repository)) -> AsyncLoginUsuarioUseCase:
+    """Inyectar caso de uso LoginUsuario (async)"""
+    return AsyncLoginUsuarioUseCase(usuario_repo)
+
+def get_async_crear_transaccion_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncUseCaseAdapter:
+    """Inyectar caso de uso CrearTransaccion (async)"""
+    return AsyncUseCaseAdapter(db, CrearTransaccionUseCase)
+
+def get_async_obtener_transacciones_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncUseCaseAdapter:
+    """Inyectar caso de uso ObtenerTransacciones (async)"""
+    return AsyncUseCaseAdapter(db, ObtenerTransaccionesUseCase)
+
+def get_async_actualizar_transaccion_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncUseCaseAdapter:
+    """Inyectar caso de uso ActualizarTransaccion (async)"""
+    return AsyncUseCaseAdapter(db, ActualizarTransaccionUseCase)
+
+def get_async_eliminar_transaccion_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncUseCaseAdapter:
+    """Inyectar caso de uso EliminarTransaccion (async)"""
+    return AsyncUseCaseAdapter(db, EliminarTransaccionUseCase)
+
+def get_async_importar_transacciones_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncImportarTransaccionesUseCase:
+    """Inyectar caso de uso ImportarTransacciones (async: parseo en el threadpool, INSERT por lotes)"""
+    return AsyncImportarTransaccionesUseCase(db)
+
+def get_async_exportar_transacciones_use_case() -> AsyncExportarTransaccionesUseCase:
+    """Inyectar caso de uso ExportarTransacciones (async, abre su propia sesión al hacer streaming)"""
+    return AsyncExportarTransaccionesUseCase(AsyncSessionLocal)
+
+def get_async_lote_transacciones_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncUseCaseAdapter:
+    """Inyectar caso de uso LoteTransacciones (async)"""
+    return AsyncUseCaseAdapter(db, LoteTransaccionesUseCase)
+
+def get_async_calcular_balance_use_case(db: AsyncSession = Depends(get_async_db)) -> AsyncUseCaseAdapter:
+    """Inyectar caso de uso CalcularBalance (async)"""
+    return AsyncUseCaseAdapter(db, CalcularBalanceUseCase)
+
+def get_async_crear_sueldo_use_case(
+    sueldo_repo = Depends(get_async_sueldo_repository),
+    usuario_repo = Depends(get_async_usuario_repository)
+) -> AsyncCrearSueldoUseCase:
+    """Inyectar caso de uso CrearSueldo (async)"""
+    return AsyncCrearSueldoUseCase(sueldo_repo, usuario_repo)
+
+def get_async_obtener_sueldo_use_case(
+    sueldo_repo = Depends(get_async_sueldo_repository),
+    usuario_repo = Depends(get_async_usuario_repository)
+) -> AsyncObtenerSueldoUseCase:
+    """Inyectar caso de uso ObtenerSueldo (async)"""
+    return AsyncObtenerSueldoUseCase(sueldo_repo, usuario_repo)
+
+def get_async_obtener_sueldos_use_case(
+    sueldo_repo = Depends(get_async_sueldo_repository),
+    usuario_repo = Depends(get_async_usuario_repository)
+) -> AsyncObtenerSueldosUseCase:
+    """Inyectar caso de uso ObtenerSueldos (async)"""
+    return AsyncObtenerSueldosUseCase(sueldo_repo, usuario_repo)
+
+def get_async_actualizar_sueldo_use_case(
+    sueldo_repo = Depends(get_async_sueldo_repository),
+    usuario_repo = Depends(get_async_usuario_repository)
+) -> AsyncActualizarSueldoUseCase:
+    """Inyectar caso de uso ActualizarSueldo (async)"""
+    return AsyncActualizarSueldoUseCase(sueldo_repo, usuario_repo)
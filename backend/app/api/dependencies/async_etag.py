@@ -0,0 +1,28 @@
+"""
+GET condicionales con ETag - modo asíncrono (ASYNC_API)
+"""
+from fastapi import Depends, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...infrastructure.config.async_database import get_async_db
+from ...infrastructure.config.replica import primario, recordar_version
+from ...infrastructure.database.models import VersionUsuarioORM
+from ...domain.entities.usuario import Usuario
+from .async_auth import get_current_user_async
+from .etag import responder_condicional
+
+
+async def etag_usuario_async(
+    request: Request,
+    response: Response,
+    current_user: Usuario = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Igual que etag_usuario sin bloquear el event loop"""
+    # Del primario, como etag_usuario (ver SQLVersionUsuarioRepository.get)
+    with primario(db):
+        version = (await db.execute(
+            select(VersionUsuarioORM.version).where(VersionUsuarioORM.user_id == current_user.id)
+        )).scalar_one_or_none()
+    recordar_version(db, current_user.id, version)
+    responder_condicional(request, response, current_user.id, version or 0)
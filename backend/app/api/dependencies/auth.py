@@ -7,6 +7,7 @@ from fastapi.security import HTTPBearer
 from ...auth import verify_token
 from ..dependencies.container import get_usuario_repository
 from ...infrastructure.database.usuario_repository import SQLUsuarioRepository
+from ...infrastructure.cache.usuario_cache import usuario_cache
 from ...domain.entities.usuario import Usuario
 
 security = HTTPBearer()
@@ -26,8 +27,17 @@ def get_current_user_from_token(
     # Verificar el token (usando función existente de auth.py)
     token_data = verify_token(token)
     
-    # Buscar el usuario usando el repositorio
-    usuario = usuario_repo.find_by_email(email=token_data["email"])
+    # Buscar el usuario: caché del proceso y, si no está, el repositorio
+    usuario = usuario_cache.get(token_data["email"])
+    if usuario is None:
+        usuario = usuario_repo.find_by_email(email=token_data["email"])
+        usuario_cache.set(usuario)
+    # is_active se comprueba siempre, también con el usuario cacheado
+    return validar_usuario_activo(usuario)  # Devolvemos el objeto Usuario completo
+
+
+def validar_usuario_activo(usuario) -> Usuario:
+    """Rechazar tokens de usuarios inexistentes o desactivados"""
     if usuario is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -42,4 +52,4 @@ def get_current_user_from_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return usuario  # Devolvemos el objeto Usuario completo
\ No newline at end of file
+    return usuario
\ No newline at end of file
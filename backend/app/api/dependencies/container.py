@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from fastapi import Depends
 
 # Infrastructure imports
-from ...infrastructure.config.database import get_db
+from ...infrastructure.config.database import get_db, SessionLocal
 from ...infrastructure.database.usuario_repository import SQLUsuarioRepository
 from ...infrastructure.database.transaccion_repository import SQLTransaccionRepository
 from ...infrastructure.database.sueldo_repository import SQLSueldoRepository
@@ -20,6 +20,9 @@ from ...application.use_cases.transaccion.obtener_transacciones import ObtenerTr
 from ...application.use_cases.balance.calcular_balance import CalcularBalanceUseCase
 from ...application.use_cases.transaccion.actualizar_transaccion import ActualizarTransaccionUseCase
 from ...application.use_cases.transaccion.eliminar_transaccion import EliminarTransaccionUseCase
+from ...application.use_cases.transaccion.importar_transacciones import ImportarTransaccionesUseCase
+from ...application.use_cases.transaccion.exportar_transacciones import ExportarTransaccionesUseCase
+from ...application.use_cases.transaccion.lote_transacciones import LoteTransaccionesUseCase
 from ...application.use_cases.sueldo.crear_sueldo import CrearSueldoUseCase
 from ...application.use_cases.sueldo.obtener_sueldo import ObtenerSueldoUseCase
 from ...application.use_cases.sueldo.obtener_sueldos import ObtenerSueldosUseCase
@@ -56,31 +59,44 @@ def get_login_usuario_use_case(
     """Inyectar caso de uso LoginUsuario"""
     return LoginUsuarioUseCase(usuario_repo)
 
-def get_perfil_usuario_use_case(
-    usuario_repo = Depends(get_usuario_repository)
-) -> PerfilUsuarioUseCase:
+def get_perfil_usuario_use_case(db: Session = Depends(get_db)) -> PerfilUsuarioUseCase:
     """Inyectar caso de uso PerfilUsuario"""
-    return PerfilUsuarioUseCase(usuario_repo)
+    return PerfilUsuarioUseCase(db)
+
+# Los casos de uso basados en sesión reciben la sesión del request (get_db),
+# la misma que usan los repositorios: se cierra y devuelve al pool al terminar
 
-def get_crear_transaccion_use_case():
+def get_crear_transaccion_use_case(db: Session = Depends(get_db)) -> CrearTransaccionUseCase:
     """Inyectar caso de uso CrearTransaccion"""
-    return CrearTransaccionUseCase()
+    return CrearTransaccionUseCase(db)
 
-def get_obtener_transacciones_use_case():
+def get_obtener_transacciones_use_case(db: Session = Depends(get_db)) -> ObtenerTransaccionesUseCase:
     """Inyectar caso de uso ObtenerTransacciones"""
-    return ObtenerTransaccionesUseCase()
+    return ObtenerTransaccionesUseCase(db)
 
-def get_actualizar_transaccion_use_case():
+def get_actualizar_transaccion_use_case(db: Session = Depends(get_db)) -> ActualizarTransaccionUseCase:
     """Inyectar caso de uso ActualizarTransaccion"""
-    return ActualizarTransaccionUseCase()
+    return ActualizarTransaccionUseCase(db)
 
-def get_eliminar_transaccion_use_case():
+def get_eliminar_transaccion_use_case(db: Session = Depends(get_db)) -> EliminarTransaccionUseCase:
     """Inyectar caso de uso EliminarTransaccion"""
-    return EliminarTransaccionUseCase()
+    return EliminarTransaccionUseCase(db)
+
+def get_importar_transacciones_use_case(db: Session = Depends(get_db)) -> ImportarTransaccionesUseCase:
+    """Inyectar caso de uso ImportarTransacciones"""
+    return ImportarTransaccionesUseCase(db)
+
+def get_exportar_transacciones_use_case() -> ExportarTransaccionesUseCase:
+    """Inyectar caso de uso ExportarTransacciones (abre su propia sesión al hacer streaming)"""
+    return ExportarTransaccionesUseCase(SessionLocal)
+
+def get_lote_transacciones_use_case(db: Session = Depends(get_db)) -> LoteTransaccionesUseCase:
+    """Inyectar caso de uso LoteTransacciones"""
+    return LoteTransaccionesUseCase(db)
 
-def get_calcular_balance_use_case():
+def get_calcular_balance_use_case(db: Session = Depends(get_db)) -> CalcularBalanceUseCase:
     """Inyectar caso de uso CalcularBalance"""
-    return CalcularBalanceUseCase()
+    return CalcularBalanceUseCase(db)
 
 def get_crear_sueldo_use_case(
     sueldo_repo = Depends(get_sueldo_repository),
@@ -0,0 +1,37 @@
+"""
+GET condicionales con ETag
+El ETag es la versión de datos del usuario (versiones_usuario): si el cliente ya la tiene
+(If-None-Match) se responde 304 antes de ejecutar ninguna consulta pesada
+"""
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+from ...infrastructure.config.database import get_db
+from ...infrastructure.database.version_repository import SQLVersionUsuarioRepository
+from ...domain.entities.usuario import Usuario
+from .auth import get_current_user_from_token
+
+
+def responder_condicional(request: Request, response: Response, user_id: int, version: int):
+    """
+    Fijar ETag en la respuesta o cortar con 304 si el cliente ya tiene esta versión
+    El id de usuario forma parte del ETag: otro usuario en el mismo navegador nunca coincide
+    """
+    etag = f'W/"{user_id}-{version}"'
+    cabeceras = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidatos = {e.strip() for e in if_none_match.split(",")}
+        if "*" in candidatos or etag in candidatos or etag[2:] in candidatos:
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=cabeceras)
+    response.headers.update(cabeceras)
+
+
+def etag_usuario(
+    request: Request,
+    response: Response,
+    current_user: Usuario = Depends(get_current_user_from_token),
+    db: Session = Depends(get_db)
+):
+    """Dependencia para los GET de datos del usuario: una lectura por clave primaria"""
+    version = SQLVersionUsuarioRepository(db).get(current_user.id)
+    responder_condicional(request, response, current_user.id, version)
@@ -0,0 +1,121 @@
+"""
+Endpoints de Sueldos y Balance (modo ASYNC_API)
+"""
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import List, Optional
+from ...application.dtos.common_dtos import SueldoCreateDTO, SueldoResponseDTO, BalanceResponseDTO
+from ...domain.entities.usuario import Usuario
+from .. import responses
+from ..dependencies.async_auth import get_current_user_async
+from ..dependencies.async_etag import etag_usuario_async
+from ..dependencies.async_container import (
+    get_async_crear_sueldo_use_case,
+    get_async_obtener_sueldo_use_case,
+    get_async_obtener_sueldos_use_case,
+    get_async_calcular_balance_use_case,
+    get_async_actualizar_sueldo_use_case
+)
+
+router = APIRouter(prefix="/sueldos", tags=["sueldos"])
+
+# Campos de SueldoResponseDTO en el orden de las filas del camino rápido
+CAMPOS_SUELDO = tuple(SueldoResponseDTO.model_fields)
+
+
+@router.post("/", response_model=SueldoResponseDTO)
+async def crear_o_actualizar_sueldo(
+    request: SueldoCreateDTO,
+    current_user: Usuario = Depends(get_current_user_async),
+    crear_sueldo_uc = Depends(get_async_crear_sueldo_use_case)
+):
+    """Crear o actualizar sueldo del usuario"""
+    try:
+        sueldo = await crear_sueldo_uc.execute(user_id=current_user.id, cantidad=request.cantidad, mes=request.mes, anio=request.anio)
+        return SueldoResponseDTO(
+            id=sueldo.id,
+            cantidad=sueldo.cantidad,
+            mes=sueldo.mes,
+            anio=sueldo.anio,
+            fecha=sueldo.fecha,
+            user_id=sueldo.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{anio}/{mes}", response_model=SueldoResponseDTO, dependencies=[Depends(etag_usuario_async)])
+async def obtener_sueldo_mes(
+    anio: int,
+    mes: int,
+    current_user: Usuario = Depends(get_current_user_async),
+    obtener_sueldo_uc = Depends(get_async_obtener_sueldo_use_case)
+):
+    """Obtener sueldo de un mes específico"""
+    sueldo = await obtener_sueldo_uc.execute(user_id=current_user.id, mes=mes, anio=anio)
+    if sueldo is None:
+        raise HTTPException(status_code=404, detail=f"Sueldo no encontrado para el mes {mes} de {anio}")
+    return SueldoResponseDTO(
+        id=sueldo.id,
+        cantidad=sueldo.cantidad,
+        mes=sueldo.mes,
+        anio=sueldo.anio,
+        fecha=sueldo.fecha,
+        user_id=sueldo.user_id
+    )
+
+@router.get("/", response_model=List[SueldoResponseDTO], dependencies=[Depends(etag_usuario_async)])
+async def obtener_sueldos(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: Usuario = Depends(get_current_user_async),
+    obtener_sueldos_uc = Depends(get_async_obtener_sueldos_use_case)
+):
+    """Obtener todos los sueldos del usuario"""
+    sueldos = await obtener_sueldos_uc.execute(user_id=current_user.id, skip=skip, limit=limit)
+    if responses.FAST_JSON_RESPONSES:
+        return responses.filas_json(
+            CAMPOS_SUELDO,
+            ((s.id, s.cantidad, s.mes, s.anio, s.fecha, s.user_id) for s in sueldos),
+            response
+        )
+    return [
+        SueldoResponseDTO(
+            id=s.id,
+            cantidad=s.cantidad,
+            mes=s.mes,
+            anio=s.anio,
+            fecha=s.fecha,
+            user_id=s.user_id
+        ) for s in sueldos
+    ]
+
+@router.get("/balance", response_model=BalanceResponseDTO, dependencies=[Depends(etag_usuario_async)])
+async def obtener_saldo_total(
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    current_user: Usuario = Depends(get_current_user_async),
+    calcular_balance_uc = Depends(get_async_calcular_balance_use_case)
+):
+    """Obtener saldo total del usuario para un mes/año"""
+    saldo = await calcular_balance_uc.execute(user_id=current_user.id, mes=mes, anio=anio)
+    return saldo
+
+@router.put("/", response_model=SueldoResponseDTO)
+async def actualizar_sueldo(
+    request: SueldoCreateDTO,
+    current_user: Usuario = Depends(get_current_user_async),
+    actualizar_sueldo_uc = Depends(get_async_actualizar_sueldo_use_case)
+):
+    """Actualizar sueldo del usuario"""
+    try:
+        sueldo = await actualizar_sueldo_uc.execute(user_id=current_user.id, cantidad=request.cantidad, mes=request.mes, anio=request.anio)
+        return SueldoResponseDTO(
+            id=sueldo.id,
+            cantidad=sueldo.cantidad,
+            mes=sueldo.mes,
+            anio=sueldo.anio,
+            fecha=sueldo.fecha,
+            user_id=sueldo.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
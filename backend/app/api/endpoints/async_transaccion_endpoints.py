@@ -0,0 +1,315 @@
+"""
+Transaccion Controller - Endpoints de transacciones (modo ASYNC_API)
+Mismas rutas y contratos que transaccion_endpoints, con async def sobre AsyncSession
+"""
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from datetime import date
+from typing import List, Optional
+
+from ...application.dtos.common_dtos import TransaccionCreateDTO, TransaccionResponseDTO, BalanceRequestDTO, BalanceResponseDTO, TransaccionUpdateDTO, ImportacionResponseDTO, TransaccionLoteRequestDTO, TransaccionLoteResponseDTO
+from ...domain.entities.usuario import Usuario
+from ...domain.services.periodo import parse_periodo, periodos_entre
+from ...application.use_cases.transaccion.importar_transacciones import AsyncImportarTransaccionesUseCase, detectar_formato
+from ...application.use_cases.transaccion.lote_transacciones import LoteInvalidoError
+from ...application.use_cases.transaccion.exportar_transacciones import FORMATOS_EXPORTACION, AsyncExportarTransaccionesUseCase
+from .. import responses
+from ..dependencies.async_container import AsyncUseCaseAdapter, get_async_crear_transaccion_use_case, get_async_calcular_balance_use_case, get_async_obtener_transacciones_use_case, get_async_actualizar_transaccion_use_case, get_async_eliminar_transaccion_use_case, get_async_importar_transacciones_use_case, get_async_exportar_transacciones_use_case, get_async_lote_transacciones_use_case
+from ..dependencies.async_auth import get_current_user_async
+from ..dependencies.async_etag import etag_usuario_async
+
+router = APIRouter(prefix="/transacciones", tags=["transacciones"])
+
+# Campos de TransaccionResponseDTO en el orden de las filas del camino rápido
+CAMPOS_TRANSACCION = tuple(TransaccionResponseDTO.model_fields)
+
+
+
+@router.post("/", response_model=TransaccionResponseDTO)
+async def crear_transaccion(
+    request: TransaccionCreateDTO,
+    current_user: Usuario = Depends(get_current_user_async),  # JWT auth
+    crear_transaccion_uc: AsyncUseCaseAdapter = Depends(get_async_crear_transaccion_use_case)
+):
+    """
+    Crear nueva transacción
+    Controller que solo coordina DTO → Use Case → Response
+    """
+    try:
+        # Ejecutar caso de uso
+        transaccion = await crear_transaccion_uc.execute(
+            user_id=current_user.id,
+            tipo=request.tipo,
+            cantidad=request.cantidad,
+            descripcion=request.descripcion,
+            fecha=request.fecha
+        )
+        
+        # Convertir a DTO de respuesta
+        return TransaccionResponseDTO(
+            id=transaccion.id,
+            tipo=transaccion.tipo,
+            cantidad=transaccion.cantidad,
+            fecha=transaccion.fecha,
+            descripcion=transaccion.descripcion,
+            user_id=transaccion.user_id
+        )
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/import", response_model=ImportacionResponseDTO)
+async def importar_transacciones(
+    fichero: UploadFile = File(..., description="CSV con cabecera (tipo,cantidad,descripcion,fecha) o NDJSON"),
+    formato: Optional[str] = Query(None, description="csv | ndjson (por defecto se deduce del fichero)"),
+    current_user: Usuario = Depends(get_current_user_async),  # JWT auth
+    importar_transacciones_uc: AsyncImportarTransaccionesUseCase = Depends(get_async_importar_transacciones_use_case)
+):
+    """
+    Importar transacciones en bloque
+    Valida fila a fila con las reglas de POST /transacciones/ e inserta por lotes;
+    las filas inválidas se informan por línea sin abortar el fichero
+    """
+    try:
+        formato = detectar_formato(formato, fichero.filename, fichero.content_type)
+        return await importar_transacciones_uc.execute(
+            user_id=current_user.id,
+            fichero=fichero.file,
+            formato=formato
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/export")
+async def exportar_transacciones(
+    formato: str = Query("csv", description="csv | ndjson"),
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    desde: Optional[date] = Query(None, description="Fecha inicial (inclusiva)"),
+    hasta: Optional[date] = Query(None, description="Fecha final (exclusiva)"),
+    current_user: Usuario = Depends(get_current_user_async),  # JWT auth
+    exportar_transacciones_uc: AsyncExportarTransaccionesUseCase = Depends(get_async_exportar_transacciones_use_case)
+):
+    """
+    Exportar el histórico de transacciones en streaming
+    Las filas salen de un cursor de servidor por bloques: memoria constante y primer byte inmediato
+    """
+    try:
+        contenido = exportar_transacciones_uc.execute(
+            user_id=current_user.id,
+            formato=formato,
+            mes=mes,
+            anio=anio,
+            desde=desde,
+            hasta=hasta
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return StreamingResponse(
+        contenido,
+        media_type=FORMATOS_EXPORTACION[formato],
+        headers={"Content-Disposition": f'attachment; filename="transacciones.{formato}"'}
+    )
+
+@router.post("/batch", response_model=TransaccionLoteResponseDTO)
+async def aplicar_lote_transacciones(
+    request: TransaccionLoteRequestDTO,
+    current_user: Usuario = Depends(get_current_user_async),  # JWT auth
+    lote_transacciones_uc: AsyncUseCaseAdapter = Depends(get_async_lote_transacciones_use_case)
+):
+    """
+    Aplicar varias operaciones create/update/delete en una sola transacción
+    Se validan todas antes de escribir: si alguna falla no se aplica ninguna (400 con el detalle por operación)
+    """
+    try:
+        resultados = await lote_transacciones_uc.execute(
+            user_id=current_user.id,
+            operaciones=[op.model_dump() for op in request.operaciones]
+        )
+        return TransaccionLoteResponseDTO(resultados=resultados)
+    except LoteInvalidoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"mensaje": str(e), "resultados": e.resultados}
+        )
+
+@router.get("/balance", dependencies=[Depends(etag_usuario_async)])
+async def obtener_balance(
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    current_user: Usuario = Depends(get_current_user_async),
+    calcular_balance_uc: AsyncUseCaseAdapter = Depends(get_async_calcular_balance_use_case)
+):
+    """
+    Obtener balance financiero del usuario
+    """
+    try:
+        # Ejecutar caso de uso
+        balance = await calcular_balance_uc.execute(
+            user_id=current_user.id,
+            mes=mes,
+            anio=anio
+        )
+        
+        return balance
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/balance/periodos", response_model=List[BalanceResponseDTO], dependencies=[Depends(etag_usuario_async)])
+async def obtener_balance_periodos(
+    periodos: Optional[List[str]] = Query(None, description="Lista de periodos YYYY-MM"),
+    desde: Optional[str] = Query(None, description="Periodo inicial YYYY-MM (inclusivo)"),
+    hasta: Optional[str] = Query(None, description="Periodo final YYYY-MM (inclusivo)"),
+    current_user: Usuario = Depends(get_current_user_async),
+    calcular_balance_uc: AsyncUseCaseAdapter = Depends(get_async_calcular_balance_use_case)
+):
+    """
+    Obtener el balance de varios meses a la vez (gráficos, resúmenes anuales)
+    """
+    try:
+        if periodos:
+            lista = [parse_periodo(p) for p in periodos]
+        elif desde and hasta:
+            lista = periodos_entre(parse_periodo(desde), parse_periodo(hasta))
+        else:
+            raise ValueError("Indique 'periodos' o el rango 'desde'/'hasta'")
+        
+        return await calcular_balance_uc.execute_periodos(user_id=current_user.id, periodos=lista)
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/", response_model=List[TransaccionResponseDTO], dependencies=[Depends(etag_usuario_async)])
+async def obtener_transacciones(
+    response: Response,
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    skip: int = Query(0, ge=0, description="Modo offset (clientes existentes)"),
+    limit: int = Query(100, ge=1, le=responses.LISTADO_LIMITE_MAX),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en X-Next-Cursor"),
+    current_user: Usuario = Depends(get_current_user_async),
+    obtener_transacciones_uc: AsyncUseCaseAdapter = Depends(get_async_obtener_transacciones_use_case)
+):
+    """
+    Obtener transacciones del usuario con filtros opcionales
+    Paginación keyset: si hay más filas, la cabecera X-Next-Cursor trae el cursor de la siguiente página
+    """
+    try:
+        if responses.FAST_JSON_RESPONSES:
+            # Camino rápido: tuplas de columnas → JSON (orjson), sin DTOs ni revalidación
+            filas, next_cursor = await obtener_transacciones_uc.obtener_pagina_filas(
+                user_id=current_user.id,
+                mes=mes,
+                anio=anio,
+                skip=skip,
+                limit=limit,
+                cursor=cursor
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return responses.filas_json(CAMPOS_TRANSACCION, filas, response)
+        
+        # Ejecutar caso de uso
+        transacciones, next_cursor = await obtener_transacciones_uc.obtener_pagina(
+            user_id=current_user.id,
+            mes=mes,
+            anio=anio,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        
+        # Convertir a lista de DTOs de respuesta
+        return [
+            TransaccionResponseDTO(
+                id=t.id,
+                tipo=t.tipo,
+                cantidad=t.cantidad,
+                fecha=t.fecha,
+                descripcion=t.descripcion,
+                user_id=t.user_id
+            ) for t in transacciones
+        ]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.put("/{transaccion_id}", response_model=TransaccionResponseDTO)
+async def actualizar_transaccion(
+    transaccion_id: int,
+    request: TransaccionUpdateDTO,
+    current_user: Usuario = Depends(get_current_user_async),  # JWT auth
+    actualizar_transaccion_uc: AsyncUseCaseAdapter = Depends(get_async_actualizar_transaccion_use_case)
+):
+    """
+    Actualizar transacción existente
+    """
+    try:
+        # Ejecutar caso de uso
+        transaccion = await actualizar_transaccion_uc.execute(
+            user_id=current_user.id,
+            transaccion_id=transaccion_id,
+            tipo=request.tipo,
+            cantidad=request.cantidad,
+            descripcion=request.descripcion,
+            fecha=request.fecha
+        )
+
+        return TransaccionResponseDTO(
+            id=transaccion.id,
+            tipo=transaccion.tipo,
+            cantidad=transaccion.cantidad,
+            fecha=transaccion.fecha,
+            descripcion=transaccion.descripcion,
+            user_id=transaccion.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.delete("/{transaccion_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def eliminar_transaccion(
+    transaccion_id: int,
+    current_user: Usuario = Depends(get_current_user_async),  # JWT auth
+    eliminar_transaccion_uc: AsyncUseCaseAdapter = Depends(get_async_eliminar_transaccion_use_case)
+):
+    """
+    Eliminar transacción existente
+    """
+    try:
+        # Ejecutar caso de uso
+        await eliminar_transaccion_uc.execute(
+            user_id=current_user.id,
+            transaccion_id=transaccion_id
+        )
+
+        return {"detail": "Transacción eliminada exitosamente"}
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
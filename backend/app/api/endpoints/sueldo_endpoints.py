@@ -1,11 +1,13 @@
 """
 Endpoints de Sueldos y Balance
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List, Optional
 from ...application.dtos.common_dtos import SueldoCreateDTO, SueldoResponseDTO, BalanceResponseDTO
 from ...domain.entities.usuario import Usuario
+from .. import responses
 from ..dependencies.auth import get_current_user_from_token
+from ..dependencies.etag import etag_usuario
 from ..dependencies.container import (
     get_crear_sueldo_use_case,
     get_obtener_sueldo_use_case,
@@ -16,6 +18,9 @@ from ..dependencies.container import (
 
 router = APIRouter(prefix="/sueldos", tags=["sueldos"])
 
+# Campos de SueldoResponseDTO en el orden de las filas del camino rápido
+CAMPOS_SUELDO = tuple(SueldoResponseDTO.model_fields)
+
 
 @router.post("/", response_model=SueldoResponseDTO)
 def crear_o_actualizar_sueldo(
@@ -37,7 +42,7 @@ def crear_o_actualizar_sueldo(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{anio}/{mes}", response_model=SueldoResponseDTO)
+@router.get("/{anio}/{mes}", response_model=SueldoResponseDTO, dependencies=[Depends(etag_usuario)])
 def obtener_sueldo_mes(
     anio: int,
     mes: int,
@@ -57,8 +62,9 @@ def obtener_sueldo_mes(
         user_id=sueldo.user_id
     )
 
-@router.get("/", response_model=List[SueldoResponseDTO])
+@router.get("/", response_model=List[SueldoResponseDTO], dependencies=[Depends(etag_usuario)])
 def obtener_sueldos(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     current_user: Usuario = Depends(get_current_user_from_token),
@@ -66,6 +72,12 @@ def obtener_sueldos(
 ):
     """Obtener todos los sueldos del usuario"""
     sueldos = obtener_sueldos_uc.execute(user_id=current_user.id, skip=skip, limit=limit)
+    if responses.FAST_JSON_RESPONSES:
+        return responses.filas_json(
+            CAMPOS_SUELDO,
+            ((s.id, s.cantidad, s.mes, s.anio, s.fecha, s.user_id) for s in sueldos),
+            response
+        )
     return [
         SueldoResponseDTO(
             id=s.id,
@@ -77,7 +89,7 @@ def obtener_sueldos(
         ) for s in sueldos
     ]
 
-@router.get("/balance", response_model=BalanceResponseDTO)
+@router.get("/balance", response_model=BalanceResponseDTO, dependencies=[Depends(etag_usuario)])
 def obtener_saldo_total(
     mes: Optional[int] = None,
     anio: Optional[int] = None,
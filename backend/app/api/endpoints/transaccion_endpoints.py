@@ -2,21 +2,32 @@
 Transaccion Controller - Endpoints de transacciones
 Solo coordinan entre DTOs y Use Cases
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from datetime import date
 from typing import List, Optional
 
-from ...application.dtos.common_dtos import TransaccionCreateDTO, TransaccionResponseDTO, BalanceRequestDTO, TransaccionUpdateDTO
+from ...application.dtos.common_dtos import TransaccionCreateDTO, TransaccionResponseDTO, BalanceRequestDTO, BalanceResponseDTO, TransaccionUpdateDTO, ImportacionResponseDTO, TransaccionLoteRequestDTO, TransaccionLoteResponseDTO
 from ...application.use_cases.transaccion.crear_transaccion import CrearTransaccionUseCase
 from ...application.use_cases.balance.calcular_balance import CalcularBalanceUseCase
 from ...application.use_cases.transaccion.obtener_transacciones import ObtenerTransaccionesUseCase
 from ...application.use_cases.transaccion.actualizar_transaccion import ActualizarTransaccionUseCase
 from ...application.use_cases.transaccion.eliminar_transaccion import EliminarTransaccionUseCase
+from ...application.use_cases.transaccion.importar_transacciones import ImportarTransaccionesUseCase, detectar_formato
+from ...application.use_cases.transaccion.exportar_transacciones import ExportarTransaccionesUseCase, FORMATOS_EXPORTACION
+from ...application.use_cases.transaccion.lote_transacciones import LoteTransaccionesUseCase, LoteInvalidoError
 from ...domain.entities.usuario import Usuario
-from ..dependencies.container import get_crear_transaccion_use_case, get_calcular_balance_use_case, get_obtener_transacciones_use_case, get_actualizar_transaccion_use_case, get_eliminar_transaccion_use_case
+from ...domain.services.periodo import parse_periodo, periodos_entre
+from .. import responses
+from ..dependencies.container import get_crear_transaccion_use_case, get_calcular_balance_use_case, get_obtener_transacciones_use_case, get_actualizar_transaccion_use_case, get_eliminar_transaccion_use_case, get_importar_transacciones_use_case, get_exportar_transacciones_use_case, get_lote_transacciones_use_case
 from ..dependencies.auth import get_current_user_from_token
+from ..dependencies.etag import etag_usuario
 
 router = APIRouter(prefix="/transacciones", tags=["transacciones"])
 
+# Campos de TransaccionResponseDTO en el orden de las filas del camino rápido
+CAMPOS_TRANSACCION = tuple(TransaccionResponseDTO.model_fields)
+
 
 
 @router.post("/", response_model=TransaccionResponseDTO)
@@ -56,7 +67,88 @@ def crear_transaccion(
         )
 
 
-@router.get("/balance")
+@router.post("/import", response_model=ImportacionResponseDTO)
+def importar_transacciones(
+    fichero: UploadFile = File(..., description="CSV con cabecera (tipo,cantidad,descripcion,fecha) o NDJSON"),
+    formato: Optional[str] = Query(None, description="csv | ndjson (por defecto se deduce del fichero)"),
+    current_user: Usuario = Depends(get_current_user_from_token),  # JWT auth
+    importar_transacciones_uc: ImportarTransaccionesUseCase = Depends(get_importar_transacciones_use_case)
+):
+    """
+    Importar transacciones en bloque
+    Valida fila a fila con las reglas de POST /transacciones/ e inserta por lotes;
+    las filas inválidas se informan por línea sin abortar el fichero
+    """
+    try:
+        formato = detectar_formato(formato, fichero.filename, fichero.content_type)
+        return importar_transacciones_uc.execute(
+            user_id=current_user.id,
+            fichero=fichero.file,
+            formato=formato
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/export")
+def exportar_transacciones(
+    formato: str = Query("csv", description="csv | ndjson"),
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    desde: Optional[date] = Query(None, description="Fecha inicial (inclusiva)"),
+    hasta: Optional[date] = Query(None, description="Fecha final (exclusiva)"),
+    current_user: Usuario = Depends(get_current_user_from_token),  # JWT auth
+    exportar_transacciones_uc: ExportarTransaccionesUseCase = Depends(get_exportar_transacciones_use_case)
+):
+    """
+    Exportar el histórico de transacciones en streaming
+    Las filas salen de un cursor de servidor por bloques: memoria constante y primer byte inmediato
+    """
+    try:
+        contenido = exportar_transacciones_uc.execute(
+            user_id=current_user.id,
+            formato=formato,
+            mes=mes,
+            anio=anio,
+            desde=desde,
+            hasta=hasta
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return StreamingResponse(
+        contenido,
+        media_type=FORMATOS_EXPORTACION[formato],
+        headers={"Content-Disposition": f'attachment; filename="transacciones.{formato}"'}
+    )
+
+@router.post("/batch", response_model=TransaccionLoteResponseDTO)
+def aplicar_lote_transacciones(
+    request: TransaccionLoteRequestDTO,
+    current_user: Usuario = Depends(get_current_user_from_token),  # JWT auth
+    lote_transacciones_uc: LoteTransaccionesUseCase = Depends(get_lote_transacciones_use_case)
+):
+    """
+    Aplicar varias operaciones create/update/delete en una sola transacción
+    Se validan todas antes de escribir: si alguna falla no se aplica ninguna (400 con el detalle por operación)
+    """
+    try:
+        resultados = lote_transacciones_uc.execute(
+            user_id=current_user.id,
+            operaciones=[op.model_dump() for op in request.operaciones]
+        )
+        return TransaccionLoteResponseDTO(resultados=resultados)
+    except LoteInvalidoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"mensaje": str(e), "resultados": e.resultados}
+        )
+
+@router.get("/balance", dependencies=[Depends(etag_usuario)])
 def obtener_balance(
     mes: Optional[int] = None,
     anio: Optional[int] = None,
@@ -82,23 +174,74 @@ def obtener_balance(
             detail=str(e)
         )
 
-@router.get("/", response_model=List[TransaccionResponseDTO])
+@router.get("/balance/periodos", response_model=List[BalanceResponseDTO], dependencies=[Depends(etag_usuario)])
+def obtener_balance_periodos(
+    periodos: Optional[List[str]] = Query(None, description="Lista de periodos YYYY-MM"),
+    desde: Optional[str] = Query(None, description="Periodo inicial YYYY-MM (inclusivo)"),
+    hasta: Optional[str] = Query(None, description="Periodo final YYYY-MM (inclusivo)"),
+    current_user: Usuario = Depends(get_current_user_from_token),
+    calcular_balance_uc: CalcularBalanceUseCase = Depends(get_calcular_balance_use_case)
+):
+    """
+    Obtener el balance de varios meses a la vez (gráficos, resúmenes anuales)
+    """
+    try:
+        if periodos:
+            lista = [parse_periodo(p) for p in periodos]
+        elif desde and hasta:
+            lista = periodos_entre(parse_periodo(desde), parse_periodo(hasta))
+        else:
+            raise ValueError("Indique 'periodos' o el rango 'desde'/'hasta'")
+        
+        return calcular_balance_uc.execute_periodos(user_id=current_user.id, periodos=lista)
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/", response_model=List[TransaccionResponseDTO], dependencies=[Depends(etag_usuario)])
 def obtener_transacciones(
+    response: Response,
     mes: Optional[int] = None,
     anio: Optional[int] = None,
+    skip: int = Query(0, ge=0, description="Modo offset (clientes existentes)"),
+    limit: int = Query(100, ge=1, le=responses.LISTADO_LIMITE_MAX),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en X-Next-Cursor"),
     current_user: Usuario = Depends(get_current_user_from_token),
     obtener_transacciones_uc: ObtenerTransaccionesUseCase = Depends(get_obtener_transacciones_use_case)
 ):
     """
     Obtener transacciones del usuario con filtros opcionales
+    Paginación keyset: si hay más filas, la cabecera X-Next-Cursor trae el cursor de la siguiente página
     """
     try:
+        if responses.FAST_JSON_RESPONSES:
+            # Camino rápido: tuplas de columnas → JSON (orjson), sin DTOs ni revalidación
+            filas, next_cursor = obtener_transacciones_uc.obtener_pagina_filas(
+                user_id=current_user.id,
+                mes=mes,
+                anio=anio,
+                skip=skip,
+                limit=limit,
+                cursor=cursor
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return responses.filas_json(CAMPOS_TRANSACCION, filas, response)
+        
         # Ejecutar caso de uso
-        transacciones = obtener_transacciones_uc.execute(
+        transacciones, next_cursor = obtener_transacciones_uc.obtener_pagina(
             user_id=current_user.id,
             mes=mes,
-            anio=anio
+            anio=anio,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
         # Convertir a lista de DTOs de respuesta
         return [
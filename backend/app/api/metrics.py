@@ -0,0 +1,141 @@
+"""
+Métricas HTTP: middleware ASGI y endpoint /metrics (formato de texto de Prometheus)
+Por ruta (plantilla, no la URL concreta): peticiones por código de estado, latencia,
+y consultas / tiempo en BD de cada petición (acumulados por los hooks de metrics.sql)
+
+/metrics no es público: responde al scraper con `Authorization: Bearer <METRICS_TOKEN>`
+o a las direcciones de METRICS_ALLOW_IPS (por defecto solo loopback); al resto, 404
+"""
+import hmac
+import ipaddress
+import os
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+
+from ..infrastructure.metrics.registro import BUCKETS_CONSULTAS, BUCKETS_LATENCIA, METRICS_MULTIPROC_DIR, registro
+from ..infrastructure.metrics.multiproceso import exponer_agregado
+from ..infrastructure.metrics.sql import finalizar_peticion, iniciar_peticion
+from ..infrastructure.metrics.profiler import perfilador
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN") or None
+METRICS_ALLOW_IPS = tuple(
+    ipaddress.ip_network(red.strip(), strict=False)
+    for red in os.getenv("METRICS_ALLOW_IPS", "127.0.0.1/32,::1/128").split(",") if red.strip()
+)
+
+# Peticiones que no casan con ninguna ruta: una sola etiqueta (evita cardinalidad ilimitada)
+RUTA_DESCONOCIDA = "sin_ruta"
+
+PETICIONES = registro.contador("http_requests_total", "Peticiones HTTP atendidas", ("method", "route", "status"))
+LATENCIA = registro.histograma("http_request_duration_seconds", "Latencia de las peticiones HTTP", ("method", "route"), BUCKETS_LATENCIA)
+CONSULTAS = registro.histograma("http_request_db_queries", "Sentencias SQL por petición HTTP", ("method", "route"), BUCKETS_CONSULTAS)
+TIEMPO_DB = registro.histograma("http_request_db_seconds", "Tiempo en BD por petición HTTP", ("method", "route"), BUCKETS_LATENCIA)
+EN_CURSO = registro.gauge("http_requests_in_progress", "Peticiones HTTP en curso")
+EVENTOS = registro.contador("domain_events_total", "Eventos de dominio publicados tras commit", ("tipo",))
+
+
+def contar_evento(evento):
+    """Suscriptor síncrono del bus de eventos (ver main.py)"""
+    EVENTOS.inc(type(evento).__name__)
+
+
+def plantilla_ruta(scope) -> str:
+    """Plantilla de la ruta resuelta por el router (p. ej. /transacciones/{transaccion_id})"""
+    ruta = scope.get("route")
+    return getattr(ruta, "path", None) or RUTA_DESCONOCIDA
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI puro (no BaseHTTPMiddleware): el contexto de la petición llega
+    intacto al threadpool y la duración incluye el envío de respuestas en streaming
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        estado = {"status": 500}  # si la app lanza una excepción, ServerErrorMiddleware responde 500
+
+        async def send_con_estado(mensaje):
+            if mensaje["type"] == "http.response.start":
+                estado["status"] = mensaje["status"]
+            await send(mensaje)
+
+        token = iniciar_peticion()
+        EN_CURSO.inc()
+        inicio = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_con_estado)
+        finally:
+            duracion = time.perf_counter() - inicio
+            EN_CURSO.dec()
+            estadisticas = finalizar_peticion(token)
+            metodo, ruta = scope["method"], plantilla_ruta(scope)
+            PETICIONES.inc(metodo, ruta, str(estado["status"]))
+            LATENCIA.observe(duracion, metodo, ruta)
+            CONSULTAS.observe(estadisticas.consultas, metodo, ruta)
+            TIEMPO_DB.observe(estadisticas.segundos, metodo, ruta)
+
+
+class SQLProfilerMiddleware:
+    """
+    Perfil SQL por petición (SQL_PROFILE=true): sentencias lentas, N+1 y resumen JSONL
+    Ver infrastructure/metrics/profiler.py
+    """
+
+    def __init__(self, app, perfilador=perfilador):
+        self.app = app
+        self.perfilador = perfilador
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        estado = {"status": 500}
+
+        async def send_con_estado(mensaje):
+            if mensaje["type"] == "http.response.start":
+                estado["status"] = mensaje["status"]
+            await send(mensaje)
+
+        token = self.perfilador.iniciar_peticion(scope)
+        try:
+            await self.app(scope, receive, send_con_estado)
+        finally:
+            self.perfilador.finalizar_peticion(token, estado["status"])
+
+
+def _direccion_permitida(host: str) -> bool:
+    try:
+        direccion = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(direccion in red for red in METRICS_ALLOW_IPS)
+
+
+def autorizar_scrape(request: Request):
+    """Token del scraper o dirección permitida; 404 (no 401) para no anunciar el endpoint"""
+    if METRICS_TOKEN:
+        esquema, _, credencial = request.headers.get("authorization", "").partition(" ")
+        if esquema.lower() == "bearer" and hmac.compare_digest(credencial.encode(), METRICS_TOKEN.encode()):
+            return
+    if request.client is not None and _direccion_permitida(request.client.host):
+        return
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+router = APIRouter(tags=["Métricas"])
+
+
+@router.get("/metrics", include_in_schema=False, dependencies=[Depends(autorizar_scrape)])
+def metrics():
+    """Exposición para el scraper de Prometheus (con varios workers, la suma de todos)"""
+    texto = exponer_agregado(METRICS_MULTIPROC_DIR) if METRICS_MULTIPROC_DIR else registro.exponer()
+    return Response(texto, media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,37 @@
+"""
+Respuestas JSON rápidas para los endpoints de listado
+Serializan filas ligeras (tuplas de columnas) directamente a bytes con orjson, sin construir
+un DTO por fila ni revalidar contra response_model (que se mantiene para el esquema OpenAPI)
+"""
+import os
+from typing import Iterable, Sequence
+import orjson
+from fastapi import Response
+
+# Desactivable para comparar con el camino DTO + validación (benchmarks/bench_listados.py)
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() in ("1", "true", "yes")
+
+# Máximo de filas por página en los listados (?limit=); se lee al importar los routers
+LISTADO_LIMITE_MAX = int(os.getenv("LISTADO_LIMITE_MAX", "1000"))
+
+# Cabeceras que recalcula la respuesta final
+_CABECERAS_PROPIAS = ("content-length", "content-type")
+
+
+class ORJSONResponse(Response):
+    """JSON con orjson (datetime en ISO 8601, igual que el encoder de FastAPI)"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def filas_json(campos: Sequence[str], filas: Iterable[tuple], response: Response = None) -> ORJSONResponse:
+    """
+    Lista de objetos JSON a partir de filas en el orden de `campos`
+    Conserva las cabeceras fijadas en el Response inyectado (ETag, X-Next-Cursor...)
+    """
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k not in _CABECERAS_PROPIAS}
+    return ORJSONResponse([dict(zip(campos, fila)) for fila in filas], headers=headers)
@@ -2,15 +2,17 @@
 DTOs - Data Transfer Objects
 Objetos para transferir datos entre capas de la aplicación
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import List, Optional
 # ========== BALANCE RESPONSE DTO ==========
 class BalanceResponseDTO(BaseModel):
     saldo_total: float
     saldo_transacciones: float
     saldo_sueldo: float
-    mes: int
-    anio: int
-from typing import Optional
+    ingresos: float = 0.0
+    gastos: float = 0.0
+    mes: Optional[int] = None
+    anio: Optional[int] = None
 from datetime import datetime
 from enum import Enum
 
@@ -125,11 +127,66 @@ class SueldoResponseDTO(BaseModel):
     user_id: int
 
 
+class ImportacionErrorDTO(BaseModel):
+    """Fila rechazada en una importación"""
+    linea: int
+    error: str
+
+
+class ImportacionResponseDTO(BaseModel):
+    """DTO de respuesta para importación de transacciones"""
+    importadas: int
+    rechazadas: int
+    errores: List[ImportacionErrorDTO] = []
+    errores_truncados: bool = False
+
+
 class TokenResponseDTO(BaseModel):
     """DTO de respuesta para token JWT"""
     access_token: str
     token_type: str
 
+# ========== BATCH DTOs ==========
+
+class OperacionLote(str, Enum):
+    """Operaciones admitidas en POST /transacciones/batch"""
+    CREAR = "create"
+    ACTUALIZAR = "update"
+    ELIMINAR = "delete"
+
+
+class TransaccionOperacionDTO(BaseModel):
+    """Una operación del lote: create (sin id), update / delete (con id)"""
+    model_config = ConfigDict(use_enum_values=True)
+    
+    op: OperacionLote
+    id: Optional[int] = None
+    tipo: Optional[TipoTransaccion] = None
+    cantidad: Optional[float] = Field(default=None, gt=0)
+    descripcion: Optional[str] = None
+    fecha: Optional[datetime] = None
+
+
+class TransaccionLoteRequestDTO(BaseModel):
+    """DTO para aplicar varias operaciones en una sola transacción"""
+    operaciones: List[TransaccionOperacionDTO] = Field(min_length=1, max_length=1000)
+
+
+class TransaccionOperacionResultadoDTO(BaseModel):
+    """Resultado de una operación del lote (en el mismo orden que la petición)"""
+    indice: int
+    op: OperacionLote
+    ok: bool
+    id: Optional[int] = None
+    transaccion: Optional[TransaccionResponseDTO] = None
+    error: Optional[str] = None
+
+
+class TransaccionLoteResponseDTO(BaseModel):
+    """DTO de respuesta para el lote"""
+    resultados: List[TransaccionOperacionResultadoDTO]
+
+
 # ========== UPDATE DTOs ==========
 
 class TransaccionUpdateDTO(BaseModel):
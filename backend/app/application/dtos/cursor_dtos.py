@@ -0,0 +1,36 @@
+"""
+Cursor opaco para paginación keyset
+Codifica la última posición (fecha, id) vista por el cliente
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+
+
+class CursorTransaccion:
+    """Posición (fecha, id) dentro del orden fecha DESC, id DESC"""
+
+    def __init__(self, fecha: datetime, id: int):
+        self.fecha = fecha
+        self.id = id
+
+    def encode(self) -> str:
+        """Serializar a un token base64 url-safe (sin padding)"""
+        payload = json.dumps({"f": self.fecha.isoformat(), "i": self.id}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "CursorTransaccion":
+        """Deserializar un token; cualquier manipulación se reporta como ValueError"""
+        try:
+            padding = "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(token + padding))
+            return cls(fecha=datetime.fromisoformat(data["f"]), id=int(data["i"]))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            raise ValueError("Cursor inválido")
+
+    @classmethod
+    def desde_transaccion(cls, transaccion) -> "CursorTransaccion":
+        """Cursor que apunta justo después de la transacción dada"""
+        return cls(fecha=transaccion.fecha, id=transaccion.id)
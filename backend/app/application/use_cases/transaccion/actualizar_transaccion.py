@@ -3,12 +3,16 @@ Caso de uso: Actualizar transacción
 """
 
 from app.infrastructure.database.models import TransaccionORM
-from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.database.resumen_repository import SQLResumenMensualRepository
+from app.infrastructure.database.version_repository import SQLVersionUsuarioRepository
+from app.infrastructure.database.eventos import registrar_evento
+from app.domain.services.eventos import TransaccionModificada
 from datetime import datetime
 
 class ActualizarTransaccionUseCase:
-	def __init__(self, db_session=None):
-		self.db = db_session or SessionLocal()
+	def __init__(self, db_session):
+		# Sesión del request (get_db): su ciclo de vida lo gestiona la capa API
+		self.db = db_session
 
 	def execute(self, user_id: int, transaccion_id: int,
 	           tipo: str | None = None,
@@ -18,6 +22,7 @@ class ActualizarTransaccionUseCase:
 		transaccion = self.db.query(TransaccionORM).filter(TransaccionORM.id == transaccion_id, TransaccionORM.user_id == user_id).first()
 		if not transaccion:
 			raise ValueError("Transacción no encontrada")
+		anterior = (transaccion.fecha, transaccion.tipo, transaccion.cantidad)
 		# Solo actualizar campos provistos (evitar escribir None en NOT NULL)
 		if tipo is not None:
 			transaccion.tipo = tipo
@@ -29,6 +34,11 @@ class ActualizarTransaccionUseCase:
 		# fecha si se proporciona
 		if fecha is not None:
 			transaccion.fecha = fecha
+		# Rollup: si cambia la fecha de mes se ajustan ambas filas
+		nueva = (transaccion.fecha, transaccion.tipo, transaccion.cantidad)
+		SQLResumenMensualRepository(self.db).mover_transaccion(user_id, anterior, nueva)
+		SQLVersionUsuarioRepository(self.db).incrementar(user_id)
+		registrar_evento(self.db, TransaccionModificada(user_id, transaccion.id, anterior, nueva))
 		self.db.commit()
 		self.db.refresh(transaccion)
 		return transaccion
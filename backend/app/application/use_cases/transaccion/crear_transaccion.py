@@ -1,12 +1,16 @@
 # Caso de uso básico para crear transacción
 from app.infrastructure.database.models import TransaccionORM
-from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.database.resumen_repository import SQLResumenMensualRepository
+from app.infrastructure.database.version_repository import SQLVersionUsuarioRepository
+from app.infrastructure.database.eventos import registrar_evento
+from app.domain.services.eventos import TransaccionCreada
 from fastapi import HTTPException, status
 from datetime import datetime
 
 class CrearTransaccionUseCase:
-    def __init__(self, db_session=None):
-        self.db = db_session or SessionLocal()
+    def __init__(self, db_session):
+        # Sesión del request (get_db): su ciclo de vida lo gestiona la capa API
+        self.db = db_session
 
     def execute(self, user_id: int, tipo: str, cantidad: float, descripcion: str = None, fecha: str = None) -> TransaccionORM:
         """
@@ -43,11 +47,21 @@ class CrearTransaccionUseCase:
                     )
             
             self.db.add(nueva_transaccion)
+            # flush para que la fecha por defecto quede asignada antes de actualizar el rollup
+            self.db.flush()
+            SQLResumenMensualRepository(self.db).aplicar_transaccion(
+                user_id, nueva_transaccion.fecha, nueva_transaccion.tipo, nueva_transaccion.cantidad
+            )
+            SQLVersionUsuarioRepository(self.db).incrementar(user_id)
+            registrar_evento(self.db, TransaccionCreada(
+                user_id, nueva_transaccion.id, nueva_transaccion.fecha, nueva_transaccion.tipo, nueva_transaccion.cantidad
+            ))
             self.db.commit()
             self.db.refresh(nueva_transaccion)
             return nueva_transaccion
             
         except Exception as e:
+            self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error al crear la transacción: {str(e)}"
@@ -1,15 +1,26 @@
 # Caso de uso básico para eliminar transacción
 from app.infrastructure.database.models import TransaccionORM
-from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.database.resumen_repository import SQLResumenMensualRepository
+from app.infrastructure.database.version_repository import SQLVersionUsuarioRepository
+from app.infrastructure.database.eventos import registrar_evento
+from app.domain.services.eventos import TransaccionEliminada
 
 class EliminarTransaccionUseCase:
-	def __init__(self, db_session=None):
-		self.db = db_session or SessionLocal()
+	def __init__(self, db_session):
+		# Sesión del request (get_db): su ciclo de vida lo gestiona la capa API
+		self.db = db_session
 
 	def execute(self, user_id: int, transaccion_id: int):
 		transaccion = self.db.query(TransaccionORM).filter(TransaccionORM.id == transaccion_id, TransaccionORM.user_id == user_id).first()
 		if not transaccion:
 			raise ValueError("Transacción no encontrada")
+		SQLResumenMensualRepository(self.db).aplicar_transaccion(
+			user_id, transaccion.fecha, transaccion.tipo, transaccion.cantidad, signo=-1
+		)
+		SQLVersionUsuarioRepository(self.db).incrementar(user_id)
+		registrar_evento(self.db, TransaccionEliminada(
+			user_id, transaccion.id, transaccion.fecha, transaccion.tipo, transaccion.cantidad
+		))
 		self.db.delete(transaccion)
 		self.db.commit()
 		return transaccion
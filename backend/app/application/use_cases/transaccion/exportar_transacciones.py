@@ -0,0 +1,96 @@
+# Caso de uso para exportar el histórico de transacciones (CSV / NDJSON) en streaming
+
+import csv
+import io
+import json
+from typing import AsyncIterator, Iterator
+from sqlalchemy import select
+from app.infrastructure.database.models import TransaccionORM
+from app.infrastructure.database.filtros import filtro_periodo
+from app.infrastructure.config.replica import lectura, lectura_async
+
+FORMATOS_EXPORTACION = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+COLUMNAS = ("id", "tipo", "cantidad", "fecha", "descripcion")
+
+
+def _consulta(user_id: int, mes: int = None, anio: int = None, desde=None, hasta=None):
+    """Solo las columnas exportadas (sin entidades ORM), en orden cronológico"""
+    return (
+        select(TransaccionORM.id, TransaccionORM.tipo, TransaccionORM.cantidad, TransaccionORM.fecha, TransaccionORM.descripcion)
+        .where(TransaccionORM.user_id == user_id, *filtro_periodo(TransaccionORM.fecha, mes, anio, desde, hasta))
+        .order_by(TransaccionORM.fecha, TransaccionORM.id)
+    )
+
+
+class _Serializador:
+    """Convierte bloques de filas en trozos de texto del formato pedido"""
+
+    def __init__(self, formato: str):
+        if formato not in FORMATOS_EXPORTACION:
+            raise ValueError(f"Formato no soportado: {formato}. Use csv o ndjson")
+        self.formato = formato
+
+    def cabecera(self) -> str:
+        return ",".join(COLUMNAS) + "\r\n" if self.formato == "csv" else ""
+
+    def bloque(self, filas) -> str:
+        if self.formato == "ndjson":
+            return "".join(
+                json.dumps({"id": f.id, "tipo": f.tipo, "cantidad": f.cantidad, "fecha": f.fecha.isoformat(), "descripcion": f.descripcion}, ensure_ascii=False) + "\n"
+                for f in filas
+            )
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer)
+        for f in filas:
+            escritor.writerow((f.id, f.tipo, f.cantidad, f.fecha.isoformat(), f.descripcion))
+        return buffer.getvalue()
+
+
+class ExportarTransaccionesUseCase:
+    # Filas por fetch del cursor de servidor y por trozo enviado al cliente
+    TAMANO_BLOQUE = 1000
+
+    def __init__(self, session_factory):
+        # La respuesta se envía después de que termine el request: el generador
+        # abre su propia sesión y la cierra al acabar (o si el cliente corta)
+        self.session_factory = session_factory
+
+    def execute(self, user_id: int, formato: str = "csv", mes: int = None, anio: int = None, desde=None, hasta=None) -> Iterator[str]:
+        """Valida los parámetros ya y devuelve el generador de trozos (memoria constante)"""
+        serializador = _Serializador(formato)
+        stmt = _consulta(user_id, mes, anio, desde, hasta).execution_options(yield_per=self.TAMANO_BLOQUE)
+        return self._generar(user_id, stmt, serializador)
+
+    def _generar(self, user_id: int, stmt, serializador: _Serializador) -> Iterator[str]:
+        # Primer byte sin esperar a la base de datos
+        yield serializador.cabecera()
+        db = self.session_factory()
+        try:
+            # yield_per activa stream_results: cursor de servidor en PostgreSQL
+            # Lectura larga: a la réplica si está configurada (salvo read-your-writes)
+            with lectura(db, user_id):
+                resultado = db.execute(stmt)
+                for filas in resultado.partitions():
+                    yield serializador.bloque(filas)
+        finally:
+            db.close()
+
+
+class AsyncExportarTransaccionesUseCase(ExportarTransaccionesUseCase):
+    """Variante asíncrona (ASYNC_API): AsyncSession.stream sobre el mismo cursor de servidor"""
+
+    def execute(self, user_id: int, formato: str = "csv", mes: int = None, anio: int = None, desde=None, hasta=None) -> AsyncIterator[str]:
+        serializador = _Serializador(formato)
+        stmt = _consulta(user_id, mes, anio, desde, hasta).execution_options(yield_per=self.TAMANO_BLOQUE)
+        return self._generar(user_id, stmt, serializador)
+
+    async def _generar(self, user_id: int, stmt, serializador: _Serializador) -> AsyncIterator[str]:
+        yield serializador.cabecera()
+        async with self.session_factory() as db:
+            async with lectura_async(db, user_id):
+                resultado = await db.stream(stmt)
+                async for filas in resultado.partitions():
+                    yield serializador.bloque(filas)
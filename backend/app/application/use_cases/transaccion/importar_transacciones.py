@@ -0,0 +1,167 @@
+# Caso de uso para importar transacciones en bloque (CSV / NDJSON)
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+import anyio
+from pydantic import ValidationError
+from app.application.dtos.common_dtos import TransaccionCreateDTO
+from app.domain.entities.transaccion import Transaccion
+from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+
+FORMATOS = ("csv", "ndjson")
+
+
+def detectar_formato(formato: Optional[str], nombre: Optional[str], content_type: Optional[str]) -> str:
+    """Formato explícito, o deducido de la extensión / content type del fichero"""
+    if formato:
+        formato = formato.lower()
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {formato}. Use csv o ndjson")
+        return formato
+    nombre = (nombre or "").lower()
+    content_type = (content_type or "").lower()
+    if nombre.endswith(".csv") or "csv" in content_type:
+        return "csv"
+    if nombre.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type or "jsonl" in content_type:
+        return "ndjson"
+    raise ValueError("No se pudo deducir el formato: indique formato=csv o formato=ndjson")
+
+
+def leer_filas(fichero: BinaryIO, formato: str) -> Iterator[Tuple[int, object]]:
+    """
+    Genera (nº de línea, fila) leyendo el fichero de forma incremental
+    Las líneas de NDJSON que no son JSON válido se devuelven como la excepción de parseo
+    """
+    texto = io.TextIOWrapper(fichero, encoding="utf-8-sig", newline="")
+    try:
+        if formato == "csv":
+            lector = csv.DictReader(texto)
+            if not lector.fieldnames:
+                return
+            for fila in lector:
+                yield lector.line_num, {k: v for k, v in fila.items() if k and v not in (None, "")}
+        else:
+            for numero, linea in enumerate(texto, 1):
+                if not linea.strip():
+                    continue
+                try:
+                    yield numero, json.loads(linea)
+                except ValueError as e:
+                    yield numero, e
+    finally:
+        # No cerrar el fichero subyacente: es del request
+        texto.detach()
+
+
+def _mensaje_validacion(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc']) or 'fila'}: {e['msg']}" for e in error.errors())
+
+
+def _resumen_vacio() -> dict:
+    return {"importadas": 0, "rechazadas": 0, "errores": []}
+
+
+def _respuesta(resumen: dict) -> dict:
+    return {**resumen, "errores_truncados": resumen["rechazadas"] > len(resumen["errores"])}
+
+
+def _guardar_lote(sesion, lote: List[Transaccion]) -> int:
+    return SQLTransaccionRepository(sesion).save_many(lote)
+
+
+class ImportarTransaccionesUseCase:
+    # Filas por INSERT/COPY: acota memoria y round trips
+    TAMANO_LOTE = 1000
+    # Errores devueltos en el detalle (el total siempre se cuenta)
+    MAX_ERRORES = 100
+
+    def __init__(self, db_session):
+        # Sesión del request (get_db): su ciclo de vida lo gestiona la capa API
+        self.db = db_session
+        self.transaccion_repository = SQLTransaccionRepository(self.db)
+
+    def execute(self, user_id: int, fichero: BinaryIO, formato: str) -> dict:
+        """
+        Importa las filas válidas y devuelve el resumen con los errores por línea
+        Las filas inválidas no abortan el fichero; todo se confirma en una sola transacción
+        """
+        resumen = _resumen_vacio()
+        try:
+            for lote in self._lotes(user_id, fichero, formato, resumen):
+                resumen["importadas"] += self.transaccion_repository.save_many(lote)
+            self.db.commit()
+        except UnicodeDecodeError:
+            self.db.rollback()
+            raise ValueError("El fichero debe estar codificado en UTF-8")
+        except Exception:
+            self.db.rollback()
+            raise
+        return _respuesta(resumen)
+
+    def _lotes(self, user_id: int, fichero: BinaryIO, formato: str, resumen: dict) -> Iterator[List[Transaccion]]:
+        """Filas válidas en lotes de TAMANO_LOTE; las inválidas se cuentan en `resumen`"""
+        lote = []
+        for linea, fila in leer_filas(fichero, formato):
+            try:
+                lote.append(self._validar(user_id, fila))
+            except ValueError as e:
+                resumen["rechazadas"] += 1
+                if len(resumen["errores"]) < self.MAX_ERRORES:
+                    mensaje = _mensaje_validacion(e) if isinstance(e, ValidationError) else str(e)
+                    resumen["errores"].append({"linea": linea, "error": mensaje})
+                continue
+            if len(lote) >= self.TAMANO_LOTE:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+    def _validar(self, user_id: int, fila) -> Transaccion:
+        """Mismas reglas que POST /transacciones/ (TransaccionCreateDTO + fecha YYYY-MM-DD)"""
+        if isinstance(fila, Exception):
+            raise ValueError(f"JSON inválido: {fila}")
+        if not isinstance(fila, dict):
+            raise ValueError("Cada línea debe ser un objeto JSON")
+        dto = TransaccionCreateDTO.model_validate(fila)
+        fecha = None
+        if dto.fecha:
+            try:
+                fecha = datetime.strptime(dto.fecha, '%Y-%m-%d')
+            except ValueError:
+                raise ValueError("Formato de fecha inválido. Use YYYY-MM-DD")
+        return Transaccion(
+            tipo=dto.tipo.value,
+            cantidad=dto.cantidad,
+            user_id=user_id,
+            fecha=fecha,
+            descripcion=dto.descripcion
+        )
+
+
+class AsyncImportarTransaccionesUseCase(ImportarTransaccionesUseCase):
+    """
+    Variante asíncrona (ASYNC_API) sobre AsyncSession
+    Lectura, parseo y validación de cada lote en el threadpool (no bloquean el event loop);
+    solo los INSERT del lote pasan por AsyncSession.run_sync
+    """
+
+    def __init__(self, db_session):
+        self.db = db_session
+
+    async def execute(self, user_id: int, fichero: BinaryIO, formato: str) -> dict:
+        resumen = _resumen_vacio()
+        lotes = self._lotes(user_id, fichero, formato, resumen)
+        try:
+            while (lote := await anyio.to_thread.run_sync(next, lotes, None)) is not None:
+                resumen["importadas"] += await self.db.run_sync(_guardar_lote, lote)
+            await self.db.commit()
+        except UnicodeDecodeError:
+            await self.db.rollback()
+            raise ValueError("El fichero debe estar codificado en UTF-8")
+        except Exception:
+            await self.db.rollback()
+            raise
+        return _respuesta(resumen)
\ No newline at end of file
@@ -0,0 +1,150 @@
+# Caso de uso para aplicar un lote de create/update/delete en una sola transacción
+
+from datetime import datetime
+from typing import List
+from sqlalchemy import select, insert, update, delete
+from app.infrastructure.database.models import TransaccionORM
+from app.infrastructure.database.resumen_repository import SQLResumenMensualRepository
+from app.infrastructure.database.version_repository import SQLVersionUsuarioRepository
+from app.infrastructure.database.eventos import registrar_evento
+from app.domain.services.eventos import TransaccionCreada, TransaccionEliminada, TransaccionModificada
+
+COLUMNAS = (TransaccionORM.id, TransaccionORM.tipo, TransaccionORM.cantidad, TransaccionORM.fecha, TransaccionORM.descripcion, TransaccionORM.user_id)
+
+
+class LoteInvalidoError(ValueError):
+    """Alguna operación no es aplicable: no se aplica ninguna"""
+
+    def __init__(self, resultados: List[dict]):
+        super().__init__("El lote contiene operaciones inválidas; no se aplicó ninguna")
+        self.resultados = resultados
+
+
+class LoteTransaccionesUseCase:
+    def __init__(self, db_session):
+        # Sesión del request (get_db): su ciclo de vida lo gestiona la capa API
+        self.db = db_session
+
+    def execute(self, user_id: int, operaciones: List[dict]) -> List[dict]:
+        """
+        Valida todo el lote antes de escribir y lo aplica con sentencias por conjunto:
+        un INSERT ... RETURNING multi-fila, un UPDATE por clave primaria (executemany)
+        y un DELETE ... WHERE id IN (...), más el delta del rollup, con un único commit
+
+        operaciones: dicts con op ('create' | 'update' | 'delete'), id y los campos de la transacción
+        Devuelve un resultado por operación, en el mismo orden
+        """
+        existentes = self._cargar_existentes(user_id, operaciones)
+        resultados = self._validar(operaciones, existentes)
+        if any(not r["ok"] for r in resultados):
+            raise LoteInvalidoError(resultados)
+
+        creaciones, cambios, borrados, movimientos = [], [], [], []
+        for op in operaciones:
+            if op["op"] == "create":
+                fila = {
+                    "user_id": user_id,
+                    "tipo": op.get("tipo") or "gasto",
+                    "cantidad": op["cantidad"],
+                    "descripcion": op.get("descripcion"),
+                    "fecha": op.get("fecha") or datetime.utcnow(),
+                }
+                creaciones.append(fila)
+                movimientos.append((fila["fecha"], fila["tipo"], fila["cantidad"], 1))
+            elif op["op"] == "update":
+                actual = existentes[op["id"]]
+                nueva = {
+                    "id": actual.id,
+                    "tipo": op.get("tipo") or actual.tipo,
+                    "cantidad": op.get("cantidad") or actual.cantidad,
+                    "descripcion": op.get("descripcion") if op.get("descripcion") is not None else actual.descripcion,
+                    "fecha": op.get("fecha") or actual.fecha,
+                }
+                cambios.append(nueva)
+                movimientos.append((actual.fecha, actual.tipo, actual.cantidad, -1))
+                movimientos.append((nueva["fecha"], nueva["tipo"], nueva["cantidad"], 1))
+            else:
+                actual = existentes[op["id"]]
+                borrados.append(actual.id)
+                movimientos.append((actual.fecha, actual.tipo, actual.cantidad, -1))
+
+        try:
+            creadas = []
+            if creaciones:
+                creadas = self.db.execute(
+                    insert(TransaccionORM).returning(*COLUMNAS, sort_by_parameter_order=True),
+                    creaciones
+                ).all()
+            if cambios:
+                # UPDATE ... WHERE id = :id con executemany (todas las filas con las mismas columnas)
+                self.db.execute(update(TransaccionORM), cambios)
+            if borrados:
+                self.db.execute(
+                    delete(TransaccionORM)
+                    .where(TransaccionORM.user_id == user_id, TransaccionORM.id.in_(borrados))
+                    .execution_options(synchronize_session=False)
+                )
+            SQLResumenMensualRepository(self.db).aplicar_lote(user_id, movimientos)
+            SQLVersionUsuarioRepository(self.db).incrementar(user_id)
+            self._registrar_eventos(user_id, creadas, cambios, borrados, existentes)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        creadas = iter(creadas)
+        actualizadas = {c["id"]: c for c in cambios}
+        for resultado, op in zip(resultados, operaciones):
+            if op["op"] == "create":
+                fila = next(creadas)
+                resultado["id"] = fila.id
+                resultado["transaccion"] = dict(fila._mapping)
+            elif op["op"] == "update":
+                resultado["transaccion"] = dict(actualizadas[op["id"]], user_id=user_id)
+        return resultados
+
+    def _registrar_eventos(self, user_id: int, creadas, cambios: List[dict], borrados: List[int], existentes: dict):
+        """Un evento por operación, publicado solo si el lote se confirma"""
+        for fila in creadas:
+            registrar_evento(self.db, TransaccionCreada(user_id, fila.id, fila.fecha, fila.tipo, fila.cantidad))
+        for nueva in cambios:
+            actual = existentes[nueva["id"]]
+            registrar_evento(self.db, TransaccionModificada(
+                user_id, actual.id, (actual.fecha, actual.tipo, actual.cantidad), (nueva["fecha"], nueva["tipo"], nueva["cantidad"])
+            ))
+        for transaccion_id in borrados:
+            actual = existentes[transaccion_id]
+            registrar_evento(self.db, TransaccionEliminada(user_id, actual.id, actual.fecha, actual.tipo, actual.cantidad))
+
+    def _cargar_existentes(self, user_id: int, operaciones: List[dict]) -> dict:
+        """Estado actual de las transacciones referenciadas (una consulta, bloqueadas hasta el commit)"""
+        ids = {op["id"] for op in operaciones if op["op"] != "create" and op.get("id") is not None}
+        if not ids:
+            return {}
+        filas = self.db.execute(
+            select(*COLUMNAS)
+            .where(TransaccionORM.user_id == user_id, TransaccionORM.id.in_(ids))
+            .with_for_update()
+        ).all()
+        return {f.id: f for f in filas}
+
+    def _validar(self, operaciones: List[dict], existentes: dict) -> List[dict]:
+        resultados = []
+        vistos = set()
+        for indice, op in enumerate(operaciones):
+            error = None
+            if op["op"] == "create":
+                if op.get("id") is not None:
+                    error = "create no admite id"
+                elif op.get("cantidad") is None:
+                    error = "cantidad es obligatoria"
+            elif op.get("id") is None:
+                error = f"{op['op']} requiere id"
+            elif op["id"] in vistos:
+                error = "La transacción aparece en varias operaciones del lote"
+            elif op["id"] not in existentes:
+                error = "Transacción no encontrada"
+            if op["op"] != "create" and op.get("id") is not None:
+                vistos.add(op["id"])
+            resultados.append({"indice": indice, "op": op["op"], "ok": error is None, "id": op.get("id"), "error": error})
+        return resultados
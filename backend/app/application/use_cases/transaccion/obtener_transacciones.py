@@ -1,19 +1,69 @@
 # Caso de uso básico para obtener transacciones
 
 from app.infrastructure.database.models import TransaccionORM
-from app.infrastructure.config.database import SessionLocal
-from sqlalchemy import extract, desc
+from app.infrastructure.database.filtros import filtro_periodo
+from app.infrastructure.config.replica import solo_lectura
+from app.application.dtos.cursor_dtos import CursorTransaccion
+from sqlalchemy import desc, select, tuple_
+
+# Columnas de TransaccionResponseDTO, en su orden
+COLUMNAS_RESPUESTA = (TransaccionORM.id, TransaccionORM.tipo, TransaccionORM.cantidad, TransaccionORM.fecha, TransaccionORM.descripcion, TransaccionORM.user_id)
 
 class ObtenerTransaccionesUseCase:
-    def __init__(self, db_session=None):
-        self.db = db_session or SessionLocal()
-
-    def execute(self, user_id: int, mes: int = None, anio: int = None, skip: int = 0, limit: int = 100):
-        query = self.db.query(TransaccionORM).filter(TransaccionORM.user_id == user_id)
-        if mes:
-            query = query.filter(extract('month', TransaccionORM.fecha) == mes)
-        if anio:
-            query = query.filter(extract('year', TransaccionORM.fecha) == anio)
+    def __init__(self, db_session):
+        # Sesión del request (get_db): su ciclo de vida lo gestiona la capa API
+        self.db = db_session
+
+    def _filtros(self, user_id: int, mes: int = None, anio: int = None, desde=None, hasta=None, cursor: str = None) -> list:
+        filtros = [TransaccionORM.user_id == user_id]
+        # Rango semiabierto sobre fecha: usa el índice (user_id, fecha DESC, id DESC)
+        filtros.extend(filtro_periodo(TransaccionORM.fecha, mes, anio, desde, hasta))
+        if cursor:
+            # Keyset: continuar estrictamente después de la última fila vista
+            posicion = CursorTransaccion.decode(cursor)
+            filtros.append(tuple_(TransaccionORM.fecha, TransaccionORM.id) < tuple_(posicion.fecha, posicion.id))
+            # Redundante, pero la comparación de filas no poda particiones y esta sí
+            filtros.append(TransaccionORM.fecha <= posicion.fecha)
+        return filtros
+
+    def _query(self, user_id: int, mes: int = None, anio: int = None, desde=None, hasta=None, cursor: str = None):
+        query = self.db.query(TransaccionORM).filter(*self._filtros(user_id, mes, anio, desde, hasta, cursor))
         # Ordenar: más recientes primero (fecha DESC, luego id DESC para estabilidad)
-        query = query.order_by(desc(TransaccionORM.fecha), desc(TransaccionORM.id))
-        return query.offset(skip).limit(limit).all()
\ No newline at end of file
+        return query.order_by(desc(TransaccionORM.fecha), desc(TransaccionORM.id))
+
+    @solo_lectura
+    def execute(self, user_id: int, mes: int = None, anio: int = None, skip: int = 0, limit: int = 100, desde=None, hasta=None, cursor: str = None):
+        query = self._query(user_id, mes, anio, desde, hasta, cursor)
+        if skip and not cursor:
+            query = query.offset(skip)
+        return query.limit(limit).all()
+
+    def obtener_pagina(self, user_id: int, mes: int = None, anio: int = None, skip: int = 0, limit: int = 100, desde=None, hasta=None, cursor: str = None):
+        """
+        Igual que execute pero devuelve (transacciones, next_cursor)
+        Pide limit + 1 filas para saber si hay página siguiente sin un COUNT
+        """
+        filas = self.execute(user_id, mes, anio, skip, limit + 1, desde, hasta, cursor)
+        if len(filas) <= limit:
+            return filas, None
+        filas = filas[:limit]
+        return filas, CursorTransaccion.desde_transaccion(filas[-1]).encode()
+
+    @solo_lectura
+    def obtener_pagina_filas(self, user_id: int, mes: int = None, anio: int = None, skip: int = 0, limit: int = 100, desde=None, hasta=None, cursor: str = None):
+        """
+        Como obtener_pagina pero con filas ligeras (tuplas en el orden de COLUMNAS_RESPUESTA)
+        en lugar de entidades ORM: para serializarlas directamente a JSON
+        """
+        stmt = (
+            select(*COLUMNAS_RESPUESTA)
+            .where(*self._filtros(user_id, mes, anio, desde, hasta, cursor))
+            .order_by(desc(TransaccionORM.fecha), desc(TransaccionORM.id))
+        )
+        if skip and not cursor:
+            stmt = stmt.offset(skip)
+        filas = self.db.execute(stmt.limit(limit + 1)).all()
+        if len(filas) <= limit:
+            return filas, None
+        filas = filas[:limit]
+        return filas, CursorTransaccion.desde_transaccion(filas[-1]).encode()
@@ -1,7 +1,7 @@
 # Ejemplo básico de caso de uso para crear usuario
 # Adaptación Clean Architecture: usar repositorio
 
-from app.auth import get_password_hash
+from app.auth import get_password_hash, get_password_hash_async
 from app.infrastructure.database.sueldo_repository import SQLSueldoRepository
 from app.infrastructure.database.usuario_repository import SQLUsuarioRepository
 from sqlalchemy.orm import Session
@@ -32,15 +32,8 @@ class CrearUsuarioUseCase:
             self.sueldo_repository = SQLSueldoRepository(db_session)
             return
 
-        # Caso 4: fallback - crear nuestra propia sesión (no ideal para tests, pero seguro)
-        try:
-            from app.infrastructure.config.database import SessionLocal
-            db = SessionLocal()
-            self.usuario_repository = SQLUsuarioRepository(db)
-            self.sueldo_repository = SQLSueldoRepository(db)
-        except Exception:
-            # Si por algún motivo no podemos crear sesión aquí, mejor fallar explícitamente
-            raise TypeError("CrearUsuarioUseCase requiere repositorios o una sesión de base de datos")
+        # Sin repositorios ni sesión no hay forma de acceder a la BD: la sesión la gestiona el request
+        raise TypeError("CrearUsuarioUseCase requiere repositorios o una sesión de base de datos")
 
     def execute(self, email: str, password: str):
         # Verificar si el usuario ya existe
@@ -54,3 +47,16 @@ class CrearUsuarioUseCase:
         # Crear entidad de dominio Usuario
         usuario = self.usuario_repository.create(email=email, hashed_password=hashed_password, is_active=True)
         return usuario
+
+
+class AsyncCrearUsuarioUseCase:
+    """Variante asíncrona (ASYNC_API) sobre repositorios AsyncSession"""
+    def __init__(self, usuario_repository):
+        self.usuario_repository = usuario_repository
+
+    async def execute(self, email: str, password: str):
+        if await self.usuario_repository.find_by_email(email):
+            raise ValueError("El email ya está registrado")
+        # pbkdf2 es CPU intensivo: se espera al pool de hashing sin bloquear el event loop
+        hashed_password = await get_password_hash_async(password)
+        return await self.usuario_repository.create(email=email, hashed_password=hashed_password, is_active=True)
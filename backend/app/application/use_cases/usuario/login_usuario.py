@@ -1,7 +1,7 @@
 # Caso de uso básico para login de usuario
 # Adaptación Clean Architecture: usar repositorio
 
-from app.auth import verify_password, create_access_token
+from app.auth import verify_password, verify_password_async, create_access_token
 
 class LoginUsuarioUseCase:
     def __init__(self, usuario_repository):
@@ -17,3 +17,19 @@ class LoginUsuarioUseCase:
         # Generar JWT usando la función global y el email
         access_token = create_access_token({"email": usuario.email})
         return {"access_token": access_token, "token_type": "bearer"}
+
+
+class AsyncLoginUsuarioUseCase:
+    """Variante asíncrona (ASYNC_API): el hash se verifica fuera del event loop"""
+    def __init__(self, usuario_repository):
+        self.usuario_repository = usuario_repository
+
+    async def execute(self, email: str, password: str):
+        usuario = await self.usuario_repository.find_by_email(email)
+        if not usuario:
+            raise ValueError("Usuario no encontrado")
+        # pbkdf2 es CPU intensivo: se espera al pool de hashing sin bloquear el event loop
+        if not await verify_password_async(password, usuario.hashed_password):
+            raise ValueError("Contraseña incorrecta")
+        access_token = create_access_token({"email": usuario.email})
+        return {"access_token": access_token, "token_type": "bearer"}
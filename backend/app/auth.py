@@ -1,13 +1,16 @@
 # Funciones de autenticación JWT - Tutorial paso a paso
 from datetime import datetime, timedelta
 from typing import Optional
+import hashlib
+import time
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import HTTPException, status
 
 # Configuración
 import os
 from dotenv import load_dotenv
+from .infrastructure.cache.ttl_cache import TTLCache
+from .infrastructure.security.password_hasher import password_hasher, HashingSaturadoError
 
 load_dotenv()
 
@@ -17,16 +20,46 @@ SECRET_KEY = os.getenv("SECRET_KEY", "finanzas-app-super-secret-key-2024-jwt-pro
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Caché de tokens ya verificados: sha256(token) → claims (0 la desactiva)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+token_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=24 * 3600)
+
 # Para hashear contraseñas de forma segura - usando pbkdf2_sha256 (más compatible con Docker)
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# El cálculo corre en un pool de procesos dedicado con cola acotada (ver password_hasher.py)
+def _servicio_no_disponible(e: HashingSaturadoError):
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"},
+    )
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica si una contraseña en texto plano coincide con el hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return password_hasher.verify(plain_password, hashed_password)
+    except HashingSaturadoError as e:
+        raise _servicio_no_disponible(e)
 
 def get_password_hash(password: str) -> str:
     """Convierte una contraseña en texto plano a hash seguro"""
-    return pwd_context.hash(password)
+    try:
+        return password_hasher.hash(password)
+    except HashingSaturadoError as e:
+        raise _servicio_no_disponible(e)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password sin bloquear el event loop (ASYNC_API)"""
+    try:
+        return await password_hasher.verify_async(plain_password, hashed_password)
+    except HashingSaturadoError as e:
+        raise _servicio_no_disponible(e)
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash sin bloquear el event loop (ASYNC_API)"""
+    try:
+        return await password_hasher.hash_async(password)
+    except HashingSaturadoError as e:
+        raise _servicio_no_disponible(e)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Crea un JWT token con los datos del usuario"""
@@ -45,7 +78,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def verify_token(token: str) -> dict:
-    """Verifica si un token es válido y devuelve los datos"""
+    """
+    Verifica si un token es válido y devuelve los datos
+    El mismo token se reutiliza durante toda su vida: tras la primera verificación
+    los claims se sirven desde token_cache hasta su exp (solo se cachean tokens válidos)
+    """
+    clave = hashlib.sha256(token.encode()).digest()
+    datos = token_cache.get(clave)
+    if datos is not None:
+        if datos["exp"] > time.time():
+            return {"email": datos["email"]}
+        token_cache.invalidate(clave)
+    
+    payload = decode_token(token)
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(clave, {"email": payload["email"], "exp": exp}, ttl=exp - time.time())
+    return {"email": payload["email"]}
+
+def decode_token(token: str) -> dict:
+    """Decodifica y verifica firma y exp del token (sin caché)"""
     try:
         # Decodificar el token
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -60,11 +112,11 @@ def verify_token(token: str) -> dict:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        return {"email": email}
+        return payload
     
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,49 @@
+"""
+Entidad Balance - Modelo de dominio puro sin dependencias de framework
+"""
+from typing import Optional
+
+
+class Balance:
+    """
+    Resultado financiero de un usuario en un periodo (mes/año opcionales)
+    """
+    
+    def __init__(
+        self,
+        ingresos: float = 0.0,
+        gastos: float = 0.0,
+        sueldo: float = 0.0,
+        mes: Optional[int] = None,
+        anio: Optional[int] = None
+    ):
+        self.ingresos = ingresos or 0.0
+        self.gastos = gastos or 0.0
+        self.sueldo = sueldo or 0.0
+        self.mes = mes
+        self.anio = anio
+    
+    @property
+    def saldo_transacciones(self) -> float:
+        """Regla de negocio: ingresos menos gastos"""
+        return self.ingresos - self.gastos
+    
+    @property
+    def saldo_total(self) -> float:
+        """Regla de negocio: saldo de transacciones más el sueldo del periodo"""
+        return self.saldo_transacciones + self.sueldo
+    
+    def to_dict(self) -> dict:
+        """Representación plana usada por la API"""
+        return {
+            "saldo_total": self.saldo_total,
+            "saldo_transacciones": self.saldo_transacciones,
+            "saldo_sueldo": self.sueldo,
+            "ingresos": self.ingresos,
+            "gastos": self.gastos,
+            "mes": self.mes,
+            "anio": self.anio
+        }
+    
+    def __repr__(self):
+        return f"Balance({self.anio}-{self.mes}, saldo_total={self.saldo_total})"
@@ -9,6 +9,9 @@ class Sueldo:
     """
     Entidad de dominio Sueldo que representa el concepto de negocio
     """
+
+    # Sin __dict__ por instancia: menos memoria y acceso más rápido en listados grandes
+    __slots__ = ("id", "cantidad", "mes", "anio", "user_id", "fecha")
     
     def __init__(
         self,
@@ -28,6 +31,21 @@ class Sueldo:
         
         # Validaciones de dominio
         self._validate()
+
+    @classmethod
+    def from_row(cls, id: int, cantidad: float, mes: int, anio: int, user_id: int, fecha: datetime) -> "Sueldo":
+        """
+        Construcción de confianza para datos ya persistidos (sin _validate())
+        Permite leer filas históricas aunque las reglas de alta cambien (p. ej. rango de años)
+        """
+        sueldo = object.__new__(cls)
+        sueldo.id = id
+        sueldo.cantidad = cantidad
+        sueldo.mes = mes
+        sueldo.anio = anio
+        sueldo.user_id = user_id
+        sueldo.fecha = fecha
+        return sueldo
     
     def _validate(self):
         """Validaciones de reglas de negocio"""
@@ -9,6 +9,9 @@ class Transaccion:
     """
     Entidad de dominio Transaccion que representa el concepto de negocio
     """
+
+    # Sin __dict__ por instancia: menos memoria y acceso más rápido en listados grandes
+    __slots__ = ("id", "tipo", "cantidad", "user_id", "fecha", "descripcion")
     
     def __init__(
         self,
@@ -28,6 +31,22 @@ class Transaccion:
         
         # Validaciones de dominio
         self._validate()
+
+    @classmethod
+    def from_row(cls, id: int, tipo: str, cantidad: float, user_id: int, fecha: datetime, descripcion: Optional[str] = None) -> "Transaccion":
+        """
+        Construcción de confianza para datos ya persistidos
+        No repite _validate() ni rellena valores por defecto: la BD ya los garantiza
+        Los datos nuevos (entrada del usuario) deben pasar siempre por __init__
+        """
+        transaccion = object.__new__(cls)
+        transaccion.id = id
+        transaccion.tipo = tipo
+        transaccion.cantidad = cantidad
+        transaccion.user_id = user_id
+        transaccion.fecha = fecha
+        transaccion.descripcion = descripcion
+        return transaccion
     
     def _validate(self):
         """Validaciones de reglas de negocio"""
@@ -10,6 +10,9 @@ class Usuario:
     Entidad de dominio Usuario que representa el concepto de negocio
     sin dependencias de SQLAlchemy ni otras librerías externas
     """
+
+    # Sin __dict__ por instancia: menos memoria por usuario en caché
+    __slots__ = ("id", "email", "hashed_password", "is_active", "created_at", "transacciones", "sueldos")
     
     def __init__(
         self,
@@ -31,6 +34,19 @@ class Usuario:
         
         # Validaciones de dominio
         self._validate()
+
+    @classmethod
+    def from_row(cls, id: int, email: str, hashed_password: str, is_active: bool, created_at: datetime) -> "Usuario":
+        """Construcción de confianza para datos ya persistidos (sin _validate())"""
+        usuario = object.__new__(cls)
+        usuario.id = id
+        usuario.email = email
+        usuario.hashed_password = hashed_password
+        usuario.is_active = is_active
+        usuario.created_at = created_at
+        usuario.transacciones = []
+        usuario.sueldos = []
+        return usuario
     
     def _validate(self):
         """Validaciones de reglas de negocio"""
@@ -0,0 +1,23 @@
+"""
+Interface abstracta para BalanceRepository
+Define el contrato que deben cumplir las implementaciones concretas
+"""
+from abc import ABC, abstractmethod
+from typing import Optional, List, Tuple
+from ..entities.balance import Balance
+
+
+class BalanceRepositoryInterface(ABC):
+    """
+    Contrato abstracto para el cálculo de balances (agregados, no filas)
+    """
+    
+    @abstractmethod
+    def get_balance(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> Balance:
+        """Ingresos, gastos y sueldo del usuario en un periodo"""
+        pass
+    
+    @abstractmethod
+    def get_balances_by_periods(self, user_id: int, periodos: List[Tuple[int, int]]) -> List[Balance]:
+        """Balances de varios periodos (mes, anio), en el mismo orden recibido"""
+        pass
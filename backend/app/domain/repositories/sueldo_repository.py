@@ -44,5 +44,47 @@ class SueldoRepositoryInterface(ABC):
     
     @abstractmethod
     def upsert_by_period(self, sueldo: Sueldo) -> Sueldo:
+        """Crear o actualizar sueldo según período (regla de negocio única)"""
+        pass
+
+
+class AsyncSueldoRepositoryInterface(ABC):
+    """
+    Contrato abstracto asíncrono para repositorio de sueldos
+    Mismos métodos que SueldoRepositoryInterface, como corrutinas
+    """
+    
+    @abstractmethod
+    async def save(self, sueldo: Sueldo) -> Sueldo:
+        """Guardar sueldo en almacenamiento"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, sueldo_id: int) -> Optional[Sueldo]:
+        """Buscar sueldo por ID"""
+        pass
+    
+    @abstractmethod
+    async def find_all_by_user(self, user_id: int) -> List[Sueldo]:
+        """Obtener todos los sueldos de un usuario"""
+        pass
+    
+    @abstractmethod
+    async def find_by_user_and_period(self, user_id: int, mes: int, anio: int) -> Optional[Sueldo]:
+        """Buscar sueldo específico de usuario por mes/año"""
+        pass
+    
+    @abstractmethod
+    async def update(self, sueldo: Sueldo) -> Sueldo:
+        """Actualizar sueldo existente"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, sueldo_id: int) -> bool:
+        """Eliminar sueldo por ID"""
+        pass
+    
+    @abstractmethod
+    async def upsert_by_period(self, sueldo: Sueldo) -> Sueldo:
         """Crear o actualizar sueldo según período (regla de negocio única)"""
         pass
\ No newline at end of file
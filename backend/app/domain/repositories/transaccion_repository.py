@@ -17,6 +17,11 @@ class TransaccionRepositoryInterface(ABC):
         """Guardar transacción en almacenamiento"""
         pass
     
+    @abstractmethod
+    def save_many(self, transacciones: List[Transaccion]) -> int:
+        """Insertar un lote de transacciones sin confirmar (importaciones); devuelve cuántas"""
+        pass
+    
     @abstractmethod
     def find_by_id(self, transaccion_id: int) -> Optional[Transaccion]:
         """Buscar transacción por ID"""
@@ -54,5 +59,62 @@ class TransaccionRepositoryInterface(ABC):
     
     @abstractmethod
     def get_gastos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
+        """Sumar gastos del usuario en período"""
+        pass
+
+
+class AsyncTransaccionRepositoryInterface(ABC):
+    """
+    Contrato abstracto asíncrono para repositorio de transacciones
+    Mismos métodos que TransaccionRepositoryInterface, como corrutinas
+    """
+    
+    @abstractmethod
+    async def save(self, transaccion: Transaccion) -> Transaccion:
+        """Guardar transacción en almacenamiento"""
+        pass
+    
+    @abstractmethod
+    async def save_many(self, transacciones: List[Transaccion]) -> int:
+        """Insertar un lote de transacciones sin confirmar (importaciones); devuelve cuántas"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, transaccion_id: int) -> Optional[Transaccion]:
+        """Buscar transacción por ID"""
+        pass
+    
+    @abstractmethod
+    async def find_all_by_user(self, user_id: int) -> List[Transaccion]:
+        """Obtener todas las transacciones de un usuario"""
+        pass
+    
+    @abstractmethod
+    async def find_by_user_and_month(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> List[Transaccion]:
+        """Buscar transacciones de usuario filtradas por mes/año"""
+        pass
+    
+    @abstractmethod
+    async def update(self, transaccion: Transaccion) -> Transaccion:
+        """Actualizar transacción existente"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, transaccion_id: int) -> bool:
+        """Eliminar transacción por ID"""
+        pass
+    
+    @abstractmethod
+    async def get_balance_by_user(self, user_id: int) -> float:
+        """Calcular balance total del usuario"""
+        pass
+    
+    @abstractmethod
+    async def get_ingresos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
+        """Sumar ingresos del usuario en período"""
+        pass
+    
+    @abstractmethod
+    async def get_gastos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
         """Sumar gastos del usuario en período"""
         pass
\ No newline at end of file
@@ -45,5 +45,47 @@ class UsuarioRepositoryInterface(ABC):
     
     @abstractmethod
     def exists_by_email(self, email: str) -> bool:
+        """Verificar si existe usuario con email"""
+        pass
+
+
+class AsyncUsuarioRepositoryInterface(ABC):
+    """
+    Contrato abstracto asíncrono para repositorio de usuarios
+    Mismos métodos que UsuarioRepositoryInterface, como corrutinas
+    """
+    
+    @abstractmethod
+    async def save(self, usuario: Usuario) -> Usuario:
+        """Guardar usuario en almacenamiento"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Buscar usuario por ID"""
+        pass
+    
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Usuario]:
+        """Buscar usuario por email"""
+        pass
+    
+    @abstractmethod
+    async def find_all(self) -> List[Usuario]:
+        """Obtener todos los usuarios"""
+        pass
+    
+    @abstractmethod
+    async def update(self, usuario: Usuario) -> Usuario:
+        """Actualizar usuario existente"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, usuario_id: int) -> bool:
+        """Eliminar usuario por ID"""
+        pass
+    
+    @abstractmethod
+    async def exists_by_email(self, email: str) -> bool:
         """Verificar si existe usuario con email"""
         pass
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Bus de eventos de dominio en proceso
+- Suscriptores síncronos: se ejecutan al publicar, en el mismo hilo (deben ser rápidos)
+- Suscriptores en segundo plano: una cola asyncio acotada consumida por una tarea del
+  event loop de la app (corrutinas o funciones); si la cola se llena, el evento se descarta
+Los errores de un suscriptor se registran y nunca llegan a quien publica: el dato ya está confirmado.
+Un suscriptor a EventoDominio recibe todos los eventos (se despacha por la jerarquía de clases).
+"""
+import asyncio
+import inspect
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Optional, Type
+
+from .eventos import EventoDominio
+
+logger = logging.getLogger("app.eventos")
+
+
+class EventBus:
+    def __init__(self):
+        self._sincronos = defaultdict(list)
+        self._segundo_plano = defaultdict(list)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cola: Optional[asyncio.Queue] = None
+        self._tarea: Optional[asyncio.Task] = None
+        self.publicados = 0
+        self.descartados = 0
+        self.errores = 0
+
+    # ----- suscripción -----
+
+    def suscribir(self, tipo: Type[EventoDominio], manejador: Callable, en_segundo_plano: bool = False):
+        """Registrar un manejador para `tipo` (y sus subclases)"""
+        with self._lock:
+            destino = self._segundo_plano if en_segundo_plano else self._sincronos
+            destino[tipo].append(manejador)
+        return manejador
+
+    def suscriptor(self, tipo: Type[EventoDominio], en_segundo_plano: bool = False):
+        """Decorador equivalente a suscribir()"""
+        return lambda manejador: self.suscribir(tipo, manejador, en_segundo_plano)
+
+    def cancelar(self, tipo: Type[EventoDominio], manejador: Callable):
+        with self._lock:
+            for destino in (self._sincronos, self._segundo_plano):
+                if manejador in destino.get(tipo, ()):
+                    destino[tipo].remove(manejador)
+
+    def _manejadores(self, destino, evento):
+        return [m for tipo in type(evento).__mro__ for m in destino.get(tipo, ())]
+
+    # ----- publicación -----
+
+    def publicar(self, evento: EventoDominio):
+        """Entregar el evento: ya a los síncronos, encolado a los de segundo plano (desde cualquier hilo)"""
+        self.publicados += 1
+        for manejador in self._manejadores(self._sincronos, evento):
+            try:
+                manejador(evento)
+            except Exception:
+                self.errores += 1
+                logger.exception("Error en el suscriptor %r de %s", manejador, type(evento).__name__)
+        pendientes = self._manejadores(self._segundo_plano, evento)
+        if not pendientes:
+            return
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self.descartados += len(pendientes)
+            logger.warning("Bus de eventos sin iniciar: %s no llega a %d suscriptores en segundo plano", type(evento).__name__, len(pendientes))
+            return
+        for manejador in pendientes:
+            loop.call_soon_threadsafe(self._encolar, manejador, evento)
+
+    def _encolar(self, manejador, evento):
+        try:
+            self._cola.put_nowait((manejador, evento))
+        except asyncio.QueueFull:
+            self.descartados += 1
+            logger.warning("Cola de eventos llena: se descarta %s para %r", type(evento).__name__, manejador)
+
+    # ----- ciclo de vida (lifespan de la app) -----
+
+    async def iniciar(self, tamano_cola: int = 10000):
+        """Arrancar el consumidor de segundo plano en el event loop actual"""
+        if self._tarea is not None and not self._tarea.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._cola = asyncio.Queue(maxsize=tamano_cola)
+        self._tarea = asyncio.create_task(self._consumir())
+
+    async def detener(self, timeout: float = 5.0):
+        """Vaciar la cola (hasta `timeout` segundos) y parar el consumidor"""
+        if self._tarea is None:
+            return
+        try:
+            await asyncio.wait_for(self._cola.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Bus de eventos detenido con %d eventos sin procesar", self._cola.qsize())
+        self._tarea.cancel()
+        try:
+            await self._tarea
+        except asyncio.CancelledError:
+            pass
+        self._loop = self._cola = self._tarea = None
+
+    async def _consumir(self):
+        while True:
+            manejador, evento = await self._cola.get()
+            try:
+                resultado = manejador(evento)
+                if inspect.isawaitable(resultado):
+                    await resultado
+            except Exception:
+                self.errores += 1
+                logger.exception("Error en el suscriptor %r de %s", manejador, type(evento).__name__)
+            finally:
+                self._cola.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "publicados": self.publicados,
+            "descartados": self.descartados,
+            "errores": self.errores,
+            "en_cola": self._cola.qsize() if self._cola is not None else 0,
+            "activo": self._tarea is not None and not self._tarea.done(),
+        }
+
+
+# Bus único del proceso
+event_bus = EventBus()
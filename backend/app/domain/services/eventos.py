@@ -0,0 +1,72 @@
+"""
+Eventos de dominio - hechos ya confirmados en la base de datos
+Se publican en el bus (event_bus.py) después del commit de la transacción que los produce
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Tuple
+
+# (fecha, tipo, cantidad): lo que necesita cualquier proyección mensual
+Movimiento = Tuple[datetime, str, float]
+
+
+@dataclass(frozen=True)
+class EventoDominio:
+    """Base: todos los eventos pertenecen a un usuario"""
+    user_id: int
+    ocurrido_en: datetime = field(default_factory=datetime.utcnow, kw_only=True, compare=False)
+
+
+@dataclass(frozen=True)
+class TransaccionCreada(EventoDominio):
+    transaccion_id: int
+    fecha: datetime
+    tipo: str
+    cantidad: float
+
+
+@dataclass(frozen=True)
+class TransaccionModificada(EventoDominio):
+    transaccion_id: int
+    anterior: Movimiento
+    nueva: Movimiento
+
+
+@dataclass(frozen=True)
+class TransaccionEliminada(EventoDominio):
+    transaccion_id: int
+    fecha: datetime
+    tipo: str
+    cantidad: float
+
+
+@dataclass(frozen=True)
+class TransaccionesImportadas(EventoDominio):
+    """Alta en bloque (importación): un evento por usuario en lugar de uno por fila"""
+    cantidad: int
+    periodos: Tuple[Tuple[int, int], ...]  # (mes, anio) afectados
+
+
+@dataclass(frozen=True)
+class SueldoActualizado(EventoDominio):
+    """Alta o cambio del sueldo de un mes"""
+    mes: int
+    anio: int
+    cantidad: float
+
+
+@dataclass(frozen=True)
+class SueldoEliminado(EventoDominio):
+    mes: int
+    anio: int
+
+
+@dataclass(frozen=True)
+class UsuarioActualizado(EventoDominio):
+    email: str
+    email_anterior: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class UsuarioEliminado(EventoDominio):
+    email: str
@@ -0,0 +1,87 @@
+"""
+Servicio de dominio: Periodos de tiempo
+Convierte (mes, anio) o (desde, hasta) en rangos semiabiertos [inicio, fin)
+"""
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+RangoFechas = Tuple[Optional[datetime], Optional[datetime]]
+
+
+def _a_datetime(valor) -> Optional[datetime]:
+    """Normalizar date/datetime a datetime (las fechas se guardan como TIMESTAMP)"""
+    if valor is None or isinstance(valor, datetime):
+        return valor
+    if isinstance(valor, date):
+        return datetime(valor.year, valor.month, valor.day)
+    raise ValueError(f"Fecha inválida: {valor!r}")
+
+
+def siguiente_mes(mes: int, anio: int) -> Tuple[int, int]:
+    """Regla de negocio: mes siguiente (diciembre → enero del año siguiente)"""
+    return (1, anio + 1) if mes == 12 else (mes + 1, anio)
+
+
+def rango_mes(mes: int, anio: int) -> Tuple[datetime, datetime]:
+    """Rango [primer día del mes, primer día del mes siguiente)"""
+    if not (1 <= mes <= 12):
+        raise ValueError("Mes debe estar entre 1 y 12")
+    mes_fin, anio_fin = siguiente_mes(mes, anio)
+    return datetime(anio, mes, 1), datetime(anio_fin, mes_fin, 1)
+
+
+def rango_anio(anio: int) -> Tuple[datetime, datetime]:
+    """Rango [1 de enero, 1 de enero del año siguiente)"""
+    return datetime(anio, 1, 1), datetime(anio + 1, 1, 1)
+
+
+def rango_periodo(
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    desde=None,
+    hasta=None
+) -> RangoFechas:
+    """
+    Resolver los filtros de periodo a un único rango semiabierto [inicio, fin)
+
+    - (mes, anio): el mes completo
+    - (anio): el año completo
+    - (desde, hasta): desde inclusivo, hasta exclusivo; se intersecta con mes/anio si vienen ambos
+    - mes sin anio no es un rango contiguo: devuelve (None, None) y se resuelve aparte
+    """
+    inicio, fin = None, None
+    if anio:
+        inicio, fin = rango_mes(mes, anio) if mes else rango_anio(anio)
+    elif mes and not (1 <= mes <= 12):
+        raise ValueError("Mes debe estar entre 1 y 12")
+
+    desde, hasta = _a_datetime(desde), _a_datetime(hasta)
+    if desde is not None:
+        inicio = desde if inicio is None else max(inicio, desde)
+    if hasta is not None:
+        fin = hasta if fin is None else min(fin, hasta)
+    return inicio, fin
+
+
+def parse_periodo(texto: str) -> Tuple[int, int]:
+    """Convertir 'YYYY-MM' en (mes, anio)"""
+    try:
+        anio_txt, mes_txt = texto.split("-")
+        mes, anio = int(mes_txt), int(anio_txt)
+    except (AttributeError, ValueError):
+        raise ValueError(f"Periodo inválido: {texto!r} (formato YYYY-MM)")
+    if not (1 <= mes <= 12):
+        raise ValueError("Mes debe estar entre 1 y 12")
+    return mes, anio
+
+
+def periodos_entre(desde: Tuple[int, int], hasta: Tuple[int, int], maximo: int = 120) -> List[Tuple[int, int]]:
+    """Lista de (mes, anio) desde→hasta, ambos inclusivos"""
+    if (desde[1], desde[0]) > (hasta[1], hasta[0]):
+        raise ValueError("El periodo inicial debe ser anterior al final")
+    periodos = [desde]
+    while periodos[-1] != hasta:
+        periodos.append(siguiente_mes(*periodos[-1]))
+        if len(periodos) > maximo:
+            raise ValueError(f"Como máximo {maximo} periodos por consulta")
+    return periodos
@@ -0,0 +1 @@
+# Cachés en memoria del proceso
@@ -0,0 +1,82 @@
+"""
+Caché en memoria acotada con expiración (TTL) y desalojo LRU
+Segura entre hilos: los endpoints síncronos corren en el threadpool
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Diccionario acotado: cada entrada caduca a los `ttl` segundos y, si se supera
+    `maxsize`, se desaloja la usada hace más tiempo. ttl <= 0 o maxsize <= 0 la desactiva.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0, reloj=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._reloj = reloj
+        self._datos = OrderedDict()  # clave → (caduca_en, valor)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def activa(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, clave, default=None):
+        """Valor vigente o default (cuenta hit/miss)"""
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is not None:
+                caduca_en, valor = entrada
+                if caduca_en > self._reloj():
+                    self._datos.move_to_end(clave)
+                    self.hits += 1
+                    return valor
+                del self._datos[clave]
+            self.misses += 1
+            return default
+
+    def set(self, clave, valor, ttl: float = None):
+        """Guardar con el TTL por defecto o uno propio (p. ej. acotado por la expiración de un token)"""
+        if not self.activa:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._datos[clave] = (self._reloj() + ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+
+    def invalidate(self, clave):
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+
+    def stats(self) -> dict:
+        """Contadores para observabilidad"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "size": len(self._datos),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
+
+    def __contains__(self, clave) -> bool:
+        """Presencia sin contar hit/miss (puede incluir entradas ya caducadas)"""
+        return clave in self._datos
+
+    def __len__(self):
+        return len(self._datos)
@@ -0,0 +1,74 @@
+"""
+Caché de usuarios autenticados (por email, la clave que viaja en el JWT)
+Evita el SELECT sobre usuarios que precedía a cada petición autenticada.
+
+La invalidan los eventos UsuarioActualizado / UsuarioEliminado que publican las escrituras
+de SQLUsuarioRepository tras su commit; el TTL acota
+la desactualización frente a cambios hechos por otros procesos.
+"""
+import copy
+import os
+import threading
+from typing import Optional
+from dotenv import load_dotenv
+
+from ...domain.entities.usuario import Usuario
+from ...domain.services.event_bus import event_bus
+from ...domain.services.eventos import UsuarioActualizado, UsuarioEliminado
+from .ttl_cache import TTLCache
+
+load_dotenv()
+
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "30"))  # segundos; 0 desactiva la caché
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "1024"))
+
+
+class UsuarioCache:
+    """Usuario por email, con índice id → email para invalidar desde delete(usuario_id)"""
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL):
+        self._por_email = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._email_por_id = {}
+        # El índice lo tocan a la vez el threadpool y los suscriptores del bus de eventos
+        self._lock = threading.Lock()
+
+    def get(self, email: str) -> Optional[Usuario]:
+        usuario = self._por_email.get(email)
+        # Copia: quien la reciba puede modificarla sin alterar la caché
+        return copy.copy(usuario) if usuario is not None else None
+
+    def set(self, usuario: Usuario):
+        if usuario is None or not self._por_email.activa:
+            return
+        self._por_email.set(usuario.email, copy.copy(usuario))
+        with self._lock:
+            self._email_por_id[usuario.id] = usuario.email
+            if len(self._email_por_id) > 2 * self._por_email.maxsize:
+                self._email_por_id = {u: e for u, e in self._email_por_id.items() if e in self._por_email}
+
+    def invalidate(self, email: str = None, usuario_id: int = None):
+        if usuario_id is not None:
+            with self._lock:
+                email = self._email_por_id.pop(usuario_id, None) or email
+        if email is not None:
+            self._por_email.invalidate(email)
+
+    def clear(self):
+        self._por_email.clear()
+        with self._lock:
+            self._email_por_id.clear()
+
+    def stats(self) -> dict:
+        return self._por_email.stats()
+
+
+# Instancia del proceso (cada worker tiene la suya)
+usuario_cache = UsuarioCache()
+
+
+@event_bus.suscriptor(UsuarioActualizado)
+@event_bus.suscriptor(UsuarioEliminado)
+def _invalidar_usuario(evento):
+    """Síncrono: la siguiente petición del usuario ya no ve la versión anterior"""
+    usuario_cache.invalidate(email=getattr(evento, "email_anterior", None) or evento.email, usuario_id=evento.user_id)
+    usuario_cache.invalidate(email=evento.email)
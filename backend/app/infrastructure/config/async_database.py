@@ -0,0 +1,70 @@
+"""
+Configuración de base de datos asíncrona - Infrastructure Layer
+Motor y sesiones AsyncSession (asyncpg para PostgreSQL, aiosqlite para SQLite)
+Solo se importa cuando la API corre en modo asíncrono (ASYNC_API=true)
+"""
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from .database import DATABASE_URL, engine_options
+from .replica import DATABASE_REPLICA_URL, crear_routing_session
+from ..metrics.registro import METRICS_ENABLED
+from ..metrics.sql import instrumentar_engine
+from ..metrics.profiler import SQL_PROFILE, perfilador
+
+# Drivers asíncronos por backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def async_database_url(url):
+    """postgresql://... → postgresql+asyncpg://..., sqlite://... → sqlite+aiosqlite://..."""
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No hay driver asíncrono configurado para {url.get_backend_name()}")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+
+def crear_async_engine(url, **overrides):
+    """Crear un motor asíncrono con el mismo pool configurado que el síncrono"""
+    url = async_database_url(url)
+    return create_async_engine(url, **engine_options(url, **overrides))
+
+
+# Motor asíncrono
+async_engine = crear_async_engine(DATABASE_URL)
+if METRICS_ENABLED:
+    instrumentar_engine(async_engine.sync_engine, "async")
+if SQL_PROFILE:
+    perfilador.instrumentar_engine(async_engine.sync_engine)
+
+# Réplica de solo lectura opcional (mismo enrutado que el modo síncrono)
+async_replica_engine = None
+if DATABASE_REPLICA_URL:
+    async_replica_engine = crear_async_engine(DATABASE_REPLICA_URL)
+    if METRICS_ENABLED:
+        instrumentar_engine(async_replica_engine.sync_engine, "replica_async")
+    if SQL_PROFILE:
+        perfilador.instrumentar_engine(async_replica_engine.sync_engine)
+
+# Fábrica de sesiones asíncronas
+# expire_on_commit=False: tras el commit no hay lazy loads implícitos (no se pueden await)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+    **({"sync_session_class": crear_routing_session(async_replica_engine.sync_engine)} if async_replica_engine is not None else {})
+)
+
+
+async def get_async_db():
+    """
+    Dependencia para inyectar AsyncSession en endpoints async def
+    Una sesión por request, cerrada al terminar
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -3,19 +3,79 @@ Configuración de base de datos - Infrastructure Layer
 Esta configuración específica usa PostgreSQL + SQLAlchemy
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 from dotenv import load_dotenv
+from ..metrics.registro import METRICS_ENABLED
+from ..metrics.sql import clase_pool_medido, instrumentar_engine
+from ..metrics.profiler import SQL_PROFILE, perfilador
+from .replica import DATABASE_REPLICA_URL, crear_routing_session
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Pool de conexiones (por proceso): pool_size fijas + max_overflow temporales
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # segundos esperando conexión libre
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # segundos antes de renovar una conexión
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+# Modo de la API: endpoints async def sobre AsyncSession (ver async_database.py)
+ASYNC_API = os.getenv("ASYNC_API", "false").lower() in ("1", "true", "yes")
+
+
+def engine_options(url, **overrides) -> dict:
+    """
+    Opciones de create_engine según la configuración del pool
+    SQLite en memoria usa un pool de una sola conexión y no admite tamaño/overflow
+    """
+    opciones = {"pool_pre_ping": DB_POOL_PRE_PING}
+    url = make_url(url)
+    if not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+        opciones.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+        if METRICS_ENABLED:
+            # QueuePool que mide checkouts y esperas (gauges y contadores en /metrics)
+            opciones["poolclass"] = clase_pool_medido(url.get_dialect().is_async)
+    opciones.update(overrides)
+    return opciones
+
+
+def crear_engine(url, **overrides):
+    """Crear un motor con el pool configurado"""
+    return create_engine(url, **engine_options(url, **overrides))
+
+
 # Motor de BD - específico para PostgreSQL
-engine = create_engine(DATABASE_URL)
+engine = crear_engine(DATABASE_URL)
+if METRICS_ENABLED:
+    instrumentar_engine(engine, "sync")
+if SQL_PROFILE:
+    perfilador.instrumentar_engine(engine)
+
+# Réplica de solo lectura opcional: los métodos @solo_lectura leen de ella (ver replica.py)
+replica_engine = None
+if DATABASE_REPLICA_URL:
+    replica_engine = crear_engine(DATABASE_REPLICA_URL)
+    if METRICS_ENABLED:
+        instrumentar_engine(replica_engine, "replica")
+    if SQL_PROFILE:
+        perfilador.instrumentar_engine(replica_engine)
 
-# Fábrica de sesiones
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Fábrica de sesiones (con réplica: RoutingSession, primario por defecto)
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    **({"class_": crear_routing_session(replica_engine)} if replica_engine is not None else {})
+)
 
 # Base para modelos ORM (solo para infrastructure)
 Base = declarative_base()
@@ -24,10 +84,11 @@ Base = declarative_base()
 def get_db():
     """
     Dependencia para inyectar sesión en endpoints FastAPI
-    Se usará en la capa API para obtener conexión a BD
+    Una sesión por request: la comparten todos los repositorios y casos de uso
+    de la petición y se cierra (devolviendo la conexión al pool) al terminar
     """
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
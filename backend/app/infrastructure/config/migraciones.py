@@ -0,0 +1,26 @@
+"""
+Migraciones del esquema desde código (mismo árbol que `alembic upgrade head` en backend/)
+Para herramientas y tests que preparan su propia base de datos; la app no las ejecuta al arrancar
+"""
+import os
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+def configuracion(url: Optional[str] = None) -> Config:
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    # Sin fileConfig: no reconfigurar los loggers del proceso que llama
+    config.attributes["configurar_logging"] = False
+    if url:
+        config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    return config
+
+
+def actualizar_esquema(url: Optional[str] = None, revision: str = "head"):
+    """Aplicar las migraciones pendientes (por defecto sobre DATABASE_URL)"""
+    command.upgrade(configuracion(url), revision)
@@ -0,0 +1,261 @@
+"""
+Enrutado de lecturas a una réplica de solo lectura - Infrastructure Layer
+
+Con DATABASE_REPLICA_URL configurada, las sesiones son RoutingSession:
+- Por defecto todo va al primario (escrituras, SELECT ... FOR UPDATE, comprobaciones previas a escribir)
+- Los métodos marcados con @solo_lectura leen de la réplica, salvo que:
+  * la sesión ya haya escrito en su transacción actual (vería datos sin confirmar), o
+  * la réplica no haya aplicado aún la última escritura del usuario de la lectura
+    (read-your-writes: la réplica puede ir unos instantes por detrás)
+- Con reintentar=True, un None leído en la réplica se repite en el primario (p. ej. el login
+  justo después del registro, o una transacción recién creada buscada por id)
+
+Read-your-writes entre workers y contenedores: toda escritura de datos de un usuario
+incrementa su fila de versiones_usuario en la misma transacción, así que la réplica está
+al día para ese usuario cuando su versión alcanza la del primario (dos lecturas por PK al
+empezar cada bloque de lectura; una sola si la dependencia del ETag ya leyó la del primario
+en la transacción, ver recordar_version). Las escrituras del propio proceso se recuerdan además
+REPLICA_STICKY_SECONDS y van al primario sin consultar las versiones.
+"""
+import functools
+import inspect
+import os
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from ..cache.ttl_cache import TTLCache
+
+load_dotenv()
+
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL") or None
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+REPLICA_STICKY_SIZE = int(os.getenv("REPLICA_STICKY_SIZE", "100000"))
+
+# user_id → escribió en este proceso hace menos de REPLICA_STICKY_SECONDS (atajo local)
+escrituras_recientes = TTLCache(maxsize=REPLICA_STICKY_SIZE, ttl=REPLICA_STICKY_SECONDS)
+
+# Claves en Session.info
+_LECTURA = "replica_lectura"      # profundidad de @solo_lectura activos
+_PRIMARIO = "replica_primario"    # profundidad de lecturas forzadas al primario (sticky)
+_ESCRITURA = "replica_escritura"  # la transacción actual ya escribió en el primario
+_USUARIOS = "replica_usuarios"    # usuarios con escrituras pendientes de commit
+_AL_DIA = "replica_al_dia"        # usuarios ya comprobados en el bloque de lectura en curso
+_VERSIONES = "replica_versiones"  # user_id → versión leída del primario en la transacción actual
+
+_VERSION = text("SELECT version FROM versiones_usuario WHERE user_id = :user_id")
+
+
+class RoutingSession(Session):
+    """
+    Session con dos binds: `bind` (primario) y `replica` (atributo de clase, ver crear_routing_session)
+    """
+    replica = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        info = self.info
+        if kw.get("bind") is not None:
+            return kw["bind"]
+        if clause is not None and (getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None):
+            info[_ESCRITURA] = True
+        elif (
+            self.replica is not None
+            and info.get(_LECTURA)
+            and not info.get(_PRIMARIO)
+            and not info.get(_ESCRITURA)
+            and not self._flushing
+        ):
+            return self.replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _antes_de_flush(session, flush_context, instances):
+    session.info[_ESCRITURA] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _tras_commit(session):
+    session.info.pop(_ESCRITURA, None)
+    session.info.pop(_VERSIONES, None)
+    for user_id in session.info.pop(_USUARIOS, ()):
+        escrituras_recientes.set(user_id, True)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _tras_rollback(session):
+    session.info.pop(_ESCRITURA, None)
+    session.info.pop(_VERSIONES, None)
+    session.info.pop(_USUARIOS, None)
+
+
+def crear_routing_session(replica_engine):
+    """Subclase de RoutingSession ligada a un motor de réplica (síncrono: para AsyncEngine, .sync_engine)"""
+    return type("RoutingSessionReplica", (RoutingSession,), {"replica": replica_engine})
+
+
+def marcar_escritura(session, user_id: Optional[int]):
+    """
+    Registrar que la transacción de la sesión escribe datos del usuario: tras el commit,
+    las lecturas de este proceso irán al primario durante REPLICA_STICKY_SECONDS
+    """
+    if user_id is not None and isinstance(_sesion_sync(session), RoutingSession):
+        session.info.setdefault(_USUARIOS, set()).add(user_id)
+        session.info.get(_VERSIONES, {}).pop(user_id, None)
+
+
+def recordar_version(session, user_id: int, version: Optional[int]):
+    """
+    Versión del usuario recién leída del primario (dependencia del ETag): replica_al_dia
+    la reutiliza en vez de volver a leerla. Vale hasta el fin de la transacción o la
+    siguiente escritura del usuario
+    """
+    if isinstance(_sesion_sync(session), RoutingSession):
+        session.info.setdefault(_VERSIONES, {})[user_id] = version
+
+
+def _sesion_sync(session):
+    return getattr(session, "sync_session", session)
+
+
+def replica_al_dia(session, user_id: int) -> bool:
+    """
+    La réplica ya aplicó la última escritura del usuario: su versión en versiones_usuario
+    alcanza la del primario (sin fila en el primario: nunca escribió, cualquier réplica vale)
+    La del primario sale de recordar_version si ya se leyó en esta transacción: la lectura
+    será al menos tan reciente como el ETag servido
+    """
+    session = _sesion_sync(session)
+    parametros = {"user_id": user_id}
+    versiones = session.info.get(_VERSIONES, {})
+    if user_id in versiones:
+        en_primario = versiones[user_id]
+    else:
+        en_primario = session.execute(_VERSION, parametros, bind_arguments={"bind": session.bind}).scalar()
+    if en_primario is None:
+        return True
+    en_replica = session.execute(_VERSION, parametros, bind_arguments={"bind": session.replica}).scalar()
+    return en_replica is not None and en_replica >= en_primario
+
+
+def _comprobar_replica(session, user_id: Optional[int]) -> bool:
+    """
+    ¿Hay que mirar las versiones antes de leer de la réplica?
+    No si el usuario escribió en este proceso (primario directamente), si el bloque ya va
+    al primario o si la sesión ya escribió en su transacción (get_bind no usará la réplica)
+    """
+    info = session.info
+    return (
+        user_id is not None
+        and not escrituras_recientes.get(user_id)
+        and not info.get(_PRIMARIO)
+        and not info.get(_ESCRITURA)
+        and user_id not in info.get(_AL_DIA, ())
+    )
+
+
+@contextmanager
+def _bloque(session, user_id: Optional[int], en_primario: bool):
+    info = session.info
+    if user_id is not None and not en_primario:
+        info.setdefault(_AL_DIA, set()).add(user_id)
+    clave = _PRIMARIO if en_primario else _LECTURA
+    info[clave] = info.get(clave, 0) + 1
+    try:
+        yield clave == _LECTURA
+    finally:
+        info[clave] -= 1
+        if not info.get(_LECTURA) and not info.get(_PRIMARIO):
+            info.pop(_AL_DIA, None)
+
+
+@contextmanager
+def lectura(session, user_id: Optional[int] = None):
+    """Bloque de solo lectura: la sesión lee de la réplica salvo read-your-writes del usuario (Session síncrona)"""
+    if not isinstance(_sesion_sync(session), RoutingSession) or _sesion_sync(session).replica is None:
+        yield False
+        return
+    en_primario = user_id is not None and bool(escrituras_recientes.get(user_id))
+    if _comprobar_replica(session, user_id):
+        en_primario = not replica_al_dia(session, user_id)
+    with _bloque(session, user_id, en_primario) as en_replica:
+        yield en_replica
+
+
+@asynccontextmanager
+async def lectura_async(session, user_id: Optional[int] = None):
+    """lectura() para AsyncSession: la comparación de versiones se espera sin bloquear el event loop"""
+    if not isinstance(_sesion_sync(session), RoutingSession) or _sesion_sync(session).replica is None:
+        yield False
+        return
+    en_primario = user_id is not None and bool(escrituras_recientes.get(user_id))
+    if _comprobar_replica(session, user_id):
+        en_primario = not await session.run_sync(replica_al_dia, user_id)
+    with _bloque(session, user_id, en_primario) as en_replica:
+        yield en_replica
+
+
+@contextmanager
+def primario(session):
+    """Bloque que lee siempre del primario (aunque esté dentro de un @solo_lectura)"""
+    if not isinstance(_sesion_sync(session), RoutingSession):
+        yield
+        return
+    info = session.info
+    info[_PRIMARIO] = info.get(_PRIMARIO, 0) + 1
+    try:
+        yield
+    finally:
+        info[_PRIMARIO] -= 1
+
+
+def _sesion_de(objeto):
+    """Sesión de un repositorio (self.session) o de un caso de uso (self.db)"""
+    return getattr(objeto, "session", None) or getattr(objeto, "db", None)
+
+
+def solo_lectura(metodo=None, *, reintentar: bool = False):
+    """
+    Decorador para métodos de repositorios y casos de uso que solo leen
+    El user_id (argumento con ese nombre, si existe) activa read-your-writes para ese usuario
+    reintentar=True: si la réplica devuelve None se repite la lectura en el primario
+    Admite métodos síncronos y corrutinas (repositorios AsyncSession)
+    """
+    def decorar(funcion):
+        parametros = list(inspect.signature(funcion).parameters)
+        posicion = parametros.index("user_id") if "user_id" in parametros else None
+
+        def usuario(args, kwargs):
+            if posicion is None:
+                return None
+            if "user_id" in kwargs:
+                return kwargs["user_id"]
+            return args[posicion] if len(args) > posicion else None
+
+        if inspect.iscoroutinefunction(funcion):
+            @functools.wraps(funcion)
+            async def envoltorio_async(self, *args, **kwargs):
+                session = _sesion_de(self)
+                async with lectura_async(session, usuario((self,) + args, kwargs)) as en_replica:
+                    resultado = await funcion(self, *args, **kwargs)
+                if resultado is None and reintentar and en_replica:
+                    with primario(session):
+                        resultado = await funcion(self, *args, **kwargs)
+                return resultado
+            return envoltorio_async
+
+        @functools.wraps(funcion)
+        def envoltorio(self, *args, **kwargs):
+            session = _sesion_de(self)
+            with lectura(session, usuario((self,) + args, kwargs)) as en_replica:
+                resultado = funcion(self, *args, **kwargs)
+            if resultado is None and reintentar and en_replica:
+                with primario(session):
+                    resultado = funcion(self, *args, **kwargs)
+            return resultado
+        return envoltorio
+
+    return decorar(metodo) if metodo is not None else decorar
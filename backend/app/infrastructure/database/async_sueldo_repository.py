@@ -0,0 +1,65 @@
+"""
+Repositorio asíncrono SQLAlchemy para Sueldo
+Implementa AsyncSueldoRepositoryInterface sobre AsyncSession (asyncpg / aiosqlite)
+"""
+from typing import Optional, List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...domain.repositories.sueldo_repository import AsyncSueldoRepositoryInterface
+from ...domain.entities.sueldo import Sueldo
+from .models import SueldoORM
+from .sueldo_repository import SQLSueldoRepository, COLUMNAS_DOMINIO
+from ..config.replica import solo_lectura
+
+
+class AsyncSQLSueldoRepository(AsyncSueldoRepositoryInterface):
+    """
+    Lecturas nativas con await; las escrituras reutilizan SQLSueldoRepository
+    mediante run_sync sobre la misma conexión (mismo rollup, sin hilos adicionales)
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._sync = SQLSueldoRepository(session.sync_session)
+    
+    async def save(self, sueldo: Sueldo) -> Sueldo:
+        """Guardar sueldo"""
+        return await self.session.run_sync(lambda _: self._sync.save(sueldo))
+    
+    @solo_lectura(reintentar=True)
+    async def find_by_id(self, sueldo_id: int) -> Optional[Sueldo]:
+        """Buscar sueldo por ID"""
+        result = await self.session.execute(select(SueldoORM).where(SueldoORM.id == sueldo_id))
+        sueldo_orm = result.scalar_one_or_none()
+        return self._sync._to_domain(sueldo_orm) if sueldo_orm else None
+    
+    @solo_lectura
+    async def find_all_by_user(self, user_id: int) -> List[Sueldo]:
+        """Obtener todos los sueldos de un usuario"""
+        result = await self.session.execute(select(*COLUMNAS_DOMINIO).where(SueldoORM.user_id == user_id))
+        return self._sync._filas_to_domain(result)
+    
+    @solo_lectura(reintentar=True)
+    async def find_by_user_and_period(self, user_id: int, mes: int, anio: int) -> Optional[Sueldo]:
+        """Buscar sueldo específico de usuario por mes/año"""
+        result = await self.session.execute(
+            select(SueldoORM).where(
+                SueldoORM.user_id == user_id,
+                SueldoORM.mes == mes,
+                SueldoORM.anio == anio
+            )
+        )
+        sueldo_orm = result.scalars().first()
+        return self._sync._to_domain(sueldo_orm) if sueldo_orm else None
+    
+    async def update(self, sueldo: Sueldo) -> Sueldo:
+        """Actualizar sueldo existente"""
+        return await self.session.run_sync(lambda _: self._sync.update(sueldo))
+    
+    async def delete(self, sueldo_id: int) -> bool:
+        """Eliminar sueldo por ID"""
+        return await self.session.run_sync(lambda _: self._sync.delete(sueldo_id))
+    
+    async def upsert_by_period(self, sueldo: Sueldo) -> Sueldo:
+        """Crear o actualizar sueldo según período (regla de negocio única)"""
+        return await self.session.run_sync(lambda _: self._sync.upsert_by_period(sueldo))
@@ -0,0 +1,91 @@
+"""
+Repositorio asíncrono SQLAlchemy para Transaccion
+Implementa AsyncTransaccionRepositoryInterface sobre AsyncSession (asyncpg / aiosqlite)
+"""
+from typing import Optional, List
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...domain.repositories.transaccion_repository import AsyncTransaccionRepositoryInterface
+from ...domain.entities.transaccion import Transaccion
+from .models import TransaccionORM
+from .filtros import filtro_periodo
+from .transaccion_repository import SQLTransaccionRepository, COLUMNAS_DOMINIO
+from ..config.replica import solo_lectura
+
+
+class AsyncSQLTransaccionRepository(AsyncTransaccionRepositoryInterface):
+    """
+    Lecturas nativas con await; las escrituras reutilizan SQLTransaccionRepository
+    mediante run_sync sobre la misma conexión (mismo rollup, sin hilos adicionales)
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._sync = SQLTransaccionRepository(session.sync_session)
+    
+    async def save(self, transaccion: Transaccion) -> Transaccion:
+        """Guardar transacción"""
+        return await self.session.run_sync(lambda _: self._sync.save(transaccion))
+    
+    async def save_many(self, transacciones: List[Transaccion]) -> int:
+        """Insertar un lote de transacciones (sin commit)"""
+        return await self.session.run_sync(lambda _: self._sync.save_many(transacciones))
+    
+    @solo_lectura(reintentar=True)
+    async def find_by_id(self, transaccion_id: int) -> Optional[Transaccion]:
+        """Buscar transacción por ID"""
+        result = await self.session.execute(select(TransaccionORM).where(TransaccionORM.id == transaccion_id))
+        transaccion_orm = result.scalar_one_or_none()
+        return self._sync._to_domain(transaccion_orm) if transaccion_orm else None
+    
+    @solo_lectura
+    async def find_all_by_user(self, user_id: int) -> List[Transaccion]:
+        """Obtener todas las transacciones de un usuario"""
+        result = await self.session.execute(select(*COLUMNAS_DOMINIO).where(TransaccionORM.user_id == user_id))
+        return self._sync._filas_to_domain(result)
+    
+    @solo_lectura
+    async def find_by_user_and_month(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> List[Transaccion]:
+        """Buscar transacciones filtradas por mes/año"""
+        result = await self.session.execute(
+            select(*COLUMNAS_DOMINIO).where(
+                TransaccionORM.user_id == user_id,
+                *filtro_periodo(TransaccionORM.fecha, mes, anio)
+            )
+        )
+        return self._sync._filas_to_domain(result)
+    
+    async def update(self, transaccion: Transaccion) -> Transaccion:
+        """Actualizar transacción existente"""
+        return await self.session.run_sync(lambda _: self._sync.update(transaccion))
+    
+    async def delete(self, transaccion_id: int) -> bool:
+        """Eliminar transacción por ID"""
+        return await self.session.run_sync(lambda _: self._sync.delete(transaccion_id))
+    
+    @solo_lectura
+    async def get_balance_by_user(self, user_id: int) -> float:
+        """Calcular balance total del usuario"""
+        ingresos = await self.get_ingresos_by_user(user_id)
+        gastos = await self.get_gastos_by_user(user_id)
+        return ingresos - gastos
+    
+    @solo_lectura
+    async def get_ingresos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
+        """Sumar ingresos del usuario en período"""
+        return await self._sumar(user_id, "ingreso", mes, anio)
+    
+    @solo_lectura
+    async def get_gastos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
+        """Sumar gastos del usuario en período"""
+        return await self._sumar(user_id, "gasto", mes, anio)
+    
+    async def _sumar(self, user_id: int, tipo: str, mes: Optional[int], anio: Optional[int]) -> float:
+        result = await self.session.execute(
+            select(func.sum(TransaccionORM.cantidad)).where(
+                TransaccionORM.user_id == user_id,
+                TransaccionORM.tipo == tipo,
+                *filtro_periodo(TransaccionORM.fecha, mes, anio)
+            )
+        )
+        return result.scalar() or 0.0
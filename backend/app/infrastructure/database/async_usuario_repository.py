@@ -0,0 +1,64 @@
+"""
+Repositorio asíncrono SQLAlchemy para Usuario
+Implementa AsyncUsuarioRepositoryInterface sobre AsyncSession (asyncpg / aiosqlite)
+"""
+from typing import Optional, List
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...domain.repositories.usuario_repository import AsyncUsuarioRepositoryInterface
+from ...domain.entities.usuario import Usuario
+from .models import UsuarioORM
+from .usuario_repository import SQLUsuarioRepository
+from ..config.replica import solo_lectura
+
+
+class AsyncSQLUsuarioRepository(AsyncUsuarioRepositoryInterface):
+    """
+    Lecturas nativas con await; las escrituras reutilizan SQLUsuarioRepository
+    mediante run_sync sobre la misma conexión
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._sync = SQLUsuarioRepository(session.sync_session)
+    
+    async def create(self, email: str, hashed_password: str, is_active: bool = True) -> Usuario:
+        """Crear usuario"""
+        return await self.session.run_sync(lambda _: self._sync.create(email, hashed_password, is_active))
+    
+    async def save(self, usuario: Usuario) -> Usuario:
+        """Guardar usuario"""
+        return await self.session.run_sync(lambda _: self._sync.save(usuario))
+    
+    @solo_lectura(reintentar=True)
+    async def find_by_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Buscar usuario por ID"""
+        result = await self.session.execute(select(UsuarioORM).where(UsuarioORM.id == usuario_id))
+        usuario_orm = result.scalar_one_or_none()
+        return self._sync._to_domain(usuario_orm) if usuario_orm else None
+    
+    @solo_lectura(reintentar=True)
+    async def find_by_email(self, email: str) -> Optional[Usuario]:
+        """Buscar usuario por email"""
+        result = await self.session.execute(select(UsuarioORM).where(UsuarioORM.email == email))
+        usuario_orm = result.scalar_one_or_none()
+        return self._sync._to_domain(usuario_orm) if usuario_orm else None
+    
+    @solo_lectura
+    async def find_all(self) -> List[Usuario]:
+        """Obtener todos los usuarios"""
+        result = await self.session.execute(select(UsuarioORM))
+        return [self._sync._to_domain(u) for u in result.scalars()]
+    
+    async def update(self, usuario: Usuario) -> Usuario:
+        """Actualizar usuario existente"""
+        return await self.session.run_sync(lambda _: self._sync.update(usuario))
+    
+    async def delete(self, usuario_id: int) -> bool:
+        """Eliminar usuario por ID"""
+        return await self.session.run_sync(lambda _: self._sync.delete(usuario_id))
+    
+    async def exists_by_email(self, email: str) -> bool:
+        """Verificar si existe usuario con email"""
+        result = await self.session.execute(select(func.count()).select_from(UsuarioORM).where(UsuarioORM.email == email))
+        return result.scalar() > 0
@@ -0,0 +1,136 @@
+"""
+Repositorio concreto SQLAlchemy para Balance
+Los meses concretos se leen del rollup resumen_mensual (lectura por clave primaria);
+el resto de filtros se agregan en la base de datos con una sola consulta
+"""
+from typing import Optional, List, Tuple
+from sqlalchemy import select, func, case, cast, extract, literal, union_all, tuple_, Float, Integer
+from sqlalchemy.orm import Session
+from ...domain.repositories.balance_repository import BalanceRepositoryInterface
+from ...domain.entities.balance import Balance
+from ...domain.services.periodo import rango_mes
+from .models import TransaccionORM, SueldoORM
+from .filtros import filtro_periodo
+from .resumen_repository import SQLResumenMensualRepository
+from ..config.replica import solo_lectura
+
+
+def _suma_por_tipo(tipo: str):
+    """SUM condicional: agrega solo las filas del tipo indicado"""
+    return func.coalesce(
+        func.sum(case((TransaccionORM.tipo == tipo, TransaccionORM.cantidad), else_=0.0)),
+        0.0
+    )
+
+
+class SQLBalanceRepository(BalanceRepositoryInterface):
+    """
+    Implementación del cálculo de balances con agregados condicionales
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.resumen = SQLResumenMensualRepository(session)
+
+    @solo_lectura
+    def get_balance(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> Balance:
+        """Balance de un periodo: O(1) sobre el rollup si es un mes concreto"""
+        if mes and anio:
+            rango_mes(mes, anio)  # valida el mes
+            fila = self.resumen.get(user_id, mes, anio)
+            if fila is None:
+                return Balance(mes=mes, anio=anio)
+            return Balance(ingresos=fila.ingresos, gastos=fila.gastos, sueldo=fila.sueldo, mes=mes, anio=anio)
+        return self.calcular_balance(user_id, mes, anio)
+
+    @solo_lectura
+    def get_balances_by_periods(self, user_id: int, periodos: List[Tuple[int, int]]) -> List[Balance]:
+        """Balances de varios meses leyendo el rollup (un barrido por prefijo de la PK)"""
+        if not periodos:
+            return []
+        filas = self.resumen.get_periodos(user_id, periodos)
+        balances = []
+        for mes, anio in periodos:
+            fila = filas.get((mes, anio))
+            if fila is None:
+                balances.append(Balance(mes=mes, anio=anio))
+            else:
+                balances.append(Balance(ingresos=fila.ingresos, gastos=fila.gastos, sueldo=fila.sueldo, mes=mes, anio=anio))
+        return balances
+
+    # ========== CÁLCULO DESDE DATOS CRUDOS ==========
+
+    @solo_lectura
+    def calcular_balance(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> Balance:
+        """
+        SELECT SUM(CASE ingreso), SUM(CASE gasto), (SELECT cantidad FROM sueldos ...)
+        FROM transacciones WHERE user_id = ? AND fecha >= ? AND fecha < ?
+        """
+        sueldo = select(SueldoORM.cantidad).where(SueldoORM.user_id == user_id)
+        if mes:
+            sueldo = sueldo.where(SueldoORM.mes == mes)
+        if anio:
+            sueldo = sueldo.where(SueldoORM.anio == anio)
+        sueldo = sueldo.limit(1).scalar_subquery()
+
+        stmt = select(
+            _suma_por_tipo("ingreso"),
+            _suma_por_tipo("gasto"),
+            sueldo
+        ).where(
+            TransaccionORM.user_id == user_id,
+            *filtro_periodo(TransaccionORM.fecha, mes, anio)
+        )
+        ingresos, gastos, cantidad_sueldo = self.session.execute(stmt).one()
+        return Balance(ingresos=ingresos, gastos=gastos, sueldo=cantidad_sueldo, mes=mes, anio=anio)
+
+    @solo_lectura
+    def calcular_balances_por_periodos(self, user_id: int, periodos: List[Tuple[int, int]]) -> List[Balance]:
+        """
+        Balances de varios meses en un único round trip sin pasar por el rollup:
+        agregados de transacciones agrupados por (anio, mes) UNION ALL los sueldos de esos periodos
+        """
+        if not periodos:
+            return []
+        rangos = [rango_mes(mes, anio) for mes, anio in periodos]
+        inicio = min(r[0] for r in rangos)
+        fin = max(r[1] for r in rangos)
+
+        anio_col = cast(extract('year', TransaccionORM.fecha), Integer)
+        mes_col = cast(extract('month', TransaccionORM.fecha), Integer)
+        transacciones = select(
+            anio_col.label("anio"),
+            mes_col.label("mes"),
+            _suma_por_tipo("ingreso").label("ingresos"),
+            _suma_por_tipo("gasto").label("gastos"),
+            cast(literal(0.0), Float).label("sueldo")
+        ).where(
+            TransaccionORM.user_id == user_id,
+            *filtro_periodo(TransaccionORM.fecha, desde=inicio, hasta=fin)
+        ).group_by(anio_col, mes_col)
+
+        sueldos = select(
+            SueldoORM.anio,
+            SueldoORM.mes,
+            cast(literal(0.0), Float),
+            cast(literal(0.0), Float),
+            SueldoORM.cantidad
+        ).where(
+            SueldoORM.user_id == user_id,
+            tuple_(SueldoORM.mes, SueldoORM.anio).in_(periodos)
+        )
+
+        combinado = union_all(transacciones, sueldos).subquery()
+        stmt = select(
+            combinado.c.anio,
+            combinado.c.mes,
+            func.sum(combinado.c.ingresos),
+            func.sum(combinado.c.gastos),
+            func.max(combinado.c.sueldo)
+        ).group_by(combinado.c.anio, combinado.c.mes)
+
+        por_periodo = {
+            (mes, anio): Balance(ingresos=ingresos, gastos=gastos, sueldo=sueldo, mes=mes, anio=anio)
+            for anio, mes, ingresos, gastos, sueldo in self.session.execute(stmt)
+        }
+        return [por_periodo.get((mes, anio)) or Balance(mes=mes, anio=anio) for mes, anio in periodos]
@@ -0,0 +1,28 @@
+"""
+Publicación de eventos de dominio tras el commit
+Los repositorios y casos de uso registran eventos en la sesión; se publican en el bus
+solo si la transacción se confirma (y se descartan si se revierte)
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ...domain.services.event_bus import event_bus
+from ...domain.services.eventos import EventoDominio
+
+_PENDIENTES = "eventos_pendientes"
+
+
+def registrar_evento(session, evento: EventoDominio):
+    """Encolar un evento en la transacción actual de la sesión (Session o AsyncSession)"""
+    session.info.setdefault(_PENDIENTES, []).append(evento)
+
+
+@event.listens_for(Session, "after_commit")
+def _publicar_tras_commit(session):
+    for evento in session.info.pop(_PENDIENTES, ()):
+        event_bus.publicar(evento)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_tras_rollback(session):
+    session.info.pop(_PENDIENTES, None)
@@ -0,0 +1,35 @@
+"""
+Filtros SQL reutilizables - Infrastructure Layer
+Traduce periodos de dominio a predicados que pueden usar índices sobre la columna de fecha
+"""
+from typing import List, Optional
+from sqlalchemy import extract
+from ...domain.services.periodo import rango_periodo
+
+
+def filtro_periodo(
+    columna,
+    mes: Optional[int] = None,
+    anio: Optional[int] = None,
+    desde=None,
+    hasta=None
+) -> List:
+    """
+    Construir condiciones `columna >= inicio AND columna < fin` para un periodo
+
+    Uso: query.filter(*filtro_periodo(TransaccionORM.fecha, mes, anio))
+    A diferencia de extract('month', ...) el predicado es sargable, así que
+    Postgres recorre solo el tramo del índice (user_id, fecha) de ese periodo
+    y, con transacciones particionada por fecha, solo las particiones del rango.
+    """
+    inicio, fin = rango_periodo(mes=mes, anio=anio, desde=desde, hasta=hasta)
+    condiciones = []
+    if inicio is not None:
+        condiciones.append(columna >= inicio)
+    if fin is not None:
+        condiciones.append(columna < fin)
+    # Mes sin año (todos los octubres): no hay rango contiguo, se mantiene extract
+    # (recorre todas las particiones)
+    if mes and not anio:
+        condiciones.append(extract('month', columna) == mes)
+    return condiciones
@@ -1,8 +1,9 @@
 """
 Modelos SQLAlchemy - Infrastructure Layer
 Estos modelos son específicos para PostgreSQL y se usan solo en infrastructure
+El esquema lo crean las migraciones (migrations/): cualquier cambio aquí necesita su revisión
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint, Boolean, ForeignKey, Index, BigInteger
 from sqlalchemy.orm import relationship
 from ..config.database import Base
 import datetime
@@ -15,7 +16,7 @@ class UsuarioORM(Base):
     """
     __tablename__ = "usuarios"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
@@ -32,13 +33,19 @@ class TransaccionORM(Base):
     """
     __tablename__ = "transacciones"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     tipo = Column(String, nullable=False)
     cantidad = Column(Float, nullable=False)
     fecha = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
     descripcion = Column(String, nullable=True)
     user_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
     
+    # Índice compuesto para vistas por usuario/periodo ordenadas por fecha
+    # (cubre rangos `fecha >= inicio AND fecha < fin` y el ORDER BY fecha DESC, id DESC)
+    __table_args__ = (
+        Index('idx_transacciones_user_fecha_id', user_id, fecha.desc(), id.desc()),
+    )
+    
     # Relación inversa
     usuario = relationship("UsuarioORM", back_populates="transacciones")
 
@@ -49,15 +56,47 @@ class SueldoORM(Base):
     """
     __tablename__ = "sueldos"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     cantidad = Column(Float, nullable=False)
     mes = Column(Integer, nullable=False)
     anio = Column(Integer, nullable=False)
     fecha = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
     user_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
     
-    # Constraint único por usuario/mes/año
-    __table_args__ = (UniqueConstraint('mes', 'anio', 'user_id', name='uq_mes_anio_user'),)
+    # Constraint único por usuario/mes/año; el índice por usuario sirve los listados y el ON DELETE de usuarios
+    __table_args__ = (
+        UniqueConstraint('mes', 'anio', 'user_id', name='uq_mes_anio_user'),
+        Index('idx_sueldos_user_anio_mes', user_id, anio, mes),
+    )
     
     # Relación inversa
-    usuario = relationship("UsuarioORM", back_populates="sueldos")
\ No newline at end of file
+    usuario = relationship("UsuarioORM", back_populates="sueldos")
+
+
+class ResumenMensualORM(Base):
+    """
+    Modelo SQLAlchemy para el resumen mensual (rollup) - solo para persistencia
+    Se mantiene de forma incremental en la misma transacción que cada escritura
+    de transacciones/sueldos; se puede reconstruir con `python -m app.tools.reconstruir_resumen`
+    """
+    __tablename__ = "resumen_mensual"
+    
+    user_id = Column(Integer, ForeignKey("usuarios.id"), primary_key=True)
+    anio = Column(Integer, primary_key=True)
+    mes = Column(Integer, primary_key=True)
+    ingresos = Column(Float, nullable=False, default=0.0)
+    gastos = Column(Float, nullable=False, default=0.0)
+    num_transacciones = Column(Integer, nullable=False, default=0)
+    sueldo = Column(Float, nullable=False, default=0.0)
+
+
+class VersionUsuarioORM(Base):
+    """
+    Versión de los datos de cada usuario - solo para persistencia
+    Crece en la misma transacción que cada escritura de transacciones/sueldos;
+    los GET la exponen como ETag para responder 304 sin recalcular nada
+    """
+    __tablename__ = "versiones_usuario"
+    
+    user_id = Column(Integer, ForeignKey("usuarios.id"), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
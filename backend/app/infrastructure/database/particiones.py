@@ -0,0 +1,215 @@
+"""
+Particionado declarativo por rango de fecha de `transacciones` (solo PostgreSQL)
+
+- Una partición por mes (transacciones_p2025_01) o por año (transacciones_p2025),
+  más transacciones_default para las filas fuera de cualquier rango
+- La PK pasa a ser (id, fecha): la clave de partición debe formar parte de ella.
+  El ORM sigue identificando por id (la secuencia lo mantiene único)
+- Las consultas con `fecha >= inicio AND fecha < fin` (filtro_periodo) solo visitan
+  las particiones del periodo: el mes en curso cabe en memoria aunque crezca el histórico,
+  y VACUUM / índices trabajan por partición
+
+migrar_a_particiones convierte la tabla existente (una vez; ver app.tools.particiones) y
+asegurar_particiones crea las de los próximos meses (paso previo al arranque del contenedor
+y cron diario: `python -m app.tools.particiones crear`; los workers no ejecutan DDL).
+En SQLite o con la tabla sin particionar ambas funciones no hacen nada.
+"""
+import logging
+import os
+import re
+from datetime import date
+from typing import List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+load_dotenv()
+
+logger = logging.getLogger("app.particiones")
+
+TABLA = "transacciones"
+PARTICION_DEFAULT = f"{TABLA}_default"
+GRANULARIDADES = ("mes", "anio")
+TRANSACCIONES_PARTICIONES = os.getenv("TRANSACCIONES_PARTICIONES", "mes")  # granularidad al migrar
+PARTICIONES_FUTURAS = int(os.getenv("PARTICIONES_FUTURAS", "3"))  # periodos por delante del actual
+
+# Bloqueo consultivo: varios contenedores arrancando a la vez (o el cron) no crean la misma partición
+_CLAVE_BLOQUEO = 74_201_001
+_NOMBRE = re.compile(rf"^{TABLA}_p(\d{{4}})(?:_(\d{{2}}))?$")
+
+Periodo = Tuple[str, date, date]  # (nombre, inicio, fin)
+
+
+def _siguiente(inicio: date, granularidad: str) -> date:
+    if granularidad == "anio":
+        return date(inicio.year + 1, 1, 1)
+    return date(inicio.year + 1, 1, 1) if inicio.month == 12 else date(inicio.year, inicio.month + 1, 1)
+
+
+def _inicio_periodo(dia: date, granularidad: str) -> date:
+    return date(dia.year, 1, 1) if granularidad == "anio" else date(dia.year, dia.month, 1)
+
+
+def nombre_particion(inicio: date, granularidad: str) -> str:
+    if granularidad == "anio":
+        return f"{TABLA}_p{inicio.year}"
+    return f"{TABLA}_p{inicio.year}_{inicio.month:02d}"
+
+
+def periodos_particion(desde: date, hasta: date, granularidad: str = "mes") -> List[Periodo]:
+    """Particiones que cubren [desde, hasta] completos (ambos extremos incluidos)"""
+    if granularidad not in GRANULARIDADES:
+        raise ValueError(f"Granularidad '{granularidad}' no válida: use {' o '.join(GRANULARIDADES)}")
+    periodos = []
+    inicio = _inicio_periodo(desde, granularidad)
+    while inicio <= hasta:
+        fin = _siguiente(inicio, granularidad)
+        periodos.append((nombre_particion(inicio, granularidad), inicio, fin))
+        inicio = fin
+    return periodos
+
+
+def periodos_futuros(hoy: date, futuras: int, granularidad: str) -> List[Periodo]:
+    """El periodo actual y los `futuras` siguientes"""
+    fin = _inicio_periodo(hoy, granularidad)
+    for _ in range(futuras):
+        fin = _siguiente(fin, granularidad)
+    return periodos_particion(hoy, fin, granularidad)
+
+
+# ========== CONSULTAS DE CATÁLOGO ==========
+
+def esta_particionada(conn) -> bool:
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.execute(
+        text("SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+             "WHERE c.relname = :tabla AND pg_table_is_visible(c.oid)"),
+        {"tabla": TABLA}
+    ).first() is not None
+
+
+def particiones_existentes(conn) -> List[str]:
+    return list(conn.execute(
+        text("SELECT hija.relname FROM pg_inherits i "
+             "JOIN pg_class padre ON padre.oid = i.inhparent JOIN pg_class hija ON hija.oid = i.inhrelid "
+             "WHERE padre.relname = :tabla AND pg_table_is_visible(padre.oid) ORDER BY hija.relname"),
+        {"tabla": TABLA}
+    ).scalars())
+
+
+def granularidad_actual(nombres: List[str]) -> Optional[str]:
+    """Deducir mes/año de los nombres de las particiones existentes"""
+    for nombre in nombres:
+        coincidencia = _NOMBRE.match(nombre)
+        if coincidencia:
+            return "mes" if coincidencia.group(2) else "anio"
+    return None
+
+
+# ========== DDL ==========
+
+def _crear_particion(conn, nombre: str, inicio: date, fin: date, con_default: bool = True):
+    """
+    Crear una partición; si la default ya tiene filas de ese rango (p. ej. fechas futuras
+    insertadas antes de crearla), se mueven a la nueva antes de adjuntarla
+    """
+    rango = {"inicio": inicio, "fin": fin}
+    hay_filas = con_default and conn.execute(
+        text(f"SELECT 1 FROM {PARTICION_DEFAULT} WHERE fecha >= :inicio AND fecha < :fin LIMIT 1"), rango
+    ).first()
+    limites = f"FOR VALUES FROM ('{inicio.isoformat()}') TO ('{fin.isoformat()}')"
+    if not hay_filas:
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {nombre} PARTITION OF {TABLA} {limites}"))
+        return
+    conn.execute(text(f"CREATE TABLE {nombre} (LIKE {TABLA} INCLUDING DEFAULTS)"))
+    conn.execute(text(
+        f"WITH movidas AS (DELETE FROM {PARTICION_DEFAULT} WHERE fecha >= :inicio AND fecha < :fin RETURNING *) "
+        f"INSERT INTO {nombre} SELECT * FROM movidas"
+    ), rango)
+    conn.execute(text(f"ALTER TABLE {TABLA} ATTACH PARTITION {nombre} {limites}"))
+
+
+def asegurar_particiones(engine, futuras: int = PARTICIONES_FUTURAS, hoy: Optional[date] = None) -> List[str]:
+    """
+    Crear (si faltan) las particiones del periodo actual y de los `futuras` siguientes
+    Idempotente y seguro con varios procesos. Devuelve los nombres creados.
+    """
+    if engine.dialect.name != "postgresql":
+        return []
+    creadas = []
+    with engine.begin() as conn:
+        if not esta_particionada(conn):
+            return []
+        conn.execute(text("SELECT pg_advisory_xact_lock(:clave)"), {"clave": _CLAVE_BLOQUEO})
+        existentes = set(particiones_existentes(conn))
+        granularidad = granularidad_actual(existentes) or TRANSACCIONES_PARTICIONES
+        for nombre, inicio, fin in periodos_futuros(hoy or date.today(), futuras, granularidad):
+            if nombre not in existentes:
+                _crear_particion(conn, nombre, inicio, fin, PARTICION_DEFAULT in existentes)
+                creadas.append(nombre)
+    if creadas:
+        logger.info("Particiones creadas: %s", ", ".join(creadas))
+    return creadas
+
+
+def migrar_a_particiones(engine, granularidad: str = TRANSACCIONES_PARTICIONES, futuras: int = PARTICIONES_FUTURAS,
+                         conservar_original: bool = True, hoy: Optional[date] = None) -> dict:
+    """
+    Convertir `transacciones` en tabla particionada en una única transacción (DDL transaccional):
+    1. la tabla actual pasa a transacciones_sin_particionar (con sus índices renombrados)
+    2. se crea la tabla padre con la misma estructura, PK (id, fecha), FK e índice (user_id, fecha DESC, id DESC)
+    3. particiones desde el mes de la fila más antigua hasta `futuras` periodos por delante, más la default
+    4. INSERT ... SELECT de todas las filas; la secuencia de id pasa a la nueva tabla
+    Bloquea escrituras en transacciones mientras dura: ejecutar en una ventana de mantenimiento.
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("El particionado declarativo solo está disponible en PostgreSQL")
+    if granularidad not in GRANULARIDADES:
+        raise ValueError(f"Granularidad '{granularidad}' no válida: use {' o '.join(GRANULARIDADES)}")
+    original = f"{TABLA}_sin_particionar"
+    hoy = hoy or date.today()
+    with engine.begin() as conn:
+        if esta_particionada(conn):
+            raise RuntimeError(f"La tabla {TABLA} ya está particionada")
+        conn.execute(text(f"LOCK TABLE {TABLA} IN ACCESS EXCLUSIVE MODE"))
+        primera = conn.execute(text(f"SELECT min(fecha) FROM {TABLA}")).scalar()
+
+        conn.execute(text(f"ALTER TABLE {TABLA} RENAME TO {original}"))
+        indices = conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :tabla AND schemaname = current_schema()"),
+            {"tabla": original}
+        ).scalars().all()
+        for indice in indices:
+            conn.execute(text(f'ALTER INDEX "{indice}" RENAME TO "{indice[:50]}_sin_particionar"'))
+
+        conn.execute(text(
+            f"CREATE TABLE {TABLA} (LIKE {original} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (fecha)"
+        ))
+        conn.execute(text(f"ALTER TABLE {TABLA} ADD CONSTRAINT {TABLA}_pkey PRIMARY KEY (id, fecha)"))
+        conn.execute(text(
+            f"ALTER TABLE {TABLA} ADD CONSTRAINT fk_{TABLA}_user FOREIGN KEY (user_id) REFERENCES usuarios(id)"
+        ))
+        conn.execute(text(f"CREATE INDEX idx_{TABLA}_user_fecha_id ON {TABLA} (user_id, fecha DESC, id DESC)"))
+
+        periodos = periodos_futuros(hoy, futuras, granularidad)
+        if primera is not None and primera.date() < periodos[0][1]:
+            periodos = periodos_particion(primera.date(), periodos[0][1], granularidad)[:-1] + periodos
+        for nombre, inicio, fin in periodos:
+            conn.execute(text(
+                f"CREATE TABLE {nombre} PARTITION OF {TABLA} FOR VALUES FROM ('{inicio.isoformat()}') TO ('{fin.isoformat()}')"
+            ))
+        conn.execute(text(f"CREATE TABLE {PARTICION_DEFAULT} PARTITION OF {TABLA} DEFAULT"))
+
+        columnas = "id, tipo, cantidad, descripcion, fecha, user_id"
+        filas = conn.execute(text(f"INSERT INTO {TABLA} ({columnas}) SELECT {columnas} FROM {original}")).rowcount
+        secuencia = conn.execute(text(f"SELECT pg_get_serial_sequence('{original}', 'id')")).scalar()
+        if secuencia:
+            conn.execute(text(f"ALTER SEQUENCE {secuencia} OWNED BY {TABLA}.id"))
+        if not conservar_original:
+            conn.execute(text(f"DROP TABLE {original}"))
+    with engine.connect() as conn:
+        # Estadísticas del padre y de las particiones para el planificador
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text(f"ANALYZE {TABLA}"))
+    logger.info("%s particionada por %s: %d filas en %d particiones", TABLA, granularidad, filas, len(periodos) + 1)
+    return {"filas": filas, "particiones": len(periodos) + 1, "original": None if not conservar_original else original}
@@ -0,0 +1,206 @@
+"""
+Repositorio SQLAlchemy para el rollup resumen_mensual
+Mantiene (user_id, anio, mes) → ingresos, gastos, nº de transacciones y sueldo
+
+Ningún método hace commit: los deltas se aplican dentro de la transacción
+de la escritura que los origina, de modo que rollup y datos nunca divergen.
+"""
+from datetime import datetime
+from typing import Optional, Iterable, List, Tuple
+from sqlalchemy import select, delete, func, case, cast, extract, literal, union_all, Float, Integer
+from sqlalchemy.orm import Session
+from .models import ResumenMensualORM, TransaccionORM, SueldoORM
+
+
+class SQLResumenMensualRepository:
+    """
+    Acceso al rollup mensual: upserts atómicos con incremento y lecturas por clave primaria
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # ========== ESCRITURA INCREMENTAL ==========
+
+    def aplicar_transaccion(self, user_id: int, fecha: datetime, tipo: str, cantidad: float, signo: int = 1):
+        """Sumar (signo=1) o restar (signo=-1) una transacción al mes de su fecha"""
+        self._incrementar(
+            user_id, fecha.year, fecha.month,
+            ingresos=signo * cantidad if tipo == "ingreso" else 0.0,
+            gastos=signo * cantidad if tipo == "gasto" else 0.0,
+            num_transacciones=signo
+        )
+
+    def mover_transaccion(self, user_id: int, anterior: Tuple[datetime, str, float], nueva: Tuple[datetime, str, float]):
+        """Actualización: restar el estado anterior y sumar el nuevo (ajusta ambos meses si cambia la fecha)"""
+        self.aplicar_transaccion(user_id, *anterior, signo=-1)
+        self.aplicar_transaccion(user_id, *nueva, signo=1)
+
+    def aplicar_lote(self, user_id: int, movimientos: Iterable[Tuple[datetime, str, float, int]]):
+        """
+        Aplicar un lote de movimientos (fecha, tipo, cantidad, signo) con un upsert por mes
+        en lugar de uno por fila (importaciones y operaciones en bloque)
+        """
+        deltas = {}
+        for fecha, tipo, cantidad, signo in movimientos:
+            ingresos, gastos, n = deltas.get((fecha.year, fecha.month), (0.0, 0.0, 0))
+            if tipo == "ingreso":
+                ingresos += signo * cantidad
+            else:
+                gastos += signo * cantidad
+            deltas[(fecha.year, fecha.month)] = (ingresos, gastos, n + signo)
+        for (anio, mes), (ingresos, gastos, n) in sorted(deltas.items()):
+            self._incrementar(user_id, anio, mes, ingresos=ingresos, gastos=gastos, num_transacciones=n)
+
+    def fijar_sueldo(self, user_id: int, mes: int, anio: int, cantidad: float):
+        """Guardar el sueldo del periodo (0 al eliminarlo)"""
+        insert = self._insert()
+        if insert is None:
+            fila = self._fila_para_actualizar(user_id, anio, mes)
+            fila.sueldo = cantidad
+            return
+        stmt = insert.values(
+            user_id=user_id, anio=anio, mes=mes,
+            ingresos=0.0, gastos=0.0, num_transacciones=0, sueldo=cantidad
+        )
+        self.session.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "anio", "mes"],
+            set_={"sueldo": stmt.excluded.sueldo}
+        ))
+
+    def _incrementar(self, user_id: int, anio: int, mes: int, ingresos: float, gastos: float, num_transacciones: int):
+        """INSERT ... ON CONFLICT DO UPDATE SET col = col + excluded.col"""
+        insert = self._insert()
+        if insert is None:
+            fila = self._fila_para_actualizar(user_id, anio, mes)
+            fila.ingresos += ingresos
+            fila.gastos += gastos
+            fila.num_transacciones += num_transacciones
+            return
+        stmt = insert.values(
+            user_id=user_id, anio=anio, mes=mes,
+            ingresos=ingresos, gastos=gastos, num_transacciones=num_transacciones, sueldo=0.0
+        )
+        self.session.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "anio", "mes"],
+            set_={
+                "ingresos": ResumenMensualORM.ingresos + stmt.excluded.ingresos,
+                "gastos": ResumenMensualORM.gastos + stmt.excluded.gastos,
+                "num_transacciones": ResumenMensualORM.num_transacciones + stmt.excluded.num_transacciones,
+            }
+        ))
+
+    def _insert(self):
+        """INSERT con soporte ON CONFLICT del dialecto (None si el motor no lo soporta)"""
+        dialecto = self.session.get_bind().dialect.name
+        if dialecto == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialecto == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            return None
+        return insert(ResumenMensualORM)
+
+    def _fila_para_actualizar(self, user_id: int, anio: int, mes: int) -> ResumenMensualORM:
+        """Camino genérico (sin ON CONFLICT): SELECT ... FOR UPDATE y crear si no existe"""
+        fila = self.session.execute(
+            select(ResumenMensualORM)
+            .where(ResumenMensualORM.user_id == user_id, ResumenMensualORM.anio == anio, ResumenMensualORM.mes == mes)
+            .with_for_update()
+        ).scalar_one_or_none()
+        if fila is None:
+            fila = ResumenMensualORM(user_id=user_id, anio=anio, mes=mes, ingresos=0.0, gastos=0.0, num_transacciones=0, sueldo=0.0)
+            self.session.add(fila)
+            self.session.flush()
+        return fila
+
+    # ========== LECTURA ==========
+
+    def get(self, user_id: int, mes: int, anio: int) -> Optional[ResumenMensualORM]:
+        """Lectura O(1) por clave primaria"""
+        return self.session.execute(
+            select(
+                ResumenMensualORM.ingresos,
+                ResumenMensualORM.gastos,
+                ResumenMensualORM.num_transacciones,
+                ResumenMensualORM.sueldo
+            ).where(
+                ResumenMensualORM.user_id == user_id,
+                ResumenMensualORM.anio == anio,
+                ResumenMensualORM.mes == mes
+            )
+        ).one_or_none()
+
+    def get_periodos(self, user_id: int, periodos: List[Tuple[int, int]]) -> dict:
+        """Filas de varios periodos (mes, anio) → {(mes, anio): fila}; barrido del prefijo de la PK"""
+        anios = sorted({anio for _, anio in periodos})
+        filas = self.session.execute(
+            select(
+                ResumenMensualORM.mes,
+                ResumenMensualORM.anio,
+                ResumenMensualORM.ingresos,
+                ResumenMensualORM.gastos,
+                ResumenMensualORM.num_transacciones,
+                ResumenMensualORM.sueldo
+            ).where(
+                ResumenMensualORM.user_id == user_id,
+                ResumenMensualORM.anio.between(anios[0], anios[-1])
+            )
+        )
+        buscados = set(periodos)
+        return {(f.mes, f.anio): f for f in filas if (f.mes, f.anio) in buscados}
+
+    # ========== RECONSTRUCCIÓN ==========
+
+    def reconstruir(self, user_id: Optional[int] = None) -> int:
+        """
+        Recalcular el rollup desde transacciones y sueldos (todos los usuarios o uno)
+        Devuelve el número de filas generadas. No hace commit.
+        """
+        borrar = delete(ResumenMensualORM)
+        if user_id is not None:
+            borrar = borrar.where(ResumenMensualORM.user_id == user_id)
+        self.session.execute(borrar)
+
+        anio_col = cast(extract('year', TransaccionORM.fecha), Integer)
+        mes_col = cast(extract('month', TransaccionORM.fecha), Integer)
+        transacciones = select(
+            TransaccionORM.user_id.label("user_id"),
+            anio_col.label("anio"),
+            mes_col.label("mes"),
+            func.sum(case((TransaccionORM.tipo == "ingreso", TransaccionORM.cantidad), else_=0.0)).label("ingresos"),
+            func.sum(case((TransaccionORM.tipo == "gasto", TransaccionORM.cantidad), else_=0.0)).label("gastos"),
+            func.count().label("num_transacciones"),
+            cast(literal(0.0), Float).label("sueldo")
+        ).group_by(TransaccionORM.user_id, anio_col, mes_col)
+        sueldos = select(
+            SueldoORM.user_id,
+            SueldoORM.anio,
+            SueldoORM.mes,
+            cast(literal(0.0), Float),
+            cast(literal(0.0), Float),
+            cast(literal(0), Integer),
+            SueldoORM.cantidad
+        )
+        if user_id is not None:
+            transacciones = transacciones.where(TransaccionORM.user_id == user_id)
+            sueldos = sueldos.where(SueldoORM.user_id == user_id)
+
+        combinado = union_all(transacciones, sueldos).subquery()
+        agregado = select(
+            combinado.c.user_id,
+            combinado.c.anio,
+            combinado.c.mes,
+            func.sum(combinado.c.ingresos),
+            func.sum(combinado.c.gastos),
+            func.sum(combinado.c.num_transacciones),
+            func.max(combinado.c.sueldo)
+        ).group_by(combinado.c.user_id, combinado.c.anio, combinado.c.mes)
+
+        resultado = self.session.execute(
+            ResumenMensualORM.__table__.insert().from_select(
+                ["user_id", "anio", "mes", "ingresos", "gastos", "num_transacciones", "sueldo"],
+                agregado
+            )
+        )
+        return resultado.rowcount
@@ -3,10 +3,19 @@ Repositorio concreto SQLAlchemy para Sueldo
 Implementa la interfaz SueldoRepositoryInterface usando PostgreSQL
 """
 from typing import Optional, List
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ...domain.repositories.sueldo_repository import SueldoRepositoryInterface
 from ...domain.entities.sueldo import Sueldo
+from ...domain.services.eventos import SueldoActualizado, SueldoEliminado
 from .models import SueldoORM
+from .resumen_repository import SQLResumenMensualRepository
+from .version_repository import SQLVersionUsuarioRepository
+from .eventos import registrar_evento
+from ..config.replica import solo_lectura
+
+# Columnas de las lecturas de solo lectura, en el orden de Sueldo.from_row
+COLUMNAS_DOMINIO = (SueldoORM.id, SueldoORM.cantidad, SueldoORM.mes, SueldoORM.anio, SueldoORM.user_id, SueldoORM.fecha)
 
 
 class SQLSueldoRepository(SueldoRepositoryInterface):
@@ -16,25 +25,33 @@ class SQLSueldoRepository(SueldoRepositoryInterface):
     
     def __init__(self, session: Session):
         self.session = session
+        self.resumen = SQLResumenMensualRepository(session)
+        self.version = SQLVersionUsuarioRepository(session)
     
     def save(self, sueldo: Sueldo) -> Sueldo:
         """Guardar sueldo"""
         sueldo_orm = self._to_orm(sueldo)
         self.session.add(sueldo_orm)
+        self.resumen.fijar_sueldo(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio, sueldo_orm.cantidad)
+        self.version.incrementar(sueldo_orm.user_id)
+        registrar_evento(self.session, SueldoActualizado(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio, sueldo_orm.cantidad))
         self.session.commit()
         self.session.refresh(sueldo_orm)
         return self._to_domain(sueldo_orm)
     
+    @solo_lectura(reintentar=True)
     def find_by_id(self, sueldo_id: int) -> Optional[Sueldo]:
         """Buscar sueldo por ID"""
         sueldo_orm = self.session.query(SueldoORM).filter(SueldoORM.id == sueldo_id).first()
         return self._to_domain(sueldo_orm) if sueldo_orm else None
     
+    @solo_lectura
     def find_all_by_user(self, user_id: int) -> List[Sueldo]:
         """Obtener todos los sueldos de un usuario"""
-        sueldos_orm = self.session.query(SueldoORM).filter(SueldoORM.user_id == user_id).all()
-        return [self._to_domain(s) for s in sueldos_orm]
+        filas = self.session.execute(select(*COLUMNAS_DOMINIO).where(SueldoORM.user_id == user_id))
+        return self._filas_to_domain(filas)
     
+    @solo_lectura(reintentar=True)
     def find_by_user_and_period(self, user_id: int, mes: int, anio: int) -> Optional[Sueldo]:
         """Buscar sueldo específico de usuario por mes/año"""
         sueldo_orm = self.session.query(SueldoORM).filter(
@@ -50,10 +67,18 @@ class SQLSueldoRepository(SueldoRepositoryInterface):
         sueldo_orm = self.session.query(SueldoORM).filter(SueldoORM.id == sueldo.id).first()
         if not sueldo_orm:
             raise ValueError(f"Sueldo con ID {sueldo.id} no encontrado")
+        
+        # Rollup: si cambia el periodo, el mes anterior se queda sin sueldo
+        if (sueldo_orm.mes, sueldo_orm.anio) != (sueldo.mes, sueldo.anio):
+            self.resumen.fijar_sueldo(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio, 0.0)
+            registrar_evento(self.session, SueldoEliminado(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio))
             
         sueldo_orm.cantidad = sueldo.cantidad
         sueldo_orm.mes = sueldo.mes
         sueldo_orm.anio = sueldo.anio
+        self.resumen.fijar_sueldo(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio, sueldo_orm.cantidad)
+        self.version.incrementar(sueldo_orm.user_id)
+        registrar_evento(self.session, SueldoActualizado(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio, sueldo_orm.cantidad))
         
         self.session.commit()
         return self._to_domain(sueldo_orm)
@@ -64,6 +89,9 @@ class SQLSueldoRepository(SueldoRepositoryInterface):
         if not sueldo_orm:
             return False
             
+        self.resumen.fijar_sueldo(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio, 0.0)
+        self.version.incrementar(sueldo_orm.user_id)
+        registrar_evento(self.session, SueldoEliminado(sueldo_orm.user_id, sueldo_orm.mes, sueldo_orm.anio))
         self.session.delete(sueldo_orm)
         self.session.commit()
         return True
@@ -83,6 +111,9 @@ class SQLSueldoRepository(SueldoRepositoryInterface):
         if sueldo_existente_orm:
             # Actualizar existente
             sueldo_existente_orm.cantidad = sueldo.cantidad
+            self.resumen.fijar_sueldo(sueldo.user_id, sueldo.mes, sueldo.anio, sueldo.cantidad)
+            self.version.incrementar(sueldo.user_id)
+            registrar_evento(self.session, SueldoActualizado(sueldo.user_id, sueldo.mes, sueldo.anio, sueldo.cantidad))
             self.session.commit()
             self.session.refresh(sueldo_existente_orm)
             return self._to_domain(sueldo_existente_orm)
@@ -104,12 +135,19 @@ class SQLSueldoRepository(SueldoRepositoryInterface):
         )
     
     def _to_domain(self, sueldo_orm: SueldoORM) -> Sueldo:
-        """Convertir modelo ORM → entidad de dominio"""
-        return Sueldo(
+        """Convertir modelo ORM → entidad de dominio (datos persistidos: sin revalidar)"""
+        return Sueldo.from_row(
             id=sueldo_orm.id,
             cantidad=sueldo_orm.cantidad,
             mes=sueldo_orm.mes,
             anio=sueldo_orm.anio,
             user_id=sueldo_orm.user_id,
             fecha=sueldo_orm.fecha
-        )
\ No newline at end of file
+        )
+    
+    def _filas_to_domain(self, filas) -> List[Sueldo]:
+        """
+        Filas Core (COLUMNAS_DOMINIO) → entidades de dominio
+        Sin instancias ORM: no pasan por el identity map ni por el unit of work
+        """
+        return [Sueldo.from_row(*fila) for fila in filas]
\ No newline at end of file
@@ -2,12 +2,26 @@
 Repositorio concreto SQLAlchemy para Transaccion
 Implementa la interfaz TransaccionRepositoryInterface usando PostgreSQL
 """
+import csv
+import io
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, insert, select
 from ...domain.repositories.transaccion_repository import TransaccionRepositoryInterface
 from ...domain.entities.transaccion import Transaccion
+from ...domain.services.eventos import TransaccionCreada, TransaccionEliminada, TransaccionesImportadas, TransaccionModificada
 from .models import TransaccionORM
+from .filtros import filtro_periodo
+from .resumen_repository import SQLResumenMensualRepository
+from .version_repository import SQLVersionUsuarioRepository
+from .eventos import registrar_evento
+from ..config.replica import solo_lectura
+
+# Columnas de las lecturas de solo lectura, en el orden de Transaccion.from_row
+COLUMNAS_DOMINIO = (
+    TransaccionORM.id, TransaccionORM.tipo, TransaccionORM.cantidad,
+    TransaccionORM.user_id, TransaccionORM.fecha, TransaccionORM.descripcion,
+)
 
 
 class SQLTransaccionRepository(TransaccionRepositoryInterface):
@@ -17,46 +31,109 @@ class SQLTransaccionRepository(TransaccionRepositoryInterface):
     
     def __init__(self, session: Session):
         self.session = session
+        self.resumen = SQLResumenMensualRepository(session)
+        self.version = SQLVersionUsuarioRepository(session)
     
     def save(self, transaccion: Transaccion) -> Transaccion:
         """Guardar transacción"""
         transaccion_orm = self._to_orm(transaccion)
         self.session.add(transaccion_orm)
+        self.session.flush()
+        self.resumen.aplicar_transaccion(transaccion_orm.user_id, transaccion_orm.fecha, transaccion_orm.tipo, transaccion_orm.cantidad)
+        self.version.incrementar(transaccion_orm.user_id)
+        registrar_evento(self.session, TransaccionCreada(
+            transaccion_orm.user_id, transaccion_orm.id, transaccion_orm.fecha, transaccion_orm.tipo, transaccion_orm.cantidad
+        ))
         self.session.commit()
         self.session.refresh(transaccion_orm)
         return self._to_domain(transaccion_orm)
     
+    def save_many(self, transacciones: List[Transaccion]) -> int:
+        """
+        Insertar un lote de transacciones: COPY en PostgreSQL (psycopg2) e INSERT
+        multi-fila en el resto. El rollup recibe un delta por usuario y mes. No hace commit.
+        """
+        if not transacciones:
+            return 0
+        filas = [
+            {"user_id": t.user_id, "tipo": t.tipo, "cantidad": t.cantidad, "fecha": t.fecha, "descripcion": t.descripcion}
+            for t in transacciones
+        ]
+        self.insertar_filas(filas)
+        por_usuario = {}
+        for t in transacciones:
+            por_usuario.setdefault(t.user_id, []).append((t.fecha, t.tipo, t.cantidad, 1))
+        for user_id, movimientos in por_usuario.items():
+            self.resumen.aplicar_lote(user_id, movimientos)
+            self.version.incrementar(user_id)
+            periodos = tuple(sorted({(fecha.month, fecha.year) for fecha, _, _, _ in movimientos}, key=lambda p: (p[1], p[0])))
+            registrar_evento(self.session, TransaccionesImportadas(user_id, len(movimientos), periodos))
+        return len(filas)
+    
+    def insertar_filas(self, filas: List[dict]) -> int:
+        """
+        Inserción en bloque de filas ya validadas (user_id, tipo, cantidad, fecha, descripcion)
+        sin tocar el rollup ni la versión: el llamador los mantiene (save_many, app.tools.seed)
+        """
+        if not filas:
+            return 0
+        if self.session.get_bind().dialect.driver == "psycopg2":
+            self._copy(filas)
+        else:
+            self.session.execute(insert(TransaccionORM), filas)
+        return len(filas)
+    
+    def _copy(self, filas: List[dict]):
+        """COPY ... FROM STDIN (CSV) sobre la conexión de la sesión, dentro de su transacción"""
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer)
+        for f in filas:
+            escritor.writerow([f["user_id"], f["tipo"], f["cantidad"], f["fecha"].isoformat(sep=" "), f["descripcion"]])
+        buffer.seek(0)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                "COPY transacciones (user_id, tipo, cantidad, fecha, descripcion) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+    
+    @solo_lectura(reintentar=True)
     def find_by_id(self, transaccion_id: int) -> Optional[Transaccion]:
         """Buscar transacción por ID"""
         transaccion_orm = self.session.query(TransaccionORM).filter(TransaccionORM.id == transaccion_id).first()
         return self._to_domain(transaccion_orm) if transaccion_orm else None
     
+    @solo_lectura
     def find_all_by_user(self, user_id: int) -> List[Transaccion]:
         """Obtener todas las transacciones de un usuario"""
-        transacciones_orm = self.session.query(TransaccionORM).filter(TransaccionORM.user_id == user_id).all()
-        return [self._to_domain(t) for t in transacciones_orm]
+        filas = self.session.execute(select(*COLUMNAS_DOMINIO).where(TransaccionORM.user_id == user_id))
+        return self._filas_to_domain(filas)
     
+    @solo_lectura
     def find_by_user_and_month(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> List[Transaccion]:
         """Buscar transacciones filtradas por mes/año"""
-        query = self.session.query(TransaccionORM).filter(TransaccionORM.user_id == user_id)
-        
-        if mes:
-            query = query.filter(extract('month', TransaccionORM.fecha) == mes)
-        if anio:
-            query = query.filter(extract('year', TransaccionORM.fecha) == anio)
-            
-        transacciones_orm = query.all()
-        return [self._to_domain(t) for t in transacciones_orm]
+        stmt = select(*COLUMNAS_DOMINIO).where(
+            TransaccionORM.user_id == user_id,
+            *filtro_periodo(TransaccionORM.fecha, mes, anio)
+        )
+        return self._filas_to_domain(self.session.execute(stmt))
     
     def update(self, transaccion: Transaccion) -> Transaccion:
         """Actualizar transacción existente"""
         transaccion_orm = self.session.query(TransaccionORM).filter(TransaccionORM.id == transaccion.id).first()
         if not transaccion_orm:
             raise ValueError(f"Transacción con ID {transaccion.id} no encontrada")
+        anterior = (transaccion_orm.fecha, transaccion_orm.tipo, transaccion_orm.cantidad)
             
         transaccion_orm.tipo = transaccion.tipo
         transaccion_orm.cantidad = transaccion.cantidad
         transaccion_orm.descripcion = transaccion.descripcion
+        nueva = (transaccion_orm.fecha, transaccion_orm.tipo, transaccion_orm.cantidad)
+        self.resumen.mover_transaccion(transaccion_orm.user_id, anterior, nueva)
+        self.version.incrementar(transaccion_orm.user_id)
+        registrar_evento(self.session, TransaccionModificada(transaccion_orm.user_id, transaccion_orm.id, anterior, nueva))
         
         self.session.commit()
         return self._to_domain(transaccion_orm)
@@ -67,43 +144,43 @@ class SQLTransaccionRepository(TransaccionRepositoryInterface):
         if not transaccion_orm:
             return False
             
+        self.resumen.aplicar_transaccion(
+            transaccion_orm.user_id, transaccion_orm.fecha, transaccion_orm.tipo, transaccion_orm.cantidad, signo=-1
+        )
+        self.version.incrementar(transaccion_orm.user_id)
+        registrar_evento(self.session, TransaccionEliminada(
+            transaccion_orm.user_id, transaccion_orm.id, transaccion_orm.fecha, transaccion_orm.tipo, transaccion_orm.cantidad
+        ))
         self.session.delete(transaccion_orm)
         self.session.commit()
         return True
     
+    @solo_lectura
     def get_balance_by_user(self, user_id: int) -> float:
         """Calcular balance total del usuario"""
         ingresos = self.get_ingresos_by_user(user_id)
         gastos = self.get_gastos_by_user(user_id)
         return ingresos - gastos
     
+    @solo_lectura
     def get_ingresos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
         """Sumar ingresos del usuario en período"""
         query = self.session.query(func.sum(TransaccionORM.cantidad)).filter(
             TransaccionORM.user_id == user_id,
             TransaccionORM.tipo == "ingreso"
         )
-        
-        if mes:
-            query = query.filter(extract('month', TransaccionORM.fecha) == mes)
-        if anio:
-            query = query.filter(extract('year', TransaccionORM.fecha) == anio)
-            
+        query = query.filter(*filtro_periodo(TransaccionORM.fecha, mes, anio))
         result = query.scalar()
         return result or 0.0
     
+    @solo_lectura
     def get_gastos_by_user(self, user_id: int, mes: Optional[int] = None, anio: Optional[int] = None) -> float:
         """Sumar gastos del usuario en período"""
         query = self.session.query(func.sum(TransaccionORM.cantidad)).filter(
             TransaccionORM.user_id == user_id,
             TransaccionORM.tipo == "gasto"
         )
-        
-        if mes:
-            query = query.filter(extract('month', TransaccionORM.fecha) == mes)
-        if anio:
-            query = query.filter(extract('year', TransaccionORM.fecha) == anio)
-            
+        query = query.filter(*filtro_periodo(TransaccionORM.fecha, mes, anio))
         result = query.scalar()
         return result or 0.0
     
@@ -121,12 +198,19 @@ class SQLTransaccionRepository(TransaccionRepositoryInterface):
         )
     
     def _to_domain(self, transaccion_orm: TransaccionORM) -> Transaccion:
-        """Convertir modelo ORM → entidad de dominio"""
-        return Transaccion(
+        """Convertir modelo ORM → entidad de dominio (datos persistidos: sin revalidar)"""
+        return Transaccion.from_row(
             id=transaccion_orm.id,
             tipo=transaccion_orm.tipo,
             cantidad=transaccion_orm.cantidad,
             user_id=transaccion_orm.user_id,
             fecha=transaccion_orm.fecha,
             descripcion=transaccion_orm.descripcion
-        )
\ No newline at end of file
+        )
+    
+    def _filas_to_domain(self, filas) -> List[Transaccion]:
+        """
+        Filas Core (COLUMNAS_DOMINIO) → entidades de dominio
+        Sin instancias ORM: no pasan por el identity map ni por el unit of work
+        """
+        return [Transaccion.from_row(*fila) for fila in filas]
\ No newline at end of file
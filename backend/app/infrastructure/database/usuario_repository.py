@@ -6,13 +6,19 @@ from typing import Optional, List
 from sqlalchemy.orm import Session
 from ...domain.repositories.usuario_repository import UsuarioRepositoryInterface
 from ...domain.entities.usuario import Usuario
+from ...domain.services.eventos import UsuarioActualizado, UsuarioEliminado
 from .models import UsuarioORM
+from .eventos import registrar_evento
+from ..config.replica import solo_lectura
 
 
 class SQLUsuarioRepository(UsuarioRepositoryInterface):
     def create(self, email: str, hashed_password: str, is_active: bool = True):
         usuario_orm = UsuarioORM(email=email, hashed_password=hashed_password, is_active=is_active)
         self.session.add(usuario_orm)
+        self.session.flush()
+        # Como save/update: la caché se invalida al publicarse el evento, tras el commit
+        registrar_evento(self.session, UsuarioActualizado(usuario_orm.id, usuario_orm.email))
         self.session.commit()
         self.session.refresh(usuario_orm)
         print(f"DEBUG USUARIO ORM: id={usuario_orm.id}, email={usuario_orm.email}, created_at={usuario_orm.created_at}")
@@ -32,12 +38,16 @@ class SQLUsuarioRepository(UsuarioRepositoryInterface):
         
         # Guardar en PostgreSQL
         self.session.add(usuario_orm)
+        self.session.flush()
+        # La caché de usuarios se invalida al publicarse el evento, tras el commit
+        registrar_evento(self.session, UsuarioActualizado(usuario_orm.id, usuario_orm.email))
         self.session.commit()
         self.session.refresh(usuario_orm)
         
         # Convertir modelo ORM → entidad de dominio
         return self._to_domain(usuario_orm)
     
+    @solo_lectura(reintentar=True)
     def find_by_id(self, usuario_id: int) -> Optional[Usuario]:
         """Buscar usuario por ID"""
         usuario_orm = self.session.query(UsuarioORM).filter(UsuarioORM.id == usuario_id).first()
@@ -47,6 +57,7 @@ class SQLUsuarioRepository(UsuarioRepositoryInterface):
             
         return self._to_domain(usuario_orm)
     
+    @solo_lectura(reintentar=True)
     def find_by_email(self, email: str) -> Optional[Usuario]:
         """Buscar usuario por email"""
         usuario_orm = self.session.query(UsuarioORM).filter(UsuarioORM.email == email).first()
@@ -56,6 +67,7 @@ class SQLUsuarioRepository(UsuarioRepositoryInterface):
             
         return self._to_domain(usuario_orm)
     
+    @solo_lectura
     def find_all(self) -> List[Usuario]:
         """Obtener todos los usuarios"""
         usuarios_orm = self.session.query(UsuarioORM).all()
@@ -68,10 +80,14 @@ class SQLUsuarioRepository(UsuarioRepositoryInterface):
         if usuario_orm is None:
             raise ValueError(f"Usuario con ID {usuario.id} no encontrado")
         
+        email_anterior = usuario_orm.email
+        
         # Actualizar campos
         usuario_orm.email = usuario.email
         usuario_orm.hashed_password = usuario.hashed_password
         usuario_orm.is_active = usuario.is_active
+        # Tras el commit: la próxima petición autenticada relee (p. ej. is_active)
+        registrar_evento(self.session, UsuarioActualizado(usuario_orm.id, usuario_orm.email, email_anterior))
         
         self.session.commit()
         self.session.refresh(usuario_orm)
@@ -85,6 +101,8 @@ class SQLUsuarioRepository(UsuarioRepositoryInterface):
         if usuario_orm is None:
             return False
         
+        email = usuario_orm.email
+        registrar_evento(self.session, UsuarioEliminado(usuario_id, email))
         self.session.delete(usuario_orm)
         self.session.commit()
         return True
@@ -107,8 +125,8 @@ class SQLUsuarioRepository(UsuarioRepositoryInterface):
         )
     
     def _to_domain(self, usuario_orm: UsuarioORM) -> Usuario:
-        """Convertir modelo ORM → entidad de dominio"""
-        return Usuario(
+        """Convertir modelo ORM → entidad de dominio (datos persistidos: sin revalidar)"""
+        return Usuario.from_row(
             id=usuario_orm.id,
             email=usuario_orm.email,
             hashed_password=usuario_orm.hashed_password,
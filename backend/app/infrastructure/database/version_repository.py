@@ -0,0 +1,63 @@
+"""
+Repositorio SQLAlchemy para versiones_usuario
+Un contador por usuario que crece con cada escritura de sus datos (base de los ETag)
+
+Ningún método de escritura hace commit: el incremento viaja en la transacción de la
+escritura que lo origina, así que la versión nunca adelanta ni atrasa a los datos.
+"""
+from typing import Optional
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from .models import VersionUsuarioORM
+from ..config.replica import marcar_escritura, primario, recordar_version
+
+
+class SQLVersionUsuarioRepository:
+    """
+    Lectura por clave primaria e incremento atómico (upsert) de la versión
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, user_id: int) -> int:
+        """Versión actual (0 si el usuario aún no ha escrito nada)"""
+        # Siempre del primario: una versión atrasada de la réplica daría 304 con datos viejos
+        with primario(self.session):
+            version = self.session.execute(
+                select(VersionUsuarioORM.version).where(VersionUsuarioORM.user_id == user_id)
+            ).scalar_one_or_none()
+        recordar_version(self.session, user_id, version)
+        return version or 0
+
+    def incrementar(self, user_id: int):
+        """INSERT ... ON CONFLICT DO UPDATE SET version = version + 1"""
+        # Toda escritura de datos del usuario pasa por aquí: tras el commit, read-your-writes
+        marcar_escritura(self.session, user_id)
+        dialecto = self.session.get_bind().dialect.name
+        if dialecto == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialecto == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            if not self.session.execute(self._sumar(user_id)).rowcount:
+                self.session.add(VersionUsuarioORM(user_id=user_id, version=1))
+                self.session.flush()
+            return
+        self.session.execute(
+            insert(VersionUsuarioORM).values(user_id=user_id, version=1).on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={"version": VersionUsuarioORM.version + 1}
+            )
+        )
+
+    def incrementar_todos(self, user_id: Optional[int] = None):
+        """Invalidar los ETag existentes (p. ej. tras reconstruir el rollup)"""
+        marcar_escritura(self.session, user_id)
+        self.session.execute(self._sumar(user_id))
+
+    def _sumar(self, user_id: Optional[int]):
+        stmt = update(VersionUsuarioORM).values(version=VersionUsuarioORM.version + 1)
+        if user_id is not None:
+            stmt = stmt.where(VersionUsuarioORM.user_id == user_id)
+        return stmt.execution_options(synchronize_session=False)
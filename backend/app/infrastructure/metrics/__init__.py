@@ -0,0 +1 @@
+# Métricas del proceso en formato de exposición de Prometheus
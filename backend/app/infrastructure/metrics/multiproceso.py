@@ -0,0 +1,137 @@
+"""
+Métricas de varios workers (gunicorn) sumadas en un único /metrics
+
+Cada worker vuelca la instantánea de su registro en METRICS_MULTIPROC_DIR/<pid>.json
+cada METRICS_FLUSH_SECONDS (y al salir); el worker que atiende el scrape vuelca la suya
+y suma todos los ficheros:
+- Contadores e histogramas: los de todos los workers, también los ya terminados
+  (el maestro los acumula en acumulado.json al recoger al hijo: child_exit)
+- Gauges: solo los workers vivos (conexiones del pool, peticiones en curso)
+Los valores de los demás workers llegan con hasta METRICS_FLUSH_SECONDS de retraso.
+"""
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from .registro import Contador, Histograma, Registro, registro as registro_proceso
+
+load_dotenv()
+
+logger = logging.getLogger("app.metrics")
+
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+
+ACUMULADO = "acumulado.json"
+# Workers ya sumados en acumulado.json cuyo fichero aún puede leer un scrape en curso
+_MAX_RETIRADOS = 100
+_ACUMULABLES = (Contador.tipo, Histograma.tipo)
+
+# pid → identidad del proceso: distingue un worker nuevo que reutilice el pid de uno retirado
+# (por pid y no al importar: con preload_app los workers heredan los módulos del maestro)
+_IDENTIDADES = {}
+
+
+def _identidad() -> str:
+    return _IDENTIDADES.setdefault(os.getpid(), uuid.uuid4().hex)
+
+
+def _escribir(ruta: str, datos: dict):
+    """Escritura atómica: un lector nunca ve un fichero a medias"""
+    temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(datos, f)
+    os.replace(temporal, ruta)
+
+
+def _leer(ruta: str) -> Optional[dict]:
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def preparar_directorio(directorio: str):
+    """Al arrancar el servidor (maestro, antes del fork): sin restos de ejecuciones anteriores"""
+    os.makedirs(directorio, exist_ok=True)
+    for nombre in os.listdir(directorio):
+        if nombre.endswith((".json", ".tmp")):
+            os.remove(os.path.join(directorio, nombre))
+
+
+def volcar(directorio: str, registro: Registro = registro_proceso):
+    _escribir(
+        os.path.join(directorio, f"{os.getpid()}.json"),
+        {"id": _identidad(), "metricas": registro.instantanea()}
+    )
+
+
+def iniciar_volcado(directorio: str, intervalo: float = METRICS_FLUSH_SECONDS,
+                    registro: Registro = registro_proceso) -> threading.Event:
+    """Hilo del worker que vuelca su registro periódicamente; set() en el evento lo detiene"""
+    parar = threading.Event()
+
+    def bucle():
+        while not parar.wait(intervalo):
+            try:
+                volcar(directorio, registro)
+            except OSError:
+                logger.exception("No se pudieron volcar las métricas en %s", directorio)
+
+    volcar(directorio, registro)
+    threading.Thread(target=bucle, name="metrics-volcado", daemon=True).start()
+    return parar
+
+
+def retirar_proceso(directorio: str, pid: int):
+    """
+    Maestro, al terminar un worker: sus contadores e histogramas pasan a acumulado.json
+    y su fichero se borra (sus gauges dejan de contar)
+    """
+    ruta = os.path.join(directorio, f"{pid}.json")
+    for nombre in os.listdir(directorio):
+        if nombre.startswith(f"{pid}.json.") and nombre.endswith(".tmp"):  # volcado interrumpido
+            os.remove(os.path.join(directorio, nombre))
+    datos = _leer(ruta)
+    if datos is None:
+        return
+    acumulado = _leer(os.path.join(directorio, ACUMULADO)) or {"retirados": [], "metricas": []}
+    suma = Registro()
+    suma.cargar(acumulado["metricas"])
+    suma.cargar([m for m in datos["metricas"] if m["tipo"] in _ACUMULABLES])
+    _escribir(os.path.join(directorio, ACUMULADO), {
+        "retirados": (acumulado["retirados"] + [datos["id"]])[-_MAX_RETIRADOS:],
+        "metricas": suma.instantanea(),
+    })
+    os.remove(ruta)
+
+
+def agregar(directorio: str) -> Registro:
+    """Suma de las instantáneas de todos los workers (la de este proceso, recién volcada)"""
+    instantaneas: List[dict] = []
+    for nombre in sorted(os.listdir(directorio)):
+        if nombre.endswith(".json") and nombre != ACUMULADO:
+            datos = _leer(os.path.join(directorio, nombre))
+            if datos is not None:
+                instantaneas.append(datos)
+    # acumulado.json al final: si un worker se retiró mientras tanto, o se leyó su fichero
+    # (y figura en "retirados") o ya no estaba (y sus valores están en el acumulado)
+    acumulado = _leer(os.path.join(directorio, ACUMULADO)) or {"retirados": [], "metricas": []}
+    retirados = set(acumulado["retirados"])
+
+    suma = Registro()
+    suma.cargar(acumulado["metricas"])
+    for datos in instantaneas:
+        if datos["id"] not in retirados:
+            suma.cargar(datos["metricas"])
+    return suma
+
+
+def exponer_agregado(directorio: str) -> str:
+    volcar(directorio)
+    return agregar(directorio).exponer()
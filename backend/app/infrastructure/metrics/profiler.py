@@ -0,0 +1,165 @@
+"""
+Perfilador SQL opcional (SQL_PROFILE=true): para desarrollo y diagnóstico, no para producción
+- Registra en el log las sentencias más lentas que SQL_PROFILE_SLOW_MS, con parámetros y ruta
+- Marca como N+1 las peticiones que ejecutan la misma forma de sentencia más de SQL_PROFILE_REPEAT veces
+- Vuelca un resumen por petición (JSON Lines) en SQL_PROFILE_FILE
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+load_dotenv()
+
+SQL_PROFILE = os.getenv("SQL_PROFILE", "false").lower() in ("1", "true", "yes")
+SQL_PROFILE_SLOW_MS = float(os.getenv("SQL_PROFILE_SLOW_MS", "100"))
+SQL_PROFILE_REPEAT = int(os.getenv("SQL_PROFILE_REPEAT", "5"))
+SQL_PROFILE_FILE = os.getenv("SQL_PROFILE_FILE", "sql_profile.jsonl")
+
+logger = logging.getLogger("app.sql_profiler")
+
+# Longitud máxima de sentencias y parámetros en el log y en el volcado
+_MAX_TEXTO = 500
+
+# Marcadores de parámetro de los drivers soportados: ?, :nombre, %(nombre)s, %s, $1
+_PARAMETRO = r"(?:\?|:\w+|%\(\w+\)s|%s|\$\d+)"
+_LISTA_PARAMETROS = re.compile(r"\(\s*" + _PARAMETRO + r"(?:\s*,\s*" + _PARAMETRO + r")*\s*\)")
+_NUMERO = re.compile(r"\b\d+(?:\.\d+)?\b")
+_ESPACIOS = re.compile(r"\s+")
+
+
+def forma_sentencia(sentencia: str) -> str:
+    """
+    Forma normalizada de una sentencia: mismo texto salvo literales y tamaño de listas IN
+    (SELECT ... WHERE id IN (?, ?, ?) y con 5 parámetros tienen la misma forma)
+    """
+    forma = _ESPACIOS.sub(" ", sentencia).strip()
+    forma = _LISTA_PARAMETROS.sub("(?...)", forma)
+    return _NUMERO.sub("?", forma)
+
+
+def _recortar(valor) -> str:
+    texto = valor if isinstance(valor, str) else repr(valor)
+    return texto if len(texto) <= _MAX_TEXTO else texto[:_MAX_TEXTO] + "…"
+
+
+class PerfilPeticion:
+    """Sentencias ejecutadas durante una petición HTTP"""
+    __slots__ = ("metodo", "path", "scope", "inicio", "consultas", "segundos", "lentas", "formas")
+
+    def __init__(self, scope):
+        self.metodo = scope.get("method")
+        self.path = scope.get("path")
+        self.scope = scope
+        self.inicio = time.perf_counter()
+        self.consultas = 0
+        self.segundos = 0.0
+        self.lentas = 0
+        self.formas = Counter()
+
+    @property
+    def ruta(self) -> Optional[str]:
+        """Plantilla de la ruta resuelta por el router (None hasta que se enruta)"""
+        return getattr(self.scope.get("route"), "path", None)
+
+
+_perfil_actual: ContextVar[Optional[PerfilPeticion]] = ContextVar("perfil_sql", default=None)
+
+
+class PerfiladorSQL:
+    """Hooks de ejecución + acumulación por petición + volcado JSONL"""
+
+    def __init__(self, umbral_ms: float = SQL_PROFILE_SLOW_MS, repeticiones: int = SQL_PROFILE_REPEAT, fichero: str = SQL_PROFILE_FILE):
+        self.umbral = umbral_ms / 1000
+        self.repeticiones = repeticiones
+        self.fichero = fichero
+        self._lock = threading.Lock()
+
+    # ----- hooks del engine -----
+
+    def instrumentar_engine(self, engine):
+        """Registrar los listeners en un Engine síncrono (AsyncEngine: pasar .sync_engine)"""
+        event.listen(engine, "before_cursor_execute", self._antes)
+        event.listen(engine, "after_cursor_execute", self._despues)
+        event.listen(engine, "handle_error", self._error)
+
+    def _antes(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("perfil_inicio", []).append(time.perf_counter())
+
+    def _despues(self, conn, cursor, statement, parameters, context, executemany):
+        duracion = time.perf_counter() - conn.info["perfil_inicio"].pop()
+        perfil = _perfil_actual.get()
+        if perfil is not None:
+            perfil.consultas += 1
+            perfil.segundos += duracion
+            perfil.formas[forma_sentencia(statement)] += 1
+        if duracion >= self.umbral:
+            if perfil is not None:
+                perfil.lentas += 1
+            logger.warning(
+                "SQL lenta (%.1f ms) en %s: %s | parámetros: %s",
+                duracion * 1000,
+                f"{perfil.metodo} {perfil.ruta or perfil.path}" if perfil is not None else "fuera de petición",
+                _recortar(_ESPACIOS.sub(" ", statement).strip()),
+                _recortar(parameters),
+            )
+
+    def _error(self, contexto):
+        inicios = contexto.connection.info.get("perfil_inicio") if contexto.connection is not None else None
+        if inicios:
+            inicios.pop()
+
+    # ----- ciclo de vida de la petición -----
+
+    def iniciar_peticion(self, scope):
+        return _perfil_actual.set(PerfilPeticion(scope))
+
+    def finalizar_peticion(self, token, status: int) -> dict:
+        """Cerrar el perfil de la petición: avisar de N+1 y volcar el resumen"""
+        perfil = _perfil_actual.get()
+        _perfil_actual.reset(token)
+        repetidas = [
+            {"sentencia": _recortar(forma), "veces": veces}
+            for forma, veces in perfil.formas.most_common()
+            if veces > self.repeticiones
+        ]
+        resumen = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "method": perfil.metodo,
+            "path": perfil.path,
+            "route": perfil.ruta,
+            "status": status,
+            "duration_ms": round((time.perf_counter() - perfil.inicio) * 1000, 3),
+            "queries": perfil.consultas,
+            "db_ms": round(perfil.segundos * 1000, 3),
+            "slow_queries": perfil.lentas,
+            "n_plus_one": repetidas,
+        }
+        for repetida in repetidas:
+            logger.warning(
+                "Posible N+1 en %s %s: %d ejecuciones de %s",
+                perfil.metodo, perfil.ruta or perfil.path, repetida["veces"], repetida["sentencia"],
+            )
+        self._volcar(resumen)
+        return resumen
+
+    def _volcar(self, resumen: dict):
+        if not self.fichero:
+            return
+        linea = json.dumps(resumen, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.fichero, "a", encoding="utf-8") as fichero:
+                fichero.write(linea)
+
+
+# Perfilador del proceso (solo se engancha si SQL_PROFILE=true)
+perfilador = PerfiladorSQL()
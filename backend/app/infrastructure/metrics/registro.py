@@ -0,0 +1,246 @@
+"""
+Registro de métricas en memoria con exposición en formato de texto de Prometheus
+Contadores, histogramas y gauges calculados en el momento del scrape (p. ej. el pool)
+Seguro entre hilos: los endpoints síncronos corren en el threadpool
+Con varios workers, instantanea()/cargar() permiten sumar los registros de todos (ver multiproceso.py)
+"""
+import math
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Desactivable: sin middleware, sin hooks de SQLAlchemy y sin /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+# Directorio compartido por los workers de un mismo servidor: /metrics suma los de todos
+# (lo fija app.server con varios workers; sin él, cada proceso expone solo lo suyo)
+METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR") or None
+
+# Buckets de latencia (segundos): de 1 ms a 10 s
+BUCKETS_LATENCIA = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Buckets de consultas por petición: detecta endpoints con N+1
+BUCKETS_CONSULTAS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiquetas(nombres: Sequence[str], valores: Sequence, extra: str = "") -> str:
+    pares = [f'{n}="{_escapar(v)}"' for n, v in zip(nombres, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _numero(valor: float) -> str:
+    if valor == math.inf:
+        return "+Inf"
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+class _Metrica:
+    tipo = ""
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._lock = threading.Lock()
+
+    def cabecera(self) -> Iterable[str]:
+        yield f"# HELP {self.nombre} {self.ayuda}"
+        yield f"# TYPE {self.nombre} {self.tipo}"
+
+    def descripcion(self) -> dict:
+        return {"nombre": self.nombre, "tipo": self.tipo, "ayuda": self.ayuda, "etiquetas": list(self.etiquetas)}
+
+
+class Contador(_Metrica):
+    """Valor monótono por combinación de etiquetas"""
+    tipo = "counter"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        super().__init__(nombre, ayuda, etiquetas)
+        self._valores: Dict[Tuple, float] = {}
+
+    def inc(self, *valores, cantidad: float = 1.0):
+        with self._lock:
+            self._valores[valores] = self._valores.get(valores, 0.0) + cantidad
+
+    def valor(self, *valores) -> float:
+        return self._valores.get(valores, 0.0)
+
+    def series(self) -> List[list]:
+        """[[etiquetas, valor], ...] serializable en JSON"""
+        with self._lock:
+            return [[list(clave), valor] for clave, valor in self._valores.items()]
+
+    def cargar(self, series: List[list]):
+        """Sumar series de otro proceso"""
+        for clave, valor in series:
+            self.inc(*clave, cantidad=valor)
+
+    def lineas(self) -> Iterable[str]:
+        with self._lock:
+            valores = list(self._valores.items())
+        for clave, valor in valores:
+            yield f"{self.nombre}{_etiquetas(self.etiquetas, clave)} {_numero(valor)}"
+
+
+class Histograma(_Metrica):
+    """Observaciones agrupadas en buckets acumulados (_bucket, _sum, _count)"""
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = (), buckets: Sequence[float] = BUCKETS_LATENCIA):
+        super().__init__(nombre, ayuda, etiquetas)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple, list] = {}  # clave → [conteos por bucket..., suma, total]
+
+    def observe(self, valor: float, *valores):
+        with self._lock:
+            serie = self._series.get(valores)
+            if serie is None:
+                serie = self._series[valores] = [0] * len(self.buckets) + [0.0, 0]
+            for i, limite in enumerate(self.buckets):
+                if valor <= limite:
+                    serie[i] += 1
+                    break
+            serie[-2] += valor
+            serie[-1] += 1
+
+    def total(self, *valores) -> int:
+        serie = self._series.get(valores)
+        return serie[-1] if serie else 0
+
+    def descripcion(self) -> dict:
+        return {**super().descripcion(), "buckets": list(self.buckets)}
+
+    def series(self) -> List[list]:
+        with self._lock:
+            return [[list(clave), list(serie)] for clave, serie in self._series.items()]
+
+    def cargar(self, series: List[list]):
+        with self._lock:
+            for clave, serie in series:
+                actual = self._series.setdefault(tuple(clave), [0] * len(self.buckets) + [0.0, 0])
+                for i, valor in enumerate(serie):
+                    actual[i] += valor
+
+    def lineas(self) -> Iterable[str]:
+        with self._lock:
+            series = [(clave, list(serie)) for clave, serie in self._series.items()]
+        for clave, serie in series:
+            acumulado = 0
+            for limite, conteo in zip(self.buckets, serie):
+                acumulado += conteo
+                le = 'le="%s"' % _numero(limite)
+                yield f"{self.nombre}_bucket{_etiquetas(self.etiquetas, clave, le)} {acumulado}"
+            le = 'le="+Inf"'
+            yield f"{self.nombre}_bucket{_etiquetas(self.etiquetas, clave, le)} {serie[-1]}"
+            yield f"{self.nombre}_sum{_etiquetas(self.etiquetas, clave)} {_numero(serie[-2])}"
+            yield f"{self.nombre}_count{_etiquetas(self.etiquetas, clave)} {serie[-1]}"
+
+
+class Gauge(_Metrica):
+    """Valor instantáneo: fijado con set() o calculado en cada scrape por una función"""
+    tipo = "gauge"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        super().__init__(nombre, ayuda, etiquetas)
+        self._valores: Dict[Tuple, float] = {}
+        self._funciones: Dict[Tuple, Callable[[], float]] = {}
+
+    def set(self, valor: float, *valores):
+        with self._lock:
+            self._valores[valores] = valor
+
+    def inc(self, *valores, cantidad: float = 1.0):
+        with self._lock:
+            self._valores[valores] = self._valores.get(valores, 0.0) + cantidad
+
+    def dec(self, *valores, cantidad: float = 1.0):
+        self.inc(*valores, cantidad=-cantidad)
+
+    def set_function(self, funcion: Callable[[], float], *valores):
+        with self._lock:
+            self._funciones[valores] = funcion
+
+    def valor(self, *valores) -> float:
+        funcion = self._funciones.get(valores)
+        return funcion() if funcion else self._valores.get(valores, 0.0)
+
+    def _actuales(self) -> Dict[Tuple, float]:
+        with self._lock:
+            valores = dict(self._valores)
+            funciones = dict(self._funciones)
+        for clave, funcion in funciones.items():
+            valores[clave] = funcion()
+        return valores
+
+    def series(self) -> List[list]:
+        return [[list(clave), valor] for clave, valor in self._actuales().items()]
+
+    def cargar(self, series: List[list]):
+        """Sumar: conexiones del pool o peticiones en curso de todos los workers"""
+        for clave, valor in series:
+            self.inc(*clave, cantidad=valor)
+
+    def lineas(self) -> Iterable[str]:
+        for clave, valor in self._actuales().items():
+            yield f"{self.nombre}{_etiquetas(self.etiquetas, clave)} {_numero(valor)}"
+
+
+class Registro:
+    """Conjunto de métricas del proceso, en orden de alta"""
+
+    def __init__(self):
+        self._metricas: Dict[str, _Metrica] = {}
+        self._lock = threading.Lock()
+
+    def _alta(self, metrica: _Metrica) -> _Metrica:
+        with self._lock:
+            existente = self._metricas.get(metrica.nombre)
+            if existente is not None:
+                return existente
+            self._metricas[metrica.nombre] = metrica
+            return metrica
+
+    def contador(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Contador:
+        return self._alta(Contador(nombre, ayuda, etiquetas))
+
+    def histograma(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = (), buckets: Sequence[float] = BUCKETS_LATENCIA) -> Histograma:
+        return self._alta(Histograma(nombre, ayuda, etiquetas, buckets))
+
+    def gauge(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Gauge:
+        return self._alta(Gauge(nombre, ayuda, etiquetas))
+
+    def instantanea(self) -> List[dict]:
+        """Definición y valores actuales de cada métrica (JSON), para sumarlos entre procesos"""
+        return [{**metrica.descripcion(), "series": metrica.series()} for metrica in list(self._metricas.values())]
+
+    def cargar(self, instantanea: List[dict]):
+        """Sumar la instantánea de otro proceso (las métricas que falten se dan de alta)"""
+        for datos in instantanea:
+            if datos["tipo"] == Contador.tipo:
+                metrica = self.contador(datos["nombre"], datos["ayuda"], datos["etiquetas"])
+            elif datos["tipo"] == Histograma.tipo:
+                metrica = self.histograma(datos["nombre"], datos["ayuda"], datos["etiquetas"], datos["buckets"])
+            else:
+                metrica = self.gauge(datos["nombre"], datos["ayuda"], datos["etiquetas"])
+            metrica.cargar(datos["series"])
+
+    def exponer(self) -> str:
+        """Texto de exposición de Prometheus (text/plain; version=0.0.4)"""
+        lineas = []
+        for metrica in list(self._metricas.values()):
+            lineas.extend(metrica.cabecera())
+            lineas.extend(metrica.lineas())
+        return "\n".join(lineas) + "\n"
+
+
+# Registro único del proceso (con varios workers, /metrics suma los de todos: multiproceso.py)
+registro = Registro()
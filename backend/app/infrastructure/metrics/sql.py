@@ -0,0 +1,135 @@
+"""
+Métricas de base de datos: hooks de eventos de SQLAlchemy y pool instrumentado
+- Consultas y tiempo en BD, globales y de la petición en curso (contextvar)
+- Gauges del pool (tamaño, en uso, libres, overflow) calculados en cada scrape
+- Esperas del pool: checkouts que se bloquean con el pool y el overflow agotados
+"""
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .registro import BUCKETS_LATENCIA, registro
+
+DB_CONSULTAS = registro.contador("db_queries_total", "Sentencias SQL ejecutadas", ("engine",))
+DB_ERRORES = registro.contador("db_query_errors_total", "Sentencias SQL que terminaron en error", ("engine",))
+DB_DURACION = registro.histograma("db_query_duration_seconds", "Duración de cada sentencia SQL", ("engine",), BUCKETS_LATENCIA)
+POOL_TAMANO = registro.gauge("db_pool_size", "Conexiones fijas del pool", ("engine",))
+POOL_EN_USO = registro.gauge("db_pool_checked_out", "Conexiones prestadas en este momento", ("engine",))
+POOL_LIBRES = registro.gauge("db_pool_checked_in", "Conexiones libres en el pool", ("engine",))
+POOL_OVERFLOW = registro.gauge("db_pool_overflow", "Conexiones de overflow abiertas (negativo: huecos fijos sin abrir)", ("engine",))
+POOL_ESPERAS = registro.contador("db_pool_waits_total", "Checkouts que esperaron por una conexión libre", ("engine",))
+POOL_TIMEOUTS = registro.contador("db_pool_timeouts_total", "Checkouts que superaron DB_POOL_TIMEOUT", ("engine",))
+POOL_CHECKOUT = registro.histograma("db_pool_checkout_seconds", "Tiempo para obtener una conexión del pool", ("engine",), BUCKETS_LATENCIA)
+
+
+class EstadisticasPeticion:
+    """Consultas y tiempo en BD acumulados durante una petición HTTP"""
+    __slots__ = ("consultas", "segundos")
+
+    def __init__(self):
+        self.consultas = 0
+        self.segundos = 0.0
+
+
+# Objeto mutable: el threadpool y run_sync copian el contexto pero comparten la referencia
+_peticion_actual: ContextVar[Optional[EstadisticasPeticion]] = ContextVar("metricas_peticion", default=None)
+
+
+def iniciar_peticion():
+    """Empieza a acumular estadísticas de BD para la petición en curso (devuelve el token)"""
+    return _peticion_actual.set(EstadisticasPeticion())
+
+
+def finalizar_peticion(token) -> EstadisticasPeticion:
+    """Deja de acumular y devuelve lo acumulado"""
+    estadisticas = _peticion_actual.get()
+    _peticion_actual.reset(token)
+    return estadisticas
+
+
+def peticion_actual() -> Optional[EstadisticasPeticion]:
+    return _peticion_actual.get()
+
+
+class _PoolMedido:
+    """
+    Mixin para QueuePool: mide el checkout y cuenta las esperas/timeouts
+    Solo envuelve _do_get, el resto del comportamiento del pool no cambia
+    """
+    nombre_metricas = "default"
+
+    def _do_get(self):
+        espera = -1 < self._max_overflow <= self._overflow and self._pool.empty()
+        if espera:
+            POOL_ESPERAS.inc(self.nombre_metricas)
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.inc(self.nombre_metricas)
+            raise
+        finally:
+            POOL_CHECKOUT.observe(time.perf_counter() - inicio, self.nombre_metricas)
+
+    def recreate(self):
+        # engine.dispose() crea un pool nuevo de la misma clase: conservar la etiqueta
+        pool = super().recreate()
+        pool.nombre_metricas = self.nombre_metricas
+        return pool
+
+
+class QueuePoolMedido(_PoolMedido, QueuePool):
+    pass
+
+
+class AsyncQueuePoolMedido(_PoolMedido, AsyncAdaptedQueuePool):
+    pass
+
+
+def clase_pool_medido(asincrono: bool):
+    return AsyncQueuePoolMedido if asincrono else QueuePoolMedido
+
+
+def _gauge_pool(engine, metodo: str):
+    def leer():
+        funcion = getattr(engine.pool, metodo, None)
+        return funcion() if funcion else 0
+    return leer
+
+
+def instrumentar_engine(engine, nombre: str):
+    """
+    Registrar hooks de ejecución y gauges del pool para un Engine síncrono
+    (para un AsyncEngine, pasar async_engine.sync_engine)
+    """
+    if isinstance(engine.pool, _PoolMedido):
+        engine.pool.nombre_metricas = nombre
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metricas_inicio", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _despues(conn, cursor, statement, parameters, context, executemany):
+        duracion = time.perf_counter() - conn.info["metricas_inicio"].pop()
+        DB_CONSULTAS.inc(nombre)
+        DB_DURACION.observe(duracion, nombre)
+        estadisticas = _peticion_actual.get()
+        if estadisticas is not None:
+            estadisticas.consultas += 1
+            estadisticas.segundos += duracion
+
+    @event.listens_for(engine, "handle_error")
+    def _error(contexto):
+        inicios = contexto.connection.info.get("metricas_inicio") if contexto.connection is not None else None
+        if inicios:
+            inicios.pop()
+        DB_ERRORES.inc(nombre)
+
+    POOL_TAMANO.set_function(_gauge_pool(engine, "size"), nombre)
+    POOL_EN_USO.set_function(_gauge_pool(engine, "checkedout"), nombre)
+    POOL_LIBRES.set_function(_gauge_pool(engine, "checkedin"), nombre)
+    POOL_OVERFLOW.set_function(_gauge_pool(engine, "overflow"), nombre)
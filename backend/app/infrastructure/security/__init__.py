@@ -0,0 +1 @@
+# Seguridad: hashing de contraseñas fuera del proceso de la API
@@ -0,0 +1,185 @@
+"""
+Ejecutor dedicado para el hashing de contraseñas (pbkdf2_sha256)
+El hash es CPU puro: corre en un pool de procesos para no retener el GIL de los
+hilos que atienden el resto de peticiones. La cola está acotada: si se llena,
+se rechaza con HashingSaturadoError (la API responde 503) en lugar de encolar sin límite.
+
+Los procesos del pool salen de un forkserver, no de fork() del worker: el worker tiene
+hilos (threadpool, bus de eventos, volcado de métricas) y un hijo bifurcado con un lock
+tomado (logging, malloc) se quedaría colgado. El pool se crea al arrancar (lifespan).
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dotenv import load_dotenv
+from passlib.context import CryptContext
+
+from ..metrics.registro import BUCKETS_LATENCIA, registro
+
+load_dotenv()
+
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "29000"))
+# Procesos del pool (0 = hashing en el propio hilo, útil en desarrollo y tests)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+# Hashes en vuelo (ejecutándose + en cola) antes de rechazar
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", str(max(PASSWORD_HASH_WORKERS, 1) * 4)))
+
+
+# Métricas de Prometheus (sumadas entre workers con METRICS_MULTIPROC_DIR); /health da un resumen
+HASH_EN_VUELO = registro.gauge("password_hash_in_flight", "Operaciones de contraseña ejecutándose o en cola")
+HASH_COMPLETADOS = registro.contador("password_hash_completed_total", "Operaciones de contraseña terminadas", ("operacion",))
+HASH_RECHAZADOS = registro.contador("password_hash_rejected_total", "Operaciones rechazadas con la cola llena", ("operacion",))
+HASH_LATENCIA = registro.histograma(
+    "password_hash_duration_seconds", "Latencia de hash/verify incluida la espera en cola", ("operacion",), BUCKETS_LATENCIA
+)
+
+
+class HashingSaturadoError(Exception):
+    """La cola de hashing está llena"""
+
+
+# ========== FUNCIONES DEL WORKER ==========
+
+_contextos = {}
+
+
+def _contexto(rounds: int) -> CryptContext:
+    """Un CryptContext por número de rondas y proceso (verify lee las rondas del propio hash)"""
+    if rounds not in _contextos:
+        _contextos[rounds] = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto", pbkdf2_sha256__rounds=rounds)
+    return _contextos[rounds]
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _contexto(rounds).hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return _contexto(PASSWORD_HASH_ROUNDS).verify(password, hashed_password)
+
+
+def _calentar(rounds: int):
+    """Importar passlib y preparar el contexto en el proceso del pool antes del primer login"""
+    _contexto(rounds)
+
+
+# ========== EJECUTOR ==========
+
+class PasswordHasher:
+    """Pool de procesos con cola acotada y métricas de profundidad y latencia"""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, capacidad: int = PASSWORD_HASH_QUEUE, rounds: int = PASSWORD_HASH_ROUNDS):
+        self.workers = workers
+        self.capacidad = capacidad
+        self.rounds = rounds
+        self._huecos = threading.BoundedSemaphore(capacidad)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+        # Métricas
+        self.en_vuelo = 0
+        self.completados = 0
+        self.rechazados = 0
+        self.latencia_total = 0.0
+        self.latencia_max = 0.0
+
+    def _executor(self) -> ProcessPoolExecutor:
+        """Pool perezoso y por proceso (tras un fork del servidor se crea uno nuevo)"""
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("forkserver")
+                )
+                self._pid = os.getpid()
+            return self._pool
+
+    def iniciar(self):
+        """Arrancar los procesos del pool (lifespan) en lugar de en el primer login"""
+        if self.workers <= 0:
+            return
+        pool = self._executor()
+        for futuro in [pool.submit(_calentar, self.rounds) for _ in range(self.workers)]:
+            futuro.result()
+
+    def _reservar(self, operacion: str):
+        if not self._huecos.acquire(blocking=False):
+            with self._lock:
+                self.rechazados += 1
+            HASH_RECHAZADOS.inc(operacion)
+            raise HashingSaturadoError("Demasiadas operaciones de contraseña en curso")
+        with self._lock:
+            self.en_vuelo += 1
+        HASH_EN_VUELO.inc()
+        return time.perf_counter()
+
+    def _liberar(self, inicio: float, operacion: str):
+        latencia = time.perf_counter() - inicio
+        with self._lock:
+            self.en_vuelo -= 1
+            self.completados += 1
+            self.latencia_total += latencia
+            self.latencia_max = max(self.latencia_max, latencia)
+        HASH_EN_VUELO.dec()
+        HASH_COMPLETADOS.inc(operacion)
+        HASH_LATENCIA.observe(latencia, operacion)
+        self._huecos.release()
+
+    def _ejecutar(self, operacion: str, fn, *args):
+        inicio = self._reservar(operacion)
+        try:
+            if self.workers <= 0:
+                return fn(*args)
+            return self._executor().submit(fn, *args).result()
+        finally:
+            self._liberar(inicio, operacion)
+
+    async def _ejecutar_async(self, operacion: str, fn, *args):
+        inicio = self._reservar(operacion)
+        try:
+            if self.workers <= 0:
+                return await asyncio.to_thread(fn, *args)
+            return await asyncio.wrap_future(self._executor().submit(fn, *args))
+        finally:
+            self._liberar(inicio, operacion)
+
+    def hash(self, password: str) -> str:
+        return self._ejecutar("hash", _hash, password, self.rounds)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._ejecutar("verify", _verify, password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._ejecutar_async("hash", _hash, password, self.rounds)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        return await self._ejecutar_async("verify", _verify, password, hashed_password)
+
+    def stats(self) -> dict:
+        """Resumen de esta instancia para /health (las series completas, en /metrics)"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacidad": self.capacidad,
+                "en_vuelo": self.en_vuelo,
+                "completados": self.completados,
+                "rechazados": self.rechazados,
+                "latencia_media_ms": round(1000 * self.latencia_total / self.completados, 2) if self.completados else 0.0,
+                "latencia_max_ms": round(1000 * self.latencia_max, 2),
+                "rounds": self.rounds,
+            }
+
+    def shutdown(self, esperar: bool = True):
+        """Parar el pool (lifespan): un worker reciclado no deja sus procesos al atexit del intérprete"""
+        with self._lock:
+            pool = self._pool if self._pid == os.getpid() else None
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=esperar, cancel_futures=True)
+
+
+# Instancia del proceso
+password_hasher = PasswordHasher()
@@ -2,23 +2,48 @@
 FastAPI Main Application - Clean Architecture
 Configuración principal de la app con estructura por capas
 """
+from contextlib import asynccontextmanager
+
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Infrastructure imports  
-from .infrastructure.config.database import engine
-from .infrastructure.database.models import Base
+from .infrastructure.config.database import ASYNC_API
+from .infrastructure.cache.usuario_cache import usuario_cache
+from .infrastructure.security.password_hasher import password_hasher
+from .infrastructure.metrics.registro import METRICS_ENABLED
+from .infrastructure.metrics.profiler import SQL_PROFILE
+
+# Domain imports
+from .domain.services.event_bus import event_bus
+from .domain.services.eventos import EventoDominio
 
 # API imports
 from .api import endpoints
+from .api import metrics
 
-# Crear tablas en desarrollo (mantener temporalmente)
-#Base.metadata.drop_all(bind=engine)
-Base.metadata.create_all(bind=engine)
+# DDL solo en el paso previo al arranque, nunca en el arranque (o reciclado) de cada worker:
+# el esquema con `alembic upgrade head` y las particiones de transacciones con
+# `python -m app.tools.particiones crear` (también desde cron)
 
 # ========== APP CONFIGURATION ==========
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pool de hashing listo antes de la primera petición (en un hilo: arranca procesos)
+    await anyio.to_thread.run_sync(password_hasher.iniciar)
+    # Consumidor de los suscriptores en segundo plano del bus de eventos de dominio
+    await event_bus.iniciar()
+    try:
+        yield
+    finally:
+        await event_bus.detener()
+        await anyio.to_thread.run_sync(password_hasher.shutdown)
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Finanzas App - Clean Architecture",
     description="API de gestión financiera personal con arquitectura limpia",
     version="2.0.0",
@@ -39,8 +64,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # Paginación keyset y GET condicionales
 )
 
+if METRICS_ENABLED:
+    event_bus.suscribir(EventoDominio, metrics.contar_evento)
+    # Última en añadirse = más externa: mide también CORS y las respuestas de error
+    app.add_middleware(metrics.MetricsMiddleware)
+
+if SQL_PROFILE:
+    # Diagnóstico: SQL lenta, N+1 y resumen por petición en SQL_PROFILE_FILE
+    app.add_middleware(metrics.SQLProfilerMiddleware)
+
 # ========== ROUTES ==========
 
 # Root endpoint
@@ -63,13 +98,26 @@ def health_check():
             "🟠 Application (Use Cases + DTOs)", 
             "🔵 Infrastructure (Database + External)",
             "🟢 API (Controllers + Dependencies)"
-        ]
+        ],
+        "cache_usuarios": usuario_cache.stats(),
+        "hashing": password_hasher.stats(),
+        "eventos": event_bus.stats()
     }
 
 
 # ========== ROUTERS ===========
 
+if METRICS_ENABLED:
+    app.include_router(metrics.router)
+
 # Incluir todos los routers modulares
-app.include_router(endpoints.auth_endpoints.router)
-app.include_router(endpoints.transaccion_endpoints.router)
-app.include_router(endpoints.sueldo_endpoints.router)
\ No newline at end of file
+if ASYNC_API:
+    # Mismas rutas con async def + AsyncSession (asyncpg / aiosqlite)
+    from .api.endpoints import async_auth_endpoints, async_transaccion_endpoints, async_sueldo_endpoints
+    app.include_router(async_auth_endpoints.router)
+    app.include_router(async_transaccion_endpoints.router)
+    app.include_router(async_sueldo_endpoints.router)
+else:
+    app.include_router(endpoints.auth_endpoints.router)
+    app.include_router(endpoints.transaccion_endpoints.router)
+    app.include_router(endpoints.sueldo_endpoints.router)
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Servidor de producción: gunicorn con workers uvicorn
+
+    python -m app.server
+
+- WEB_WORKERS procesos (por defecto, nº de CPUs) con la app precargada en el maestro
+  (preload: importación una vez y fork copy-on-write)
+- Reciclado de cada worker tras WEB_MAX_REQUESTS peticiones (± jitter, para que no
+  reinicien todos a la vez) y parada ordenada con WEB_GRACEFUL_TIMEOUT
+- Pool de SQLAlchemy por worker dimensionado para que
+  workers × motores × (pool_size + max_overflow) <= DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS
+- Tras el fork cada worker descarta las conexiones heredadas del maestro
+- Métricas: cada worker vuelca su registro en METRICS_MULTIPROC_DIR y /metrics devuelve
+  la suma de todos, atienda el scrape el worker que lo atienda (ver metrics/multiproceso.py)
+
+En desarrollo sigue valiendo `uvicorn app.main:app --reload`.
+"""
+import logging
+import os
+import tempfile
+from typing import Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("app.server")
+
+WEB_BIND = os.getenv("WEB_BIND", "0.0.0.0:8000")
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", "0")) or (os.cpu_count() or 1)
+WEB_MAX_REQUESTS = int(os.getenv("WEB_MAX_REQUESTS", "10000"))  # 0 = sin reciclado
+WEB_MAX_REQUESTS_JITTER = int(os.getenv("WEB_MAX_REQUESTS_JITTER", str(WEB_MAX_REQUESTS // 10)))
+WEB_GRACEFUL_TIMEOUT = int(os.getenv("WEB_GRACEFUL_TIMEOUT", "30"))  # segundos para terminar las peticiones en curso
+WEB_TIMEOUT = int(os.getenv("WEB_TIMEOUT", "60"))  # worker sin responder → se reinicia
+WEB_KEEPALIVE = int(os.getenv("WEB_KEEPALIVE", "5"))
+
+# Presupuesto de conexiones de esta aplicación en PostgreSQL (max_connections del servidor
+# menos lo que usen otros clientes); la reserva queda para migraciones, cron y administración
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "100"))
+DB_RESERVED_CONNECTIONS = int(os.getenv("DB_RESERVED_CONNECTIONS", "10"))
+# Tope por motor y worker: más conexiones que peticiones concurrentes de un worker no aportan nada
+DB_POOL_MAX_PER_WORKER = int(os.getenv("DB_POOL_MAX_PER_WORKER", "20"))
+
+
+class PresupuestoConexionesError(ValueError):
+    """El presupuesto no da ni una conexión por motor y worker"""
+
+
+def dimensionar_pool(presupuesto: int, workers: int, motores: int = 1, maximo: int = DB_POOL_MAX_PER_WORKER) -> Tuple[int, int]:
+    """
+    (pool_size, max_overflow) por motor y worker sin superar el presupuesto total ni `maximo`
+    Dos tercios de la cuota son conexiones fijas y el resto overflow para los picos
+    """
+    cuota = min(presupuesto // (workers * motores), maximo)
+    if cuota < 1:
+        raise PresupuestoConexionesError(
+            f"{presupuesto} conexiones no alcanzan para {workers} workers × {motores} motores: "
+            "reduce WEB_WORKERS o aumenta DB_MAX_CONNECTIONS"
+        )
+    pool_size = max(1, (cuota * 2 + 2) // 3)
+    return pool_size, cuota - pool_size
+
+
+def configurar_entorno(workers: int = WEB_WORKERS) -> dict:
+    """
+    Fijar DB_POOL_SIZE / DB_MAX_OVERFLOW (y los procesos de hashing) antes de importar la app:
+    los lee app.infrastructure.config.database al crear los motores
+    Valores explícitos en el entorno se respetan si caben en el presupuesto
+    """
+    async_api = os.getenv("ASYNC_API", "false").lower() in ("1", "true", "yes")
+    # Modo asíncrono: el motor síncrono sigue existiendo (tareas de arranque) junto al AsyncEngine
+    motores = 2 if async_api else 1
+    presupuesto = DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS
+    pool_size, max_overflow = dimensionar_pool(presupuesto, workers, motores)
+    explicitos = os.getenv("DB_POOL_SIZE"), os.getenv("DB_MAX_OVERFLOW")
+    if all(explicitos) and workers * motores * (int(explicitos[0]) + int(explicitos[1])) <= presupuesto:
+        pool_size, max_overflow = int(explicitos[0]), int(explicitos[1])
+    elif any(explicitos):
+        logger.warning("DB_POOL_SIZE/DB_MAX_OVERFLOW superan el presupuesto de %d conexiones: se usan %d + %d",
+                       presupuesto, pool_size, max_overflow)
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+    # Hashing: repartir las CPUs entre workers en lugar de un pool de nº de CPUs en cada uno
+    os.environ.setdefault("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+    # Métricas de todos los workers en un directorio compartido (en memoria si hay /dev/shm);
+    # se vacía al arrancar: uno distinto por servidor si hay varios en la misma máquina
+    os.environ.setdefault("METRICS_MULTIPROC_DIR", os.path.join(
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "finanzas_metrics"
+    ))
+    return {
+        "workers": workers,
+        "motores": motores,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "conexiones_max": workers * motores * (pool_size + max_overflow),
+        "presupuesto": presupuesto,
+    }
+
+
+def post_fork(server, worker):
+    """
+    Las conexiones abiertas por el maestro (si las hubo) no se comparten entre procesos
+    y cada worker empieza a volcar sus métricas al directorio compartido
+    """
+    from .infrastructure.config import database
+    from .infrastructure.metrics import registro
+    if registro.METRICS_ENABLED and registro.METRICS_MULTIPROC_DIR:
+        from .infrastructure.metrics.multiproceso import iniciar_volcado
+        worker.volcado_metricas = iniciar_volcado(registro.METRICS_MULTIPROC_DIR)
+    database.engine.dispose(close=False)
+    if database.replica_engine is not None:
+        database.replica_engine.dispose(close=False)
+    if database.ASYNC_API:
+        from .infrastructure.config import async_database
+        async_database.async_engine.sync_engine.dispose(close=False)
+        if async_database.async_replica_engine is not None:
+            async_database.async_replica_engine.sync_engine.dispose(close=False)
+
+
+def worker_exit(server, worker):
+    """Último volcado de métricas del worker (lo que contó desde el anterior)"""
+    from .infrastructure.metrics import registro
+    if getattr(worker, "volcado_metricas", None) is not None:
+        from .infrastructure.metrics.multiproceso import volcar
+        worker.volcado_metricas.set()
+        volcar(registro.METRICS_MULTIPROC_DIR)
+
+
+def child_exit(server, worker):
+    """Maestro: los contadores del worker terminado pasan al acumulado, sus gauges dejan de sumar"""
+    from .infrastructure.metrics import registro
+    if registro.METRICS_ENABLED and registro.METRICS_MULTIPROC_DIR:
+        from .infrastructure.metrics.multiproceso import retirar_proceso
+        retirar_proceso(registro.METRICS_MULTIPROC_DIR, worker.pid)
+
+
+def opciones_gunicorn(workers: int = WEB_WORKERS) -> dict:
+    return {
+        "bind": WEB_BIND,
+        "workers": workers,
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "preload_app": True,
+        "max_requests": WEB_MAX_REQUESTS,
+        "max_requests_jitter": WEB_MAX_REQUESTS_JITTER,
+        "graceful_timeout": WEB_GRACEFUL_TIMEOUT,
+        "timeout": WEB_TIMEOUT,
+        "keepalive": WEB_KEEPALIVE,
+        # Latido de los workers en memoria (en contenedores /tmp puede ser un overlay lento)
+        "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None,
+        "post_fork": post_fork,
+        "worker_exit": worker_exit,
+        "child_exit": child_exit,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def main():
+    from gunicorn.app.base import BaseApplication
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(name)s] %(message)s")
+    dimension = configurar_entorno()
+    logger.info(
+        "%(workers)d workers × %(motores)d motores × (%(pool_size)d + %(max_overflow)d) = "
+        "%(conexiones_max)d conexiones como máximo (presupuesto %(presupuesto)d)", dimension
+    )
+
+    class Servidor(BaseApplication):
+        def load_config(self):
+            for clave, valor in opciones_gunicorn().items():
+                if valor is not None:
+                    self.cfg.set(clave, valor)
+
+        def load(self):
+            # Con preload_app se ejecuta una vez en el maestro, después de configurar_entorno
+            from .main import app
+            from .infrastructure.metrics import registro
+            if registro.METRICS_ENABLED and registro.METRICS_MULTIPROC_DIR:
+                from .infrastructure.metrics.multiproceso import preparar_directorio
+                preparar_directorio(registro.METRICS_MULTIPROC_DIR)
+            return app
+
+    Servidor().run()
+
+
+if __name__ == "__main__":
+    main()
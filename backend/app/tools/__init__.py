@@ -0,0 +1 @@
+# Command line tools (maintenance, data generation)
@@ -0,0 +1,60 @@
+"""
+Particionado mensual / anual de transacciones en PostgreSQL
+
+Uso:
+    python -m app.tools.particiones migrar [--granularidad mes|anio] [--futuras 3] [--borrar-original]
+    python -m app.tools.particiones crear [--futuras 3]   # antes de arrancar la app y desde cron (p. ej. diario)
+    python -m app.tools.particiones listar
+
+migrar convierte la tabla existente copiando todas sus filas (bloquea las escrituras mientras dura)
+y deja la original como transacciones_sin_particionar salvo con --borrar-original
+"""
+import argparse
+
+from sqlalchemy import text
+
+from app.infrastructure.config.database import engine
+from app.infrastructure.database.particiones import (
+    GRANULARIDADES, PARTICIONES_FUTURAS, TABLA, TRANSACCIONES_PARTICIONES,
+    asegurar_particiones, esta_particionada, migrar_a_particiones, particiones_existentes,
+)
+
+
+def listar():
+    with engine.connect() as conn:
+        if not esta_particionada(conn):
+            print(f"La tabla {TABLA} no está particionada")
+            return
+        for nombre in particiones_existentes(conn):
+            filas, tamano = conn.execute(text(
+                f"SELECT (SELECT count(*) FROM {nombre}), pg_size_pretty(pg_total_relation_size('{nombre}'))"
+            )).one()
+            print(f"  {nombre:<28} {filas:>12} filas {tamano:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    migrar = comandos.add_parser("migrar", help="Convertir transacciones en tabla particionada")
+    migrar.add_argument("--granularidad", choices=GRANULARIDADES, default=TRANSACCIONES_PARTICIONES)
+    migrar.add_argument("--futuras", type=int, default=PARTICIONES_FUTURAS, help="Periodos por delante del actual")
+    migrar.add_argument("--borrar-original", action="store_true", help="Eliminar transacciones_sin_particionar al terminar")
+    crear = comandos.add_parser("crear", help="Crear las particiones que falten")
+    crear.add_argument("--futuras", type=int, default=PARTICIONES_FUTURAS, help="Periodos por delante del actual")
+    comandos.add_parser("listar", help="Particiones, filas y tamaño")
+    args = parser.parse_args(argv)
+
+    if args.comando == "migrar":
+        resultado = migrar_a_particiones(engine, args.granularidad, args.futuras, conservar_original=not args.borrar_original)
+        print(f"✅ {resultado['filas']} transacciones en {resultado['particiones']} particiones")
+        if resultado["original"]:
+            print(f"   Tabla anterior conservada como {resultado['original']} (DROP TABLE cuando se haya verificado)")
+    elif args.comando == "crear":
+        creadas = asegurar_particiones(engine, args.futuras)
+        print(f"✅ {len(creadas)} particiones creadas" + (f": {', '.join(creadas)}" if creadas else ""))
+    else:
+        listar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Reconstruir el rollup resumen_mensual desde transacciones y sueldos
+
+Uso:
+    python -m app.tools.reconstruir_resumen            # todos los usuarios
+    python -m app.tools.reconstruir_resumen --user 42  # un usuario
+"""
+import argparse
+from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.database.resumen_repository import SQLResumenMensualRepository
+from app.infrastructure.database.version_repository import SQLVersionUsuarioRepository
+
+
+def reconstruir(user_id=None) -> int:
+    """Borrar y recalcular el rollup en una única transacción"""
+    db = SessionLocal()
+    try:
+        filas = SQLResumenMensualRepository(db).reconstruir(user_id=user_id)
+        # Los balances pueden cambiar: invalidar los ETag emitidos
+        SQLVersionUsuarioRepository(db).incrementar_todos(user_id=user_id)
+        db.commit()
+        return filas
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recalcular resumen_mensual desde los datos crudos")
+    parser.add_argument("--user", type=int, default=None, help="ID de usuario (por defecto todos)")
+    args = parser.parse_args(argv)
+    filas = reconstruir(user_id=args.user)
+    print(f"✅ resumen_mensual reconstruido: {filas} filas")
+
+
+if __name__ == "__main__":
+    main()
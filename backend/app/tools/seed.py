@@ -0,0 +1,212 @@
+"""
+Generador de datos sintéticos realistas para pruebas de carga y benchmarks
+
+Usuarios con gasto estacional (más en diciembre, enero y verano, y en fin de semana),
+importes log-normales por categoría, sueldo mensual con subida anual y pagas extra, y
+reparto sesgado de transacciones entre usuarios (unos pocos usuarios muy activos).
+
+Determinista: misma --semilla y parámetros → mismos datos, sin depender del tamaño de bloque.
+Inserta en bloque (COPY en PostgreSQL con psycopg2, INSERT multi-fila en el resto) sin pasar
+por los casos de uso; el rollup resumen_mensual se calcula en memoria y se inserta a la vez.
+
+Uso:
+    python -m app.tools.seed --usuarios 1000 --transacciones 2000
+    python -m app.tools.seed --usuarios 50 --transacciones 10000 --desde 2021-01-01 --hasta 2026-01-01 --sesgo 1.2
+Todos los usuarios generados comparten la contraseña --password (por defecto seed1234)
+"""
+import argparse
+import bisect
+import calendar
+import math
+import random
+import time
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+from sqlalchemy import insert, select
+
+from app.auth import get_password_hash
+from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.config.migraciones import actualizar_esquema
+from app.infrastructure.database.models import ResumenMensualORM, SueldoORM, UsuarioORM
+from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+
+# (descripción, tipo, mediana del importe, dispersión log-normal, peso relativo)
+CATEGORIAS = (
+    ("Supermercado", "gasto", 55.0, 0.5, 30),
+    ("Restaurante", "gasto", 32.0, 0.6, 14),
+    ("Transporte", "gasto", 18.0, 0.5, 12),
+    ("Ocio", "gasto", 35.0, 0.8, 10),
+    ("Suministros", "gasto", 75.0, 0.4, 6),
+    ("Ropa", "gasto", 60.0, 0.7, 6),
+    ("Salud", "gasto", 40.0, 0.7, 4),
+    ("Viajes", "gasto", 280.0, 0.8, 2),
+    ("Bizum recibido", "ingreso", 25.0, 0.8, 8),
+    ("Reembolso", "ingreso", 22.0, 0.7, 4),
+    ("Venta segunda mano", "ingreso", 45.0, 0.9, 3),
+)
+_PESOS_CATEGORIAS = list(accumulate(c[4] for c in CATEGORIAS))
+
+# Estacionalidad del gasto por mes (frecuencia de días): navidades, rebajas y verano
+ESTACIONALIDAD = (0, 1.15, 0.85, 0.9, 0.95, 1.0, 1.05, 1.25, 1.2, 0.95, 0.95, 1.05, 1.45)
+FIN_DE_SEMANA = 1.3
+
+
+def _dias(desde: date, hasta: date) -> Tuple[List[datetime], List[float]]:
+    """Días del intervalo [desde, hasta) (a medianoche) y sus pesos acumulados (estacionalidad + fin de semana)"""
+    dias, pesos = [], []
+    dia = desde
+    while dia < hasta:
+        dias.append(datetime(dia.year, dia.month, dia.day))
+        pesos.append(ESTACIONALIDAD[dia.month] * (FIN_DE_SEMANA if dia.weekday() >= 5 else 1.0))
+        dia += timedelta(days=1)
+    return dias, list(accumulate(pesos))
+
+
+def _meses(desde: date, hasta: date) -> List[Tuple[int, int]]:
+    """(anio, mes) de cada mes que toca el intervalo [desde, hasta)"""
+    meses = []
+    anio, mes = desde.year, desde.month
+    while date(anio, mes, 1) < hasta:
+        meses.append((anio, mes))
+        anio, mes = (anio + 1, 1) if mes == 12 else (anio, mes + 1)
+    return meses
+
+
+def reparto(usuarios: int, media: int, sesgo: float) -> List[int]:
+    """
+    Transacciones por usuario con reparto tipo Zipf: peso 1 / rango^sesgo
+    sesgo=0 → todos `media`; sesgo≈1 → el primer usuario concentra mucho más que el último
+    El total es siempre usuarios × media
+    """
+    pesos = [1.0 / (i + 1) ** sesgo for i in range(usuarios)]
+    total = usuarios * media
+    escala = total / sum(pesos)
+    cuentas = [int(p * escala) for p in pesos]
+    # Repartir el resto del redondeo entre los primeros
+    for i in range(total - sum(cuentas)):
+        cuentas[i % usuarios] += 1
+    return cuentas
+
+
+class GeneradorUsuario:
+    """Datos de un usuario a partir de su propio generador aleatorio (independiente del resto)"""
+
+    def __init__(self, semilla: int, indice: int, dias, pesos_dias, meses):
+        self.rng = random.Random(semilla * 1_000_003 + indice)
+        self.dias = dias
+        self.pesos_dias = pesos_dias
+        self.meses = meses
+
+    def transacciones(self, user_id: int, cantidad: int, resumen: Dict) -> List[dict]:
+        rng = self.rng
+        filas = []
+        dias = rng.choices(self.dias, cum_weights=self.pesos_dias, k=cantidad)
+        total_categorias = _PESOS_CATEGORIAS[-1]
+        for dia in dias:
+            descripcion, tipo, mediana, dispersion, _ = CATEGORIAS[bisect.bisect(_PESOS_CATEGORIAS, rng.random() * total_categorias)]
+            importe = round(max(0.5, rng.lognormvariate(math.log(mediana), dispersion)), 2)
+            fecha = dia + timedelta(seconds=rng.randrange(7 * 3600, 23 * 3600))
+            filas.append({"user_id": user_id, "tipo": tipo, "cantidad": importe, "fecha": fecha, "descripcion": descripcion})
+            mes = resumen.setdefault((dia.year, dia.month), [0.0, 0.0, 0, 0.0])
+            mes[0 if tipo == "ingreso" else 1] += importe
+            mes[2] += 1
+        return filas
+
+    def sueldos(self, user_id: int, resumen: Dict) -> List[dict]:
+        """Un sueldo por mes: subida anual en enero y, para la mitad de usuarios, pagas extra en junio y diciembre"""
+        rng = self.rng
+        base = round(rng.lognormvariate(math.log(1800), 0.35), 2)
+        pagas_extra = rng.random() < 0.5
+        filas = []
+        for anio, mes in self.meses:
+            if mes == 1 and filas:
+                base = round(base * (1 + rng.uniform(0.0, 0.04)), 2)
+            cantidad = base * 2 if pagas_extra and mes in (6, 12) else base
+            ultimo_dia = calendar.monthrange(anio, mes)[1]
+            filas.append({"user_id": user_id, "cantidad": cantidad, "mes": mes, "anio": anio, "fecha": datetime(anio, mes, min(28, ultimo_dia))})
+            resumen.setdefault((anio, mes), [0.0, 0.0, 0, 0.0])[3] = cantidad
+        return filas
+
+
+def sembrar(usuarios: int, transacciones: int, desde: date, hasta: date, sesgo: float = 1.0, semilla: int = 42,
+            prefijo: str = "seed", password: str = "seed1234", lote: int = 20_000, usuarios_por_bloque: int = 100,
+            progreso=print) -> dict:
+    """Generar e insertar los datos. Commit por bloque de usuarios. Devuelve los totales insertados."""
+    if hasta <= desde:
+        raise ValueError("--hasta debe ser posterior a --desde")
+    dias, pesos_dias = _dias(desde, hasta)
+    meses = _meses(desde, hasta)
+    cuentas = reparto(usuarios, transacciones, sesgo)
+    hashed_password = get_password_hash(password)  # un único hash compartido
+    totales = {"usuarios": 0, "transacciones": 0, "sueldos": 0, "resumen_mensual": 0}
+    inicio = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        if db.execute(select(UsuarioORM.id).where(UsuarioORM.email.like(f"{prefijo}\\_%@seed.local", escape="\\")).limit(1)).first():
+            raise SystemExit(f"Ya existen usuarios con el prefijo '{prefijo}': usa otro --prefijo o una BD vacía")
+        repo = SQLTransaccionRepository(db)
+        for bloque in range(0, usuarios, usuarios_por_bloque):
+            indices = range(bloque, min(bloque + usuarios_por_bloque, usuarios))
+            ids = db.execute(
+                insert(UsuarioORM).returning(UsuarioORM.id, sort_by_parameter_order=True),
+                [{"email": f"{prefijo}_{i}@seed.local", "hashed_password": hashed_password, "is_active": True, "created_at": datetime.combine(desde, datetime.min.time())} for i in indices]
+            ).scalars().all()
+
+            pendientes, sueldos, resumenes = [], [], []
+            for indice, user_id in zip(indices, ids):
+                generador = GeneradorUsuario(semilla, indice, dias, pesos_dias, meses)
+                resumen = {}
+                sueldos.extend(generador.sueldos(user_id, resumen))
+                pendientes.extend(generador.transacciones(user_id, cuentas[indice], resumen))
+                resumenes.extend(
+                    {"user_id": user_id, "anio": anio, "mes": mes, "ingresos": round(ing, 2), "gastos": round(gas, 2), "num_transacciones": n, "sueldo": sueldo}
+                    for (anio, mes), (ing, gas, n, sueldo) in resumen.items()
+                )
+                if len(pendientes) >= lote:
+                    totales["transacciones"] += repo.insertar_filas(pendientes)
+                    pendientes = []
+            totales["transacciones"] += repo.insertar_filas(pendientes)
+            db.execute(insert(SueldoORM), sueldos)
+            db.execute(insert(ResumenMensualORM), resumenes)
+            db.commit()
+
+            totales["usuarios"] += len(ids)
+            totales["sueldos"] += len(sueldos)
+            totales["resumen_mensual"] += len(resumenes)
+            segundos = time.perf_counter() - inicio
+            progreso(f"  {totales['usuarios']}/{usuarios} usuarios, {totales['transacciones']} transacciones "
+                     f"({totales['transacciones'] / segundos:,.0f} filas/s)")
+        return totales
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generar usuarios, transacciones y sueldos sintéticos")
+    parser.add_argument("--usuarios", type=int, default=100)
+    parser.add_argument("--transacciones", type=int, default=1000, help="Media de transacciones por usuario")
+    parser.add_argument("--desde", type=date.fromisoformat, default=date(2022, 1, 1), help="Primer día (YYYY-MM-DD)")
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date(2025, 1, 1), help="Día siguiente al último (YYYY-MM-DD)")
+    parser.add_argument("--sesgo", type=float, default=1.0, help="Exponente Zipf del reparto entre usuarios (0 = uniforme)")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--prefijo", default="seed", help="Emails <prefijo>_<n>@seed.local")
+    parser.add_argument("--password", default="seed1234")
+    parser.add_argument("--lote", type=int, default=20_000, help="Filas por inserción")
+    args = parser.parse_args(argv)
+
+    actualizar_esquema()
+    inicio = time.perf_counter()
+    totales = sembrar(args.usuarios, args.transacciones, args.desde, args.hasta, args.sesgo, args.semilla,
+                      args.prefijo, args.password, args.lote)
+    print(f"✅ {totales['usuarios']} usuarios, {totales['transacciones']} transacciones, "
+          f"{totales['sueldos']} sueldos y {totales['resumen_mensual']} filas de resumen en {time.perf_counter() - inicio:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
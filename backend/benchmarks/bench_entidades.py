@@ -0,0 +1,71 @@
+"""
+Micro-benchmark: memoria y tiempo de construcción de entidades de dominio
+Compara __init__ (valida y rellena valores por defecto) con from_row (carga de confianza)
+
+Uso (desde backend/):
+    python -m benchmarks.bench_entidades [--entidades 100000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+
+from app.domain.entities.sueldo import Sueldo
+from app.domain.entities.transaccion import Transaccion
+from app.domain.entities.usuario import Usuario
+
+FECHA = datetime(2025, 1, 1)
+
+CONSTRUCTORES = {
+    "Transaccion": (
+        lambda i: Transaccion(tipo="gasto", cantidad=1.0 + i, user_id=1, id=i + 1, fecha=FECHA, descripcion="x"),
+        lambda i: Transaccion.from_row(id=i + 1, tipo="gasto", cantidad=1.0 + i, user_id=1, fecha=FECHA, descripcion="x"),
+    ),
+    "Sueldo": (
+        lambda i: Sueldo(cantidad=1000.0, mes=1 + i % 12, anio=2025, user_id=1, id=i + 1, fecha=FECHA),
+        lambda i: Sueldo.from_row(id=i + 1, cantidad=1000.0, mes=1 + i % 12, anio=2025, user_id=1, fecha=FECHA),
+    ),
+    "Usuario": (
+        lambda i: Usuario(email=f"u{i}@x.com", hashed_password="h", id=i + 1, created_at=FECHA),
+        lambda i: Usuario.from_row(id=i + 1, email=f"u{i}@x.com", hashed_password="h", is_active=True, created_at=FECHA),
+    ),
+}
+
+
+def medir_tiempo(crear, n: int) -> float:
+    gc.collect()
+    inicio = time.perf_counter()
+    entidades = [crear(i) for i in range(n)]
+    duracion = time.perf_counter() - inicio
+    del entidades
+    return duracion
+
+
+def medir_memoria(crear, n: int) -> float:
+    """Bytes por entidad (incluye sus atributos, no la lista que las contiene)"""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    entidades = [crear(i) for i in range(n)]
+    total = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del entidades
+    return (total - 8 * n) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entidades", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'entidad':<12} {'__init__ ms':>12} {'from_row ms':>12} {'bytes/entidad':>14}")
+    for nombre, (con_init, con_from_row) in CONSTRUCTORES.items():
+        t_init = medir_tiempo(con_init, args.entidades)
+        t_row = medir_tiempo(con_from_row, args.entidades)
+        memoria = medir_memoria(con_from_row, args.entidades)
+        print(f"{nombre:<12} {t_init * 1e3:>12.0f} {t_row * 1e3:>12.0f} {memoria:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: GET /transacciones/ con el camino rápido (filas → orjson) frente a DTOs + validación
+Mide peticiones/segundo en proceso (TestClient) para páginas de 100, 1.000 y 10.000 filas
+
+Uso (desde backend/, con una base de datos de pruebas):
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.bench_listados [--segundos 3]
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+TAMANOS = (100, 1000, 10000)
+
+# La API limita ?limit= a 1000 filas: el benchmark sube el tope para medir la página de 10.000
+# (antes de importar la app, que lo lee al registrar las rutas)
+os.environ.setdefault("LISTADO_LIMITE_MAX", str(max(TAMANOS)))
+
+from app.main import app
+from app.api import responses
+from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.config.migraciones import actualizar_esquema
+from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+from app.domain.entities.transaccion import Transaccion
+
+
+def preparar(client: TestClient, filas: int) -> dict:
+    """Usuario nuevo con `filas` transacciones (insertadas en bloque)"""
+    email = f"bench_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "bench1234"})
+    token = client.post("/auth/token", data={"username": email, "password": "bench1234"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = client.get("/auth/me", headers=headers).json()["id"]
+    inicio = datetime(2020, 1, 1)
+    db = SessionLocal()
+    try:
+        repo = SQLTransaccionRepository(db)
+        repo.save_many([
+            Transaccion(tipo="gasto" if i % 3 else "ingreso", cantidad=1.0 + i % 100, user_id=user_id,
+                        fecha=inicio + timedelta(hours=i), descripcion=f"movimiento {i}")
+            for i in range(filas)
+        ])
+        db.commit()
+    finally:
+        db.close()
+    return headers
+
+
+def medir(client: TestClient, headers: dict, limit: int, segundos: float) -> float:
+    """Peticiones por segundo durante `segundos`"""
+    peticiones = 0
+    inicio = time.perf_counter()
+    while time.perf_counter() - inicio < segundos:
+        respuesta = client.get(f"/transacciones/?limit={limit}", headers=headers)
+        assert respuesta.status_code == 200 and len(respuesta.json()) == limit
+        peticiones += 1
+    return peticiones / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=3.0, help="Duración de cada medición")
+    args = parser.parse_args()
+
+    actualizar_esquema()
+    client = TestClient(app)
+    headers = preparar(client, max(TAMANOS))
+    modo_original = responses.FAST_JSON_RESPONSES
+    print(f"{'filas/página':>12} {'DTO req/s':>10} {'rápido req/s':>13} {'mejora':>7}")
+    try:
+        for limit in TAMANOS:
+            responses.FAST_JSON_RESPONSES = False
+            lento = medir(client, headers, limit, args.segundos)
+            responses.FAST_JSON_RESPONSES = True
+            rapido = medir(client, headers, limit, args.segundos)
+            print(f"{limit:>12} {lento:>10.1f} {rapido:>13.1f} {rapido / lento:>6.1f}x")
+    finally:
+        responses.FAST_JSON_RESPONSES = modo_original
+
+
+if __name__ == "__main__":
+    main()
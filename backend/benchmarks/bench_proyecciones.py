@@ -0,0 +1,88 @@
+"""
+Micro-benchmark: lecturas de solo lectura con instancias ORM frente a proyección de columnas
+Carga todas las transacciones de un usuario con N filas por los dos caminos:
+  - ORM: query(TransaccionORM).all() (identity map + seguimiento de cambios) → _to_domain
+  - Core: select(*COLUMNAS_DOMINIO) → Transaccion.from_row (find_all_by_user actual)
+
+Uso (desde backend/, con una base de datos de pruebas):
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.bench_proyecciones [--filas 50000] [--repeticiones 5]
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+from app.infrastructure.config.database import SessionLocal
+from app.infrastructure.config.migraciones import actualizar_esquema
+from app.infrastructure.database.models import TransaccionORM, UsuarioORM
+from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+from app.domain.entities.transaccion import Transaccion
+
+
+def preparar(filas: int) -> int:
+    """Usuario nuevo con `filas` transacciones (insertadas en bloque)"""
+    db = SessionLocal()
+    try:
+        usuario = UsuarioORM(email=f"bench_{os.urandom(4).hex()}@correo.com", hashed_password="x")
+        db.add(usuario)
+        db.flush()
+        inicio = datetime(2020, 1, 1)
+        SQLTransaccionRepository(db).save_many([
+            Transaccion(tipo="gasto" if i % 3 else "ingreso", cantidad=1.0 + i % 100, user_id=usuario.id,
+                        fecha=inicio + timedelta(minutes=i), descripcion=f"movimiento {i}")
+            for i in range(filas)
+        ])
+        db.commit()
+        return usuario.id
+    finally:
+        db.close()
+
+
+def con_orm(user_id: int) -> int:
+    db = SessionLocal()
+    try:
+        repo = SQLTransaccionRepository(db)
+        transacciones_orm = db.query(TransaccionORM).filter(TransaccionORM.user_id == user_id).all()
+        return len([repo._to_domain(t) for t in transacciones_orm])
+    finally:
+        db.close()
+
+
+def con_proyeccion(user_id: int) -> int:
+    db = SessionLocal()
+    try:
+        return len(SQLTransaccionRepository(db).find_all_by_user(user_id))
+    finally:
+        db.close()
+
+
+def medir(funcion, user_id: int, repeticiones: int) -> float:
+    """Mejor tiempo de `repeticiones` ejecuciones (segundos)"""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(user_id)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=50_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    actualizar_esquema()
+    user_id = preparar(args.filas)
+    assert con_orm(user_id) == con_proyeccion(user_id) == args.filas
+
+    t_orm = medir(con_orm, user_id, args.repeticiones)
+    t_core = medir(con_proyeccion, user_id, args.repeticiones)
+    print(f"{'camino':<12} {'total ms':>10} {'µs/fila':>10}")
+    print(f"{'ORM':<12} {t_orm * 1e3:>10.0f} {t_orm / args.filas * 1e6:>10.2f}")
+    print(f"{'proyección':<12} {t_core * 1e3:>10.0f} {t_core / args.filas * 1e6:>10.2f}")
+    print(f"reducción por fila: {(1 - t_core / t_orm) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: dependencia de autenticación con y sin caché de tokens verificados
+Reproduce un tráfico de N tokens reutilizados (cada cliente repite su token)
+
+Uso (desde backend/):
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.bench_token_cache [--tokens 50] [--peticiones 20000]
+"""
+import argparse
+import random
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+from app.auth import create_access_token, token_cache
+from app.api.dependencies.auth import get_current_user_from_token
+from app.domain.entities.usuario import Usuario
+from app.infrastructure.cache.usuario_cache import usuario_cache
+
+
+class UsuarioRepositoryMemoria:
+    """Repositorio en memoria: aísla el coste de verificar el token"""
+
+    def __init__(self, emails):
+        self.usuarios = {email: Usuario(id=i, email=email, hashed_password="x") for i, email in enumerate(emails, 1)}
+
+    def find_by_email(self, email):
+        return self.usuarios.get(email)
+
+
+def medir(credenciales, repo, tamano_cache: int) -> float:
+    token_cache.clear()
+    token_cache.hits = token_cache.misses = 0
+    token_cache.maxsize = tamano_cache
+    inicio = time.perf_counter()
+    for c in credenciales:
+        get_current_user_from_token(c, repo)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--peticiones", type=int, default=20000)
+    args = parser.parse_args()
+
+    emails = [f"bench{i}@correo.com" for i in range(args.tokens)]
+    repo = UsuarioRepositoryMemoria(emails)
+    tokens = [create_access_token({"email": e}, expires_delta=timedelta(minutes=30)) for e in emails]
+    rnd = random.Random(42)
+    credenciales = [SimpleNamespace(credentials=rnd.choice(tokens)) for _ in range(args.peticiones)]
+    usuario_cache.clear()
+    tamano = token_cache.maxsize
+
+    sin_cache = medir(credenciales, repo, 0)
+    con_cache = medir(credenciales, repo, max(tamano, args.tokens))
+    token_cache.maxsize = tamano
+
+    print(f"{args.peticiones} peticiones, {args.tokens} tokens distintos")
+    print(f"sin caché: {sin_cache * 1e6 / args.peticiones:8.1f} µs/petición")
+    print(f"con caché: {con_cache * 1e6 / args.peticiones:8.1f} µs/petición  ({sin_cache / con_cache:.1f}x)")
+    print(f"stats: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Suite de micro-benchmarks de repositorios y casos de uso con barrido de escala de datos
+Para cada escala (nº de transacciones de un usuario, con 5 años de sueldos) mide las lecturas
+de SQLTransaccionRepository, los balances, el listado paginado y los casos de uso de sueldos.
+
+Funciona sin red contra SQLite o un PostgreSQL local (DATABASE_URL). Los usuarios de
+benchmark se crean una vez por escala y se reutilizan en las siguientes ejecuciones.
+
+Uso (desde backend/):
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.suite [--escalas 1000 10000 100000]
+        [--repeticiones 7] [--salida bench_resultados.json]
+        [--baseline bench_baseline.json] [--tolerancia 0.20]
+
+Con --baseline compara la mediana de cada caso con la guardada y termina con código 1
+si alguno empeora más que la tolerancia (0.20 = un 20 % más lento)
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy
+
+from app.infrastructure.config.database import SessionLocal, engine
+from app.infrastructure.config.migraciones import actualizar_esquema
+from app.infrastructure.database.models import TransaccionORM, UsuarioORM
+from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+from app.infrastructure.database.sueldo_repository import SQLSueldoRepository
+from app.infrastructure.database.usuario_repository import SQLUsuarioRepository
+from app.application.use_cases.balance.calcular_balance import CalcularBalanceUseCase
+from app.application.use_cases.transaccion.obtener_transacciones import ObtenerTransaccionesUseCase
+from app.application.use_cases.sueldo.crear_sueldo import CrearSueldoUseCase
+from app.application.use_cases.sueldo.obtener_sueldo import ObtenerSueldoUseCase
+from app.application.use_cases.sueldo.obtener_sueldos import ObtenerSueldosUseCase
+from app.domain.entities.sueldo import Sueldo
+from app.domain.entities.transaccion import Transaccion
+
+ESCALAS = (1_000, 10_000, 100_000)
+# Cinco años completos de datos: transacciones repartidas y un sueldo por mes
+ANIOS = range(2021, 2026)
+INICIO = datetime(ANIOS[0], 1, 1)
+FIN = datetime(ANIOS[-1] + 1, 1, 1)
+# Mes y año de referencia para las consultas de un periodo
+MES, ANIO = 6, 2023
+LOTE_SEMILLA = 5_000
+
+
+# ========== DATOS ==========
+
+def email_escala(escala: int) -> str:
+    return f"bench_suite_{escala}@bench.local"
+
+
+def preparar_usuario(escala: int) -> int:
+    """Usuario con `escala` transacciones y 60 sueldos (idempotente: reutiliza si ya existe)"""
+    db = SessionLocal()
+    try:
+        usuario = db.query(UsuarioORM).filter(UsuarioORM.email == email_escala(escala)).first()
+        if usuario is not None:
+            existentes = db.query(TransaccionORM).filter(TransaccionORM.user_id == usuario.id).count()
+            if existentes == escala:
+                return usuario.id
+            raise SystemExit(f"El usuario {email_escala(escala)} tiene {existentes} transacciones (esperadas {escala}): bórralo o usa otra BD")
+
+        usuario = SQLUsuarioRepository(db).create(email=email_escala(escala), hashed_password="bench")
+        user_id = usuario.id
+        # Semilla fija por escala: mismos datos en cada máquina
+        aleatorio = random.Random(escala)
+        segundos = int((FIN - INICIO).total_seconds())
+        repo = SQLTransaccionRepository(db)
+        for desde in range(0, escala, LOTE_SEMILLA):
+            repo.save_many([
+                Transaccion(
+                    tipo="ingreso" if aleatorio.random() < 0.3 else "gasto",
+                    cantidad=round(aleatorio.uniform(1, 500), 2),
+                    user_id=user_id,
+                    fecha=INICIO + timedelta(seconds=aleatorio.randrange(segundos)),
+                    descripcion=f"movimiento {i}",
+                )
+                for i in range(desde, min(desde + LOTE_SEMILLA, escala))
+            ])
+            db.commit()
+        sueldos = SQLSueldoRepository(db)
+        for anio in ANIOS:
+            for mes in range(1, 13):
+                sueldos.save(Sueldo(cantidad=2000.0 + aleatorio.randrange(500), mes=mes, anio=anio, user_id=user_id))
+        return user_id
+    finally:
+        db.close()
+
+
+# ========== CASOS ==========
+
+def _repo(db):
+    return SQLTransaccionRepository(db)
+
+
+def _sueldos(db):
+    return SQLSueldoRepository(db), SQLUsuarioRepository(db)
+
+
+def _pagina_profunda(db, user_id):
+    """Página de 100 tras saltar a la mitad del histórico con el cursor keyset"""
+    uc = ObtenerTransaccionesUseCase(db)
+    _, cursor = uc.obtener_pagina(user_id, limit=1)
+    return uc.obtener_pagina(user_id, limit=100, cursor=cursor, desde=INICIO, hasta=datetime(2023, 7, 1))
+
+
+# nombre → función(db, user_id); cada ejecución usa una sesión nueva (como una petición)
+CASOS = {
+    "repo.find_all_by_user": lambda db, u: _repo(db).find_all_by_user(u),
+    "repo.find_by_user_and_month": lambda db, u: _repo(db).find_by_user_and_month(u, MES, ANIO),
+    "repo.find_by_user_and_year": lambda db, u: _repo(db).find_by_user_and_month(u, anio=ANIO),
+    "repo.get_balance_by_user": lambda db, u: _repo(db).get_balance_by_user(u),
+    "repo.get_gastos_by_user_mes": lambda db, u: _repo(db).get_gastos_by_user(u, MES, ANIO),
+    "balance.total": lambda db, u: CalcularBalanceUseCase(db).execute(u),
+    "balance.mes": lambda db, u: CalcularBalanceUseCase(db).execute(u, MES, ANIO),
+    "balance.anio": lambda db, u: CalcularBalanceUseCase(db).execute(u, anio=ANIO),
+    "balance.periodos_12": lambda db, u: CalcularBalanceUseCase(db).execute_periodos(u, [(m, ANIO) for m in range(1, 13)]),
+    "transacciones.pagina_100": lambda db, u: ObtenerTransaccionesUseCase(db).obtener_pagina(u, limit=100),
+    "transacciones.pagina_filas_1000": lambda db, u: ObtenerTransaccionesUseCase(db).obtener_pagina_filas(u, limit=1000),
+    "transacciones.pagina_cursor_100": _pagina_profunda,
+    "sueldos.listar": lambda db, u: ObtenerSueldosUseCase(*_sueldos(db)).execute(u),
+    "sueldos.obtener_mes": lambda db, u: ObtenerSueldoUseCase(*_sueldos(db)).execute(u, MES, ANIO),
+    "sueldos.upsert_mes": lambda db, u: CrearSueldoUseCase(*_sueldos(db)).execute(u, 2500.0, MES, ANIO),
+}
+
+
+def medir(caso, user_id: int, repeticiones: int) -> dict:
+    """Una ejecución de calentamiento y `repeticiones` medidas (milisegundos)"""
+    tiempos = []
+    for i in range(repeticiones + 1):
+        db = SessionLocal()
+        try:
+            inicio = time.perf_counter()
+            caso(db, user_id)
+            duracion = (time.perf_counter() - inicio) * 1000
+        finally:
+            db.close()
+        if i:
+            tiempos.append(duracion)
+    return {
+        "mediana_ms": round(statistics.median(tiempos), 3),
+        "min_ms": round(min(tiempos), 3),
+        "media_ms": round(statistics.fmean(tiempos), 3),
+        "repeticiones": repeticiones,
+    }
+
+
+def ejecutar(escalas, repeticiones: int, filtro: str = None) -> dict:
+    actualizar_esquema()
+    resultados = {}
+    for escala in escalas:
+        inicio = time.perf_counter()
+        user_id = preparar_usuario(escala)
+        print(f"\n== {escala} transacciones (usuario {user_id}, preparado en {time.perf_counter() - inicio:.1f} s)")
+        resultados[str(escala)] = {}
+        for nombre, caso in CASOS.items():
+            if filtro and filtro not in nombre:
+                continue
+            medida = medir(caso, user_id, repeticiones)
+            resultados[str(escala)][nombre] = medida
+            print(f"  {nombre:<34} {medida['mediana_ms']:>10.2f} ms  (min {medida['min_ms']:.2f})")
+    return {
+        "meta": {
+            "fecha": datetime.now(timezone.utc).isoformat(),
+            "dialecto": engine.dialect.name,
+            "driver": engine.dialect.driver,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "plataforma": platform.platform(),
+        },
+        "resultados": resultados,
+    }
+
+
+# ========== COMPARACIÓN ==========
+
+def comparar(actual: dict, baseline: dict, tolerancia: float) -> list:
+    """
+    Casos cuya mediana empeora más que `tolerancia` respecto al baseline
+    Solo se comparan las escalas y casos presentes en ambos
+    """
+    regresiones = []
+    print(f"\n{'escala':>8} {'caso':<34} {'baseline':>10} {'actual':>10} {'cambio':>8}")
+    for escala, casos in actual["resultados"].items():
+        for nombre, medida in casos.items():
+            base = baseline.get("resultados", {}).get(escala, {}).get(nombre)
+            if base is None:
+                continue
+            cambio = medida["mediana_ms"] / base["mediana_ms"] - 1 if base["mediana_ms"] else 0.0
+            regresion = cambio > tolerancia
+            marca = "  ← REGRESIÓN" if regresion else ""
+            print(f"{escala:>8} {nombre:<34} {base['mediana_ms']:>10.2f} {medida['mediana_ms']:>10.2f} {cambio:>+7.0%}{marca}")
+            if regresion:
+                regresiones.append({"escala": int(escala), "caso": nombre, "baseline_ms": base["mediana_ms"], "actual_ms": medida["mediana_ms"], "cambio": round(cambio, 4)})
+    if baseline.get("meta", {}).get("dialecto") != actual["meta"]["dialecto"]:
+        print("⚠️  El baseline se midió con otro motor de BD: la comparación no es representativa")
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalas", type=int, nargs="+", default=list(ESCALAS), help="Nº de transacciones por usuario")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument("--casos", default=None, help="Ejecutar solo los casos cuyo nombre contenga este texto")
+    parser.add_argument("--salida", default="bench_resultados.json", help="Fichero JSON con los resultados")
+    parser.add_argument("--baseline", default=None, help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.20, help="Empeoramiento admitido de la mediana (0.20 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    actual = ejecutar(args.escalas, args.repeticiones, args.casos)
+    regresiones = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fichero:
+            baseline = json.load(fichero)
+        regresiones = comparar(actual, baseline, args.tolerancia)
+        actual["comparacion"] = {"baseline": args.baseline, "tolerancia": args.tolerancia, "regresiones": regresiones}
+    with open(args.salida, "w", encoding="utf-8") as fichero:
+        json.dump(actual, fichero, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {args.salida}")
+    if regresiones:
+        print(f"❌ {len(regresiones)} regresiones por encima del {args.tolerancia:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
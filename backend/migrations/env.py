@@ -0,0 +1,55 @@
+"""
+Entorno de Alembic: misma URL (DATABASE_URL) y metadatos que la aplicación
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.infrastructure.config.database import Base, DATABASE_URL
+from app.infrastructure.database import models  # noqa: F401 - registra las tablas en Base.metadata
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configurar_logging", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def url_bd() -> str:
+    """sqlalchemy.url (actualizar_esquema o -x url=...) o, por defecto, DATABASE_URL"""
+    return context.get_x_argument(as_dictionary=True).get("url") or config.get_main_option("sqlalchemy.url") or DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    """Generar el SQL sin conectar (alembic upgrade head --sql)"""
+    url = url_bd()
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # Motor propio sin pool: las migraciones no comparten conexiones con la app
+    conectable = create_engine(url_bd(), poolclass=pool.NullPool)
+    with conectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite no admite la mayoría de ALTER TABLE: recrear la tabla en lote
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
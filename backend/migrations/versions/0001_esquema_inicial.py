@@ -0,0 +1,108 @@
+"""Esquema inicial: el mismo que creaba Base.metadata.create_all al arrancar
+
+Adopta bases de datos ya existentes (create_all o el antiguo init.sql): tablas e índices
+con IF NOT EXISTS, así que `alembic upgrade head` vale también para ellas sin `stamp`.
+Lo que difiere del esquema antiguo (tipos, índices de init.sql) lo ajusta 0003.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "usuarios",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_usuarios_email", "usuarios", ["email"], unique=True, if_not_exists=True)
+    op.create_index("ix_usuarios_id", "usuarios", ["id"], unique=False, if_not_exists=True)
+
+    op.create_table(
+        "transacciones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tipo", sa.String(), nullable=False),
+        sa.Column("cantidad", sa.Float(), nullable=False),
+        sa.Column("fecha", sa.DateTime(), nullable=False),
+        sa.Column("descripcion", sa.String(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["usuarios.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_transacciones_id", "transacciones", ["id"], unique=False, if_not_exists=True)
+    op.create_index(
+        "idx_transacciones_user_fecha_id", "transacciones",
+        ["user_id", sa.text("fecha DESC"), sa.text("id DESC")], unique=False, if_not_exists=True
+    )
+
+    op.create_table(
+        "sueldos",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cantidad", sa.Float(), nullable=False),
+        sa.Column("mes", sa.Integer(), nullable=False),
+        sa.Column("anio", sa.Integer(), nullable=False),
+        sa.Column("fecha", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["usuarios.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("mes", "anio", "user_id", name="uq_mes_anio_user"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_sueldos_id", "sueldos", ["id"], unique=False, if_not_exists=True)
+
+    op.create_table(
+        "resumen_mensual",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("anio", sa.Integer(), nullable=False),
+        sa.Column("mes", sa.Integer(), nullable=False),
+        sa.Column("ingresos", sa.Float(), nullable=False),
+        sa.Column("gastos", sa.Float(), nullable=False),
+        sa.Column("num_transacciones", sa.Integer(), nullable=False),
+        sa.Column("sueldo", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["usuarios.id"]),
+        sa.PrimaryKeyConstraint("user_id", "anio", "mes"),
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "versiones_usuario",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["usuarios.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("versiones_usuario")
+    op.drop_table("resumen_mensual")
+    op.drop_index("ix_sueldos_id", table_name="sueldos")
+    op.drop_table("sueldos")
+    op.drop_index("idx_transacciones_user_fecha_id", table_name="transacciones")
+    op.drop_index("ix_transacciones_id", table_name="transacciones")
+    op.drop_table("transacciones")
+    op.drop_index("ix_usuarios_id", table_name="usuarios")
+    op.drop_index("ix_usuarios_email", table_name="usuarios")
+    op.drop_table("usuarios")
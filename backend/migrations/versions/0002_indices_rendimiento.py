@@ -0,0 +1,38 @@
+"""Índices de rendimiento: fuera los índices duplicados de las claves primarias, índice de sueldos por usuario
+
+Los ix_*_id repetían el índice de la PK (doble escritura en cada INSERT sin ninguna lectura
+que los necesite). Los sueldos de un usuario (listado y balances) se buscan por user_id,
+que no encabeza uq_mes_anio_user.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # if_exists: transacciones particionada (app.tools.particiones) ya no tiene ix_transacciones_id
+    op.drop_index("ix_transacciones_id", table_name="transacciones", if_exists=True)
+    op.drop_index("ix_sueldos_id", table_name="sueldos", if_exists=True)
+    op.drop_index("ix_usuarios_id", table_name="usuarios", if_exists=True)
+    op.create_index("idx_sueldos_user_anio_mes", "sueldos", ["user_id", "anio", "mes"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_sueldos_user_anio_mes", table_name="sueldos")
+    op.create_index("ix_usuarios_id", "usuarios", ["id"], unique=False)
+    op.create_index("ix_sueldos_id", "sueldos", ["id"], unique=False)
+    op.create_index("ix_transacciones_id", "transacciones", ["id"], unique=False)
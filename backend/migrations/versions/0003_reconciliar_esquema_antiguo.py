@@ -0,0 +1,62 @@
+"""Reconciliar bases de datos creadas con el antiguo init.sql con el esquema de models.py
+
+- cantidad era NUMERIC (Decimal en Python): pasa a double precision como en models.py
+- Índices de init.sql que ningún plan usa o que cubre otro índice:
+  idx_transacciones_fecha, _tipo y _user (los cubre idx_transacciones_user_fecha_id),
+  idx_sueldos_mes_anio (lo cubre uq_mes_anio_user) e idx_sueldos_user (idx_sueldos_user_anio_mes)
+- usuarios_email_key (UNIQUE de init.sql) duplica ix_usuarios_email, creado por 0001
+
+Las tablas e índices que faltaban (resumen_mensual, versiones_usuario,
+idx_transacciones_user_fecha_id) ya los crea 0001 con IF NOT EXISTS.
+En una base de datos creada por las migraciones no hace nada.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDICES_INIT_SQL = (
+    ("idx_transacciones_fecha", "transacciones"),
+    ("idx_transacciones_tipo", "transacciones"),
+    ("idx_transacciones_user", "transacciones"),
+    ("idx_sueldos_mes_anio", "sueldos"),
+    ("idx_sueldos_user", "sueldos"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for indice, tabla in INDICES_INIT_SQL:
+        op.drop_index(indice, table_name=tabla, if_exists=True)
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TABLE usuarios DROP CONSTRAINT IF EXISTS usuarios_email_key")
+
+    inspector = sa.inspect(bind)
+    for tabla in ("transacciones", "sueldos"):
+        tipo = next(c["type"] for c in inspector.get_columns(tabla) if c["name"] == "cantidad")
+        if isinstance(tipo, sa.Numeric) and not isinstance(tipo, sa.Float):
+            # Reescribe la tabla (bloqueo exclusivo mientras dura): una sola vez por base de datos antigua
+            with op.batch_alter_table(tabla) as batch_op:
+                batch_op.alter_column(
+                    "cantidad", existing_type=tipo, type_=sa.Float(), existing_nullable=False,
+                    postgresql_using="cantidad::double precision"
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Sin vuelta atrás: el esquema antiguo de init.sql no lo recrea ninguna migración
+    pass
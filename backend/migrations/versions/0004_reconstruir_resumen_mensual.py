@@ -0,0 +1,89 @@
+"""Reconstruir resumen_mensual desde transacciones y sueldos
+
+En bases de datos anteriores al rollup la tabla se creó vacía (0001 o create_all) y solo
+acumula los meses escritos desde entonces: los balances de los meses históricos saldrían a 0.
+Se recalcula entero con un INSERT ... SELECT agrupado por usuario, año y mes (la misma consulta
+que SQLResumenMensualRepository.reconstruir); en una base de datos nueva no inserta nada.
+Para rehacerlo más adelante: `python -m app.tools.reconstruir_resumen`.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+transacciones = sa.table(
+    "transacciones",
+    sa.column("user_id", sa.Integer), sa.column("tipo", sa.String),
+    sa.column("cantidad", sa.Float), sa.column("fecha", sa.DateTime),
+)
+sueldos = sa.table(
+    "sueldos",
+    sa.column("user_id", sa.Integer), sa.column("mes", sa.Integer),
+    sa.column("anio", sa.Integer), sa.column("cantidad", sa.Float),
+)
+resumen_mensual = sa.table(
+    "resumen_mensual",
+    sa.column("user_id", sa.Integer), sa.column("anio", sa.Integer), sa.column("mes", sa.Integer),
+    sa.column("ingresos", sa.Float), sa.column("gastos", sa.Float),
+    sa.column("num_transacciones", sa.Integer), sa.column("sueldo", sa.Float),
+)
+versiones_usuario = sa.table("versiones_usuario", sa.column("version", sa.BigInteger))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    anio = sa.cast(sa.extract("year", transacciones.c.fecha), sa.Integer)
+    mes = sa.cast(sa.extract("month", transacciones.c.fecha), sa.Integer)
+    por_mes = sa.select(
+        transacciones.c.user_id.label("user_id"),
+        anio.label("anio"),
+        mes.label("mes"),
+        sa.func.sum(sa.case((transacciones.c.tipo == "ingreso", transacciones.c.cantidad), else_=0.0)).label("ingresos"),
+        sa.func.sum(sa.case((transacciones.c.tipo == "gasto", transacciones.c.cantidad), else_=0.0)).label("gastos"),
+        sa.func.count().label("num_transacciones"),
+        sa.cast(sa.literal(0.0), sa.Float).label("sueldo"),
+    ).group_by(transacciones.c.user_id, anio, mes)
+    sueldo_mes = sa.select(
+        sueldos.c.user_id,
+        sueldos.c.anio,
+        sueldos.c.mes,
+        sa.cast(sa.literal(0.0), sa.Float),
+        sa.cast(sa.literal(0.0), sa.Float),
+        sa.cast(sa.literal(0), sa.Integer),
+        sueldos.c.cantidad,
+    )
+    combinado = sa.union_all(por_mes, sueldo_mes).subquery()
+    agregado = sa.select(
+        combinado.c.user_id,
+        combinado.c.anio,
+        combinado.c.mes,
+        sa.func.sum(combinado.c.ingresos),
+        sa.func.sum(combinado.c.gastos),
+        sa.func.sum(combinado.c.num_transacciones),
+        sa.func.max(combinado.c.sueldo),
+    ).group_by(combinado.c.user_id, combinado.c.anio, combinado.c.mes)
+
+    op.execute(resumen_mensual.delete())
+    op.execute(resumen_mensual.insert().from_select(
+        ["user_id", "anio", "mes", "ingresos", "gastos", "num_transacciones", "sueldo"], agregado
+    ))
+    # Los balances pueden cambiar: invalidar los ETag ya servidos
+    op.execute(versiones_usuario.update().values(version=versiones_usuario.c.version + 1))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # resumen_mensual es derivada: no hay nada que deshacer
+    pass
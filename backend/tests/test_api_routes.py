@@ -5,7 +5,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.infrastructure.config.migraciones import actualizar_esquema
 
+# La app ya no crea tablas al arrancar: esquema de la BD de pruebas (DATABASE_URL) por migraciones
+actualizar_esquema()
 client = TestClient(app)
 
 # --- AUTH ---
@@ -91,3 +94,245 @@ def test_transaccion_routes():
     check = client.get("/transacciones/", headers=headers)
     assert check.status_code == 200
     assert not any(t["id"] == trans_id for t in check.json())
+
+def test_transacciones_paginacion_cursor():
+    email = f"cursor_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "cursor123"})
+    login = client.post("/auth/token", data={"username": email, "password": "cursor123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    for i in range(3):
+        client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 10.0 + i, "fecha": f"2025-05-0{i + 1}"}, headers=headers)
+    primera = client.get("/transacciones/?limit=2", headers=headers)
+    assert primera.status_code == 200
+    assert len(primera.json()) == 2
+    cursor = primera.headers["X-Next-Cursor"]
+    segunda = client.get(f"/transacciones/?limit=2&cursor={cursor}", headers=headers)
+    assert segunda.status_code == 200
+    assert [t["cantidad"] for t in segunda.json()] == [10.0]
+    assert "X-Next-Cursor" not in segunda.headers
+    assert client.get("/transacciones/?cursor=roto", headers=headers).status_code == 400
+    assert client.get("/transacciones/?limit=1001", headers=headers).status_code == 422
+
+def test_conexiones_vuelven_al_pool():
+    from app.infrastructure.config.database import engine, DB_POOL_SIZE, DB_MAX_OVERFLOW
+    email = f"pool_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "pool1234"})
+    login = client.post("/auth/token", data={"username": email, "password": "pool1234"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    # Más peticiones que conexiones admite el pool: si alguna sesión no se cerrara, se agotaría
+    n = DB_POOL_SIZE + DB_MAX_OVERFLOW + 5
+    for i in range(n):
+        creada = client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 1.0 + i}, headers=headers)
+        assert creada.status_code == 200
+        assert client.get("/transacciones/", headers=headers).status_code == 200
+        assert client.get("/transacciones/balance?mes=1&anio=2025", headers=headers).status_code == 200
+        assert client.put(f"/transacciones/{creada.json()['id']}", json={"cantidad": 2.0}, headers=headers).status_code == 200
+    assert engine.pool.checkedout() == 0
+
+def test_api_asincrona():
+    # Mismas rutas en modo ASYNC_API (async def + AsyncSession sobre aiosqlite/asyncpg)
+    from fastapi import FastAPI
+    from app.api.endpoints import async_auth_endpoints, async_transaccion_endpoints, async_sueldo_endpoints
+    app_async = FastAPI()
+    app_async.include_router(async_auth_endpoints.router)
+    app_async.include_router(async_transaccion_endpoints.router)
+    app_async.include_router(async_sueldo_endpoints.router)
+    email = f"async_{os.urandom(4).hex()}@correo.com"
+    with TestClient(app_async) as c:
+        assert c.post("/auth/register", json={"email": email, "password": "async123"}).status_code == 200
+        assert c.post("/auth/register", json={"email": email, "password": "async123"}).status_code == 400
+        login = c.post("/auth/token", data={"username": email, "password": "async123"})
+        assert login.status_code == 200
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        assert c.get("/auth/me", headers=headers).json()["email"] == email
+        assert c.post("/sueldos/", json={"cantidad": 2000.0, "mes": 3, "anio": 2025}, headers=headers).status_code == 200
+        assert c.get("/sueldos/2025/3", headers=headers).json()["cantidad"] == 2000.0
+        creada = c.post("/transacciones/", json={"tipo": "gasto", "cantidad": 50.0, "fecha": "2025-03-10"}, headers=headers)
+        assert creada.status_code == 200
+        trans_id = creada.json()["id"]
+        assert c.put(f"/transacciones/{trans_id}", json={"cantidad": 80.0}, headers=headers).json()["cantidad"] == 80.0
+        balance = c.get("/transacciones/balance?mes=3&anio=2025", headers=headers).json()
+        assert balance["gastos"] == 80.0
+        assert balance["saldo_total"] == 1920.0
+        assert [t["id"] for t in c.get("/transacciones/", headers=headers).json()] == [trans_id]
+        exportado = c.get("/transacciones/export?formato=ndjson", headers=headers)
+        assert exportado.text.splitlines()[0].startswith('{"id": %d' % trans_id)
+        assert c.delete(f"/transacciones/{trans_id}", headers=headers).status_code in (200, 204)
+        assert c.get("/transacciones/", headers=headers).json() == []
+        listado = c.get("/transacciones/", headers=headers)
+        assert c.get("/transacciones/", headers=dict(headers, **{"If-None-Match": listado.headers["ETag"]})).status_code == 304
+        lote = c.post("/transacciones/batch", json={"operaciones": [{"op": "create", "cantidad": 3.0, "fecha": "2025-03-02"}]}, headers=headers)
+        assert lote.json()["resultados"][0]["ok"] is True
+
+def test_login_devuelve_503_con_hashing_saturado(monkeypatch):
+    import app.auth
+    from app.infrastructure.security.password_hasher import PasswordHasher
+    email = f"storm_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "storm123"})
+    monkeypatch.setattr(app.auth, "password_hasher", PasswordHasher(workers=0, capacidad=0))
+    response = client.post("/auth/token", data={"username": email, "password": "storm123"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+def test_importar_transacciones_csv_y_ndjson():
+    email = f"import_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "import123"})
+    login = client.post("/auth/token", data={"username": email, "password": "import123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    csv_data = (
+        "tipo,cantidad,descripcion,fecha\n"
+        "ingreso,1000,nómina,2025-02-01\n"
+        "gasto,40.5,super,2025-02-03\n"
+        "gasto,-3,negativa,2025-02-04\n"
+        "gasto,10,fecha rota,03/02/2025\n"
+        "prestamo,10,,2025-02-05\n"
+    )
+    response = client.post("/transacciones/import", files={"fichero": ("banco.csv", csv_data, "text/csv")}, headers=headers)
+    assert response.status_code == 200
+    resultado = response.json()
+    assert resultado["importadas"] == 2
+    assert resultado["rechazadas"] == 3
+    assert [e["linea"] for e in resultado["errores"]] == [4, 5, 6]
+    ndjson = '{"tipo": "gasto", "cantidad": 9.5, "fecha": "2025-02-10"}\nno es json\n\n[1, 2]\n'
+    response = client.post("/transacciones/import?formato=ndjson", files={"fichero": ("banco.txt", ndjson)}, headers=headers)
+    assert response.json()["importadas"] == 1
+    assert [e["linea"] for e in response.json()["errores"]] == [2, 4]
+    # El rollup mensual queda al día con la importación
+    balance = client.get("/transacciones/balance?mes=2&anio=2025", headers=headers).json()
+    assert balance["ingresos"] == 1000.0
+    assert balance["gastos"] == 50.0
+    assert len(client.get("/transacciones/", headers=headers).json()) == 3
+    sin_formato = client.post("/transacciones/import", files={"fichero": ("banco.txt", "x")}, headers=headers)
+    assert sin_formato.status_code == 400
+
+def test_exportar_transacciones_streaming():
+    import csv
+    import io
+    import json
+    from app.infrastructure.config.database import engine
+    email = f"export_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "export123"})
+    login = client.post("/auth/token", data={"username": email, "password": "export123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    for i, fecha in enumerate(["2025-01-15", "2025-02-01", "2025-02-20", "2025-03-01"]):
+        client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 10.0 + i, "descripcion": f"fila, {i}", "fecha": fecha}, headers=headers)
+    response = client.get("/transacciones/export?desde=2025-02-01&hasta=2025-03-01", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    filas = list(csv.DictReader(io.StringIO(response.text)))
+    assert [f["cantidad"] for f in filas] == ["11.0", "12.0"]
+    assert filas[0]["descripcion"] == "fila, 1"
+    response = client.get("/transacciones/export?formato=ndjson", headers=headers)
+    lineas = [json.loads(l) for l in response.text.splitlines()]
+    assert [l["fecha"][:10] for l in lineas] == ["2025-01-15", "2025-02-01", "2025-02-20", "2025-03-01"]
+    assert client.get("/transacciones/export?formato=xml", headers=headers).status_code == 400
+    # La sesión propia del streaming se devuelve al pool
+    assert engine.pool.checkedout() == 0
+
+def test_lote_transacciones_en_una_transaccion():
+    email = f"batch_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "batch123"})
+    login = client.post("/auth/token", data={"username": email, "password": "batch123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    a = client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 10.0, "fecha": "2025-04-01"}, headers=headers).json()
+    b = client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 20.0, "fecha": "2025-04-02"}, headers=headers).json()
+    # Una operación inválida rechaza el lote completo sin escribir nada
+    invalido = client.post("/transacciones/batch", json={"operaciones": [
+        {"op": "create", "tipo": "ingreso", "cantidad": 5.0},
+        {"op": "delete", "id": 999999},
+        {"op": "update"},
+    ]}, headers=headers)
+    assert invalido.status_code == 400
+    assert [r["ok"] for r in invalido.json()["detail"]["resultados"]] == [True, False, False]
+    assert len(client.get("/transacciones/", headers=headers).json()) == 2
+    response = client.post("/transacciones/batch", json={"operaciones": [
+        {"op": "create", "tipo": "ingreso", "cantidad": 500.0, "fecha": "2025-04-05"},
+        {"op": "create", "cantidad": 7.5, "descripcion": "café", "fecha": "2025-05-01"},
+        {"op": "update", "id": a["id"], "cantidad": 15.0},
+        {"op": "delete", "id": b["id"]},
+    ]}, headers=headers)
+    assert response.status_code == 200
+    resultados = response.json()["resultados"]
+    assert all(r["ok"] for r in resultados)
+    assert resultados[0]["transaccion"]["cantidad"] == 500.0
+    assert resultados[1]["transaccion"]["tipo"] == "gasto"
+    assert resultados[2]["transaccion"]["cantidad"] == 15.0
+    ids = {t["id"] for t in client.get("/transacciones/", headers=headers).json()}
+    assert ids == {a["id"], resultados[0]["id"], resultados[1]["id"]}
+    abril = client.get("/transacciones/balance?mes=4&anio=2025", headers=headers).json()
+    assert (abril["ingresos"], abril["gastos"]) == (500.0, 15.0)
+    assert client.get("/transacciones/balance?mes=5&anio=2025", headers=headers).json()["gastos"] == 7.5
+
+def test_etag_y_304_por_version_de_usuario():
+    email = f"etag_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "etag1234"})
+    login = client.post("/auth/token", data={"username": email, "password": "etag1234"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    primera = client.get("/transacciones/", headers=headers)
+    etag = primera.headers["ETag"]
+    condicional = dict(headers, **{"If-None-Match": etag})
+    for ruta in ("/transacciones/", "/transacciones/balance?mes=1&anio=2025", "/sueldos/"):
+        no_modificado = client.get(ruta, headers=condicional)
+        assert no_modificado.status_code == 304
+        assert no_modificado.content == b""
+    # Cualquier escritura (transacción o sueldo) cambia la versión
+    client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 5.0}, headers=headers)
+    segunda = client.get("/transacciones/", headers=condicional)
+    assert segunda.status_code == 200
+    assert segunda.headers["ETag"] != etag
+    client.post("/sueldos/", json={"cantidad": 1000.0, "mes": 1, "anio": 2025}, headers=headers)
+    tercera = client.get("/sueldos/2025/1", headers=dict(headers, **{"If-None-Match": segunda.headers["ETag"]}))
+    assert tercera.status_code == 200
+    assert client.get("/sueldos/2025/1", headers=dict(headers, **{"If-None-Match": tercera.headers["ETag"]})).status_code == 304
+
+def test_listados_rapidos_igual_que_dtos(monkeypatch):
+    from app.api import responses
+    email = f"rapido_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "rapido123"})
+    login = client.post("/auth/token", data={"username": email, "password": "rapido123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    client.post("/transacciones/", json={"tipo": "ingreso", "cantidad": 12.5, "descripcion": "ñandú", "fecha": "2025-06-01"}, headers=headers)
+    client.post("/transacciones/", json={"tipo": "gasto", "cantidad": 3.0}, headers=headers)
+    client.post("/sueldos/", json={"cantidad": 1800.0, "mes": 6, "anio": 2025}, headers=headers)
+    rapidas = {ruta: client.get(ruta, headers=headers) for ruta in ("/transacciones/?limit=1", "/sueldos/")}
+    monkeypatch.setattr(responses, "FAST_JSON_RESPONSES", False)
+    for ruta, rapida in rapidas.items():
+        lenta = client.get(ruta, headers=headers)
+        assert rapida.json() == lenta.json()
+        assert rapida.headers["ETag"] == lenta.headers["ETag"]
+        assert rapida.headers.get("X-Next-Cursor") == lenta.headers.get("X-Next-Cursor")
+    assert "X-Next-Cursor" in rapidas["/transacciones/?limit=1"].headers
+
+def test_metricas_prometheus_por_ruta():
+    from app.api.metrics import PETICIONES, CONSULTAS
+    email = f"metricas_{os.urandom(4).hex()}@correo.com"
+    client.post("/auth/register", json={"email": email, "password": "metricas123"})
+    token = client.post("/auth/token", data={"username": email, "password": "metricas123"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    consultas_antes = CONSULTAS.total("GET", "/transacciones/")
+    client.get("/transacciones/", headers=headers)
+    estado = str(client.delete("/transacciones/999999", headers=headers).status_code)
+    antes = PETICIONES.valor("DELETE", "/transacciones/{transaccion_id}", estado)
+    client.delete("/transacciones/999999", headers=headers)
+
+    # Sin token ni dirección permitida, /metrics no existe
+    assert client.get("/metrics").status_code == 404
+    from app.api import metrics
+    metrics.METRICS_TOKEN = "token-scraper"
+    try:
+        assert client.get("/metrics", headers={"Authorization": "Bearer otro"}).status_code == 404
+        response = client.get("/metrics", headers={"Authorization": "Bearer token-scraper"})
+    finally:
+        metrics.METRICS_TOKEN = None
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    texto = response.text
+    # Etiqueta por plantilla de ruta, no por URL concreta
+    assert PETICIONES.valor("DELETE", "/transacciones/{transaccion_id}", estado) == antes + 1
+    assert 'route="/transacciones/999999"' not in texto
+    assert CONSULTAS.total("GET", "/transacciones/") == consultas_antes + 1
+    assert '# TYPE http_request_duration_seconds histogram' in texto
+    assert 'http_request_db_queries_bucket{method="GET",route="/transacciones/",le="+Inf"}' in texto
+    from app.infrastructure.config.database import ASYNC_API
+    assert f'db_queries_total{{engine="{"async" if ASYNC_API else "sync"}"}}' in texto
+    assert 'db_pool_checked_out{engine="sync"} 0' in texto
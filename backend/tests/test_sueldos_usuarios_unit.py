@@ -82,6 +82,24 @@ def test_crear_usuario_unit(db, user_email, user_password):
     assert verify_password(user_password, usuario.hashed_password)
     assert usuario.is_active is True
 
+def test_crear_usuario_publica_evento_unit(db, user_email):
+    from app.domain.entities.usuario import Usuario
+    from app.domain.services.event_bus import event_bus
+    from app.domain.services.eventos import UsuarioActualizado
+    from app.infrastructure.cache.usuario_cache import usuario_cache
+    from app.infrastructure.database.usuario_repository import SQLUsuarioRepository
+    # Entrada obsoleta (p. ej. de un usuario borrado con el mismo email)
+    usuario_cache.set(Usuario.from_row(id=-1, email=user_email, hashed_password="x", is_active=False, created_at=None))
+    recibidos = []
+    event_bus.suscribir(UsuarioActualizado, recibidos.append)
+    try:
+        usuario = SQLUsuarioRepository(db).create(user_email, "hash")
+    finally:
+        event_bus.cancelar(UsuarioActualizado, recibidos.append)
+    # Misma vía que save/update: evento tras el commit, que invalida la caché
+    assert [(e.user_id, e.email) for e in recibidos] == [(usuario.id, user_email)]
+    assert usuario_cache.get(user_email) is None
+
 def test_perfil_usuario_unit(db, user_id, user_email):
     usecase = PerfilUsuarioUseCase(db)
     usuario = usecase.execute(user_id=user_id)
@@ -112,3 +130,232 @@ def test_obtener_sueldo_unit(db, user_id):
     assert sueldo.mes == 9
     assert sueldo.anio == 2025
     assert sueldo.user_id == user_id
+
+def test_cache_usuario_autenticado_unit(db, user_id, user_email):
+    from types import SimpleNamespace
+    from fastapi import HTTPException
+    from app.auth import create_access_token
+    from app.api.dependencies.auth import get_current_user_from_token
+    from app.infrastructure.database.usuario_repository import SQLUsuarioRepository
+    from app.infrastructure.cache.usuario_cache import usuario_cache
+    usuario_cache.clear()
+    repo = SQLUsuarioRepository(db)
+    credenciales = SimpleNamespace(credentials=create_access_token({"email": user_email}))
+    antes = usuario_cache.stats()
+    assert get_current_user_from_token(credenciales, repo).id == user_id
+    assert get_current_user_from_token(credenciales, repo).id == user_id
+    despues = usuario_cache.stats()
+    assert despues["misses"] - antes["misses"] == 1
+    assert despues["hits"] - antes["hits"] == 1
+    # Desactivar invalida la entrada: la siguiente petición ya ve is_active=False
+    usuario = repo.find_by_id(user_id)
+    usuario.is_active = False
+    repo.update(usuario)
+    with pytest.raises(HTTPException):
+        get_current_user_from_token(credenciales, repo)
+    repo.delete(user_id)
+    assert usuario_cache.get(user_email) is None
+
+
+def test_cache_usuario_concurrente_unit():
+    from concurrent.futures import ThreadPoolExecutor
+    from app.domain.entities.usuario import Usuario
+    from app.infrastructure.cache.usuario_cache import UsuarioCache
+    cache = UsuarioCache(maxsize=8, ttl=60)
+
+    def trabajar(hilo):
+        # set() reconstruye el índice id → email mientras otros hilos invalidan por id
+        for i in range(2000):
+            usuario_id = hilo * 10_000 + i
+            cache.set(Usuario.from_row(id=usuario_id, email=f"u{usuario_id}@test.com", hashed_password="x",
+                                       is_active=True, created_at=None))
+            cache.invalidate(usuario_id=usuario_id - 3)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(trabajar, range(8)))
+    assert len(cache._email_por_id) <= 2 * 8 + 8
+
+def test_cache_tokens_verificados_unit():
+    from datetime import timedelta
+    from fastapi import HTTPException
+    from app.auth import create_access_token, verify_token, token_cache
+    token = create_access_token({"email": "cache@correo.com"}, expires_delta=timedelta(minutes=5))
+    hits = token_cache.stats()["hits"]
+    assert verify_token(token) == {"email": "cache@correo.com"}
+    assert verify_token(token) == {"email": "cache@correo.com"}
+    assert token_cache.stats()["hits"] == hits + 1
+    # Tokens caducados o con firma alterada nunca se aceptan ni se cachean
+    caducado = create_access_token({"email": "cache@correo.com"}, expires_delta=timedelta(seconds=-1))
+    for invalido in (caducado, token[:-2] + ("AA" if token[-2:] != "AA" else "BB")):
+        with pytest.raises(HTTPException):
+            verify_token(invalido)
+        with pytest.raises(HTTPException):
+            verify_token(invalido)
+
+def test_hashing_en_pool_con_cola_acotada_unit():
+    from app.infrastructure.security.password_hasher import (
+        PasswordHasher, HashingSaturadoError, HASH_COMPLETADOS, HASH_LATENCIA, HASH_RECHAZADOS
+    )
+    completados, verificados = HASH_COMPLETADOS.valor("hash"), HASH_LATENCIA.total("verify")
+    hasher = PasswordHasher(workers=1, capacidad=2, rounds=1000)
+    try:
+        hasher.iniciar()
+        # Procesos del forkserver: nunca fork() directo de un proceso con hilos
+        assert hasher._pool._mp_context.get_start_method() == "forkserver"
+        hashed = hasher.hash("secreta123")
+        assert "$1000$" in hashed
+        assert hasher.verify("secreta123", hashed)
+        assert not hasher.verify("otra", hashed)
+        assert hasher.stats()["completados"] == 3
+        assert hasher.stats()["en_vuelo"] == 0
+    finally:
+        hasher.shutdown()
+    assert hasher._pool is None
+    # Sin huecos libres se rechaza de inmediato en lugar de encolar
+    lleno = PasswordHasher(workers=0, capacidad=0)
+    with pytest.raises(HashingSaturadoError):
+        lleno.hash("secreta123")
+    assert lleno.stats()["rechazados"] == 1
+    # Las mismas cifras en el registro de Prometheus
+    assert HASH_COMPLETADOS.valor("hash") == completados + 1
+    assert HASH_LATENCIA.total("verify") == verificados + 2
+    assert HASH_RECHAZADOS.valor("hash") >= 1
+
+def test_entidades_slots_y_from_row_unit():
+    from datetime import datetime
+    import copy
+    from app.domain.entities.transaccion import Transaccion
+    from app.domain.entities.sueldo import Sueldo
+    from app.domain.entities.usuario import Usuario
+
+    # Datos nuevos: __init__ sigue aplicando las reglas de dominio
+    with pytest.raises(ValueError):
+        Transaccion(tipo="otro", cantidad=10, user_id=1)
+    with pytest.raises(ValueError):
+        Sueldo(cantidad=1000, mes=1, anio=2019, user_id=1)
+
+    # Datos persistidos: from_row no revalida (p. ej. un año fuera del rango de alta)
+    fecha = datetime(2019, 1, 1)
+    sueldo = Sueldo.from_row(id=1, cantidad=1000.0, mes=1, anio=2019, user_id=1, fecha=fecha)
+    assert sueldo.get_period_key() == "2019-01"
+    transaccion = Transaccion.from_row(id=2, tipo="gasto", cantidad=5.0, user_id=1, fecha=fecha)
+    assert transaccion.get_amount_with_sign() == -5.0 and transaccion.descripcion is None
+    usuario = Usuario.from_row(id=3, email="a@b.com", hashed_password="h", is_active=True, created_at=fecha)
+    assert usuario.transacciones == [] and copy.copy(usuario).email == "a@b.com"
+
+    # __slots__: sin __dict__ por instancia ni atributos arbitrarios
+    for entidad in (sueldo, transaccion, usuario):
+        assert not hasattr(entidad, "__dict__")
+        with pytest.raises(AttributeError):
+            entidad.otro = 1
+
+
+def test_migraciones_sin_deriva_con_modelos_unit(tmp_path):
+    from alembic.autogenerate import compare_metadata
+    from alembic.migration import MigrationContext
+    from app.infrastructure.config.migraciones import actualizar_esquema, configuracion
+    from alembic import command
+    url = f"sqlite:///{tmp_path / 'migraciones.db'}"
+    actualizar_esquema(url)
+    motor = create_engine(url)
+    try:
+        # El esquema de las migraciones es exactamente el de models.py (tablas, columnas e índices)
+        with motor.connect() as conn:
+            assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+        command.downgrade(configuracion(url), "base")
+        with motor.connect() as conn:
+            assert MigrationContext.configure(conn).get_current_revision() is None
+    finally:
+        motor.dispose()
+
+
+
+def test_migraciones_adoptan_esquema_de_init_sql_unit(tmp_path):
+    from sqlalchemy import Float, inspect
+    from app.infrastructure.config.migraciones import actualizar_esquema
+    url = f"sqlite:///{tmp_path / 'antigua.db'}"
+    motor = create_engine(url)
+    try:
+        # Esquema del antiguo init.sql: cantidad NUMERIC, índices propios y sin las tablas nuevas
+        with motor.begin() as conn:
+            for sentencia in (
+                "CREATE TABLE usuarios (id INTEGER PRIMARY KEY, email VARCHAR(255) UNIQUE NOT NULL, "
+                "hashed_password VARCHAR(255) NOT NULL, is_active BOOLEAN DEFAULT TRUE, created_at TIMESTAMP)",
+                "CREATE TABLE sueldos (id INTEGER PRIMARY KEY, cantidad NUMERIC NOT NULL, mes INT NOT NULL, "
+                "anio INT NOT NULL, fecha TIMESTAMP NOT NULL, user_id INTEGER NOT NULL REFERENCES usuarios(id), "
+                "CONSTRAINT uq_mes_anio_user UNIQUE (mes, anio, user_id))",
+                "CREATE TABLE transacciones (id INTEGER PRIMARY KEY, tipo VARCHAR(50) NOT NULL, cantidad NUMERIC NOT NULL, "
+                "descripcion TEXT, fecha TIMESTAMP NOT NULL, user_id INTEGER NOT NULL REFERENCES usuarios(id))",
+                "CREATE INDEX idx_transacciones_fecha ON transacciones(fecha)",
+                "CREATE INDEX idx_transacciones_user ON transacciones(user_id)",
+                "CREATE INDEX idx_sueldos_user ON sueldos(user_id)",
+                "INSERT INTO usuarios (id, email, hashed_password) VALUES (1, 'antiguo@test.com', 'x')",
+                "INSERT INTO transacciones VALUES (1, 'gasto', 10.5, NULL, '2025-01-02 00:00:00', 1)",
+                "INSERT INTO transacciones VALUES (2, 'ingreso', 40, NULL, '2025-01-20 00:00:00', 1)",
+                "INSERT INTO sueldos VALUES (1, 1800, 2, 2025, '2025-02-01 00:00:00', 1)",
+            ):
+                conn.exec_driver_sql(sentencia)
+
+        # Sin stamp: 0001 adopta las tablas existentes y 0003 ajusta tipos e índices
+        actualizar_esquema(url)
+        inspector = inspect(motor)
+        assert {"resumen_mensual", "versiones_usuario"} <= set(inspector.get_table_names())
+        indices = {i["name"] for t in ("transacciones", "sueldos") for i in inspector.get_indexes(t)}
+        assert {"idx_transacciones_user_fecha_id", "idx_sueldos_user_anio_mes"} <= indices
+        assert not indices & {"idx_transacciones_fecha", "idx_transacciones_user", "idx_sueldos_user"}
+        for tabla in ("transacciones", "sueldos"):
+            cantidad = next(c for c in inspector.get_columns(tabla) if c["name"] == "cantidad")
+            assert isinstance(cantidad["type"], Float)
+        with motor.connect() as conn:
+            assert conn.exec_driver_sql("SELECT cantidad FROM transacciones WHERE id = 1").scalar() == 10.5
+            # 0004: el rollup refleja el histórico anterior a su creación
+            assert conn.exec_driver_sql(
+                "SELECT anio, mes, ingresos, gastos, num_transacciones, sueldo FROM resumen_mensual ORDER BY mes"
+            ).all() == [(2025, 1, 40.0, 10.5, 2, 0.0), (2025, 2, 0.0, 0.0, 0, 1800.0)]
+    finally:
+        motor.dispose()
+
+def test_dimensionado_pool_por_presupuesto_de_conexiones_unit(monkeypatch):
+    from app import server
+    assert server.dimensionar_pool(90, 4, maximo=100) == (15, 7)
+    assert server.dimensionar_pool(90, 2) == (14, 6)  # tope por worker
+    assert server.dimensionar_pool(5, 4) == (1, 0)
+    with pytest.raises(server.PresupuestoConexionesError):
+        server.dimensionar_pool(3, 4)
+    # Valores explícitos que no caben en el presupuesto se sustituyen por los calculados
+    monkeypatch.setenv("ASYNC_API", "true")
+    monkeypatch.setenv("DB_POOL_SIZE", "10")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "10")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "1")
+    monkeypatch.setenv("METRICS_MULTIPROC_DIR", "/tmp/finanzas_metrics_test")
+    dimension = server.configurar_entorno(workers=8)
+    assert dimension["motores"] == 2
+    assert dimension["conexiones_max"] <= dimension["presupuesto"]
+    assert os.environ["DB_POOL_SIZE"] == str(dimension["pool_size"])
+
+
+def test_metricas_sumadas_entre_workers_unit(tmp_path):
+    import json
+    from app.infrastructure.metrics.registro import Registro
+    from app.infrastructure.metrics.multiproceso import agregar, preparar_directorio, retirar_proceso
+    preparar_directorio(str(tmp_path))
+    # Dos workers con su propio registro volcado en el directorio compartido
+    for pid, peticiones, en_curso in ((101, 3, 1), (102, 5, 2)):
+        worker = Registro()
+        worker.contador("peticiones_total", "Peticiones", ("ruta",)).inc("/health", cantidad=peticiones)
+        worker.histograma("latencia_seconds", "Latencia", buckets=(0.1, 1.0)).observe(0.05)
+        worker.gauge("en_curso", "En curso").set(en_curso)
+        (tmp_path / f"{pid}.json").write_text(json.dumps({"id": f"w{pid}", "metricas": worker.instantanea()}))
+
+    texto = agregar(str(tmp_path)).exponer()
+    assert 'peticiones_total{ruta="/health"} 8' in texto
+    assert 'latencia_seconds_bucket{le="0.1"} 2' in texto
+    assert "en_curso 3" in texto
+
+    # Worker terminado: sus contadores siguen sumando (acumulado), su gauge ya no
+    retirar_proceso(str(tmp_path), 101)
+    assert not (tmp_path / "101.json").exists()
+    texto = agregar(str(tmp_path)).exponer()
+    assert 'peticiones_total{ruta="/health"} 8' in texto
+    assert "latencia_seconds_count 2" in texto
+    assert "en_curso 2" in texto
@@ -4,12 +4,12 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
 from app.infrastructure.config.database import SessionLocal, Base
-from app.infrastructure.database.models import TransaccionORM, UsuarioORM
+from app.infrastructure.database.models import TransaccionORM, UsuarioORM, SueldoORM, ResumenMensualORM, VersionUsuarioORM
 from app.application.use_cases.transaccion.crear_transaccion import CrearTransaccionUseCase
 from app.application.use_cases.transaccion.obtener_transacciones import ObtenerTransaccionesUseCase
 from app.application.use_cases.transaccion.actualizar_transaccion import ActualizarTransaccionUseCase
 from app.application.use_cases.transaccion.eliminar_transaccion import EliminarTransaccionUseCase
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, select
 from sqlalchemy.orm import sessionmaker
 
 # Configuración de BD en memoria para tests
@@ -22,6 +22,9 @@ Base.metadata.create_all(bind=engine)
 def db():
     session = TestingSessionLocal()
     # Limpiar usuarios y transacciones antes de cada test
+    session.query(ResumenMensualORM).delete()
+    session.query(VersionUsuarioORM).delete()
+    session.query(SueldoORM).delete()
     session.query(TransaccionORM).delete()
     session.query(UsuarioORM).delete()
     session.commit()
@@ -75,3 +78,277 @@ def test_eliminar_transaccion_unit(db, user_id):
     # Verificar que ya no existe
     transacciones = db.query(TransaccionORM).filter_by(id=transaccion.id).all()
     assert len(transacciones) == 0
+
+def test_obtener_transacciones_por_mes_unit(db, user_id):
+    from datetime import datetime
+    usecase_create = CrearTransaccionUseCase(db)
+    usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=10.0, descripcion="fin de noviembre", fecha="2024-11-30")
+    usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=20.0, descripcion="diciembre", fecha="2024-12-31")
+    usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=30.0, descripcion="enero", fecha="2025-01-01")
+    usecase_get = ObtenerTransaccionesUseCase(db)
+    diciembre = usecase_get.execute(user_id=user_id, mes=12, anio=2024)
+    assert [t.descripcion for t in diciembre] == ["diciembre"]
+    anio_2024 = usecase_get.execute(user_id=user_id, anio=2024)
+    assert [t.descripcion for t in anio_2024] == ["diciembre", "fin de noviembre"]
+    # Rango semiabierto: hasta es exclusivo
+    rango = usecase_get.execute(user_id=user_id, desde=datetime(2024, 12, 1), hasta=datetime(2025, 1, 1))
+    assert [t.descripcion for t in rango] == ["diciembre"]
+
+def test_paginacion_cursor_unit(db, user_id):
+    usecase_create = CrearTransaccionUseCase(db)
+    for i in range(5):
+        # Misma fecha para forzar el desempate por id
+        usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=10.0 + i, descripcion=f"t{i}", fecha="2025-03-10")
+    usecase_get = ObtenerTransaccionesUseCase(db)
+    vistos = []
+    cursor = None
+    while True:
+        pagina, cursor = usecase_get.obtener_pagina(user_id=user_id, limit=2, cursor=cursor)
+        vistos.extend(t.descripcion for t in pagina)
+        if cursor is None:
+            break
+    assert vistos == ["t4", "t3", "t2", "t1", "t0"]
+    with pytest.raises(ValueError):
+        usecase_get.execute(user_id=user_id, cursor="no-es-un-cursor")
+
+def test_calcular_balance_unit(db, user_id):
+    from app.application.use_cases.balance.calcular_balance import CalcularBalanceUseCase
+    from app.domain.entities.sueldo import Sueldo
+    from app.infrastructure.database.sueldo_repository import SQLSueldoRepository
+    SQLSueldoRepository(db).upsert_by_period(Sueldo(cantidad=2000.0, mes=3, anio=2025, user_id=user_id))
+    usecase_create = CrearTransaccionUseCase(db)
+    usecase_create.execute(user_id=user_id, tipo="ingreso", cantidad=300.0, fecha="2025-03-05")
+    usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=120.0, fecha="2025-03-20")
+    usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=50.0, fecha="2025-04-01")
+    usecase = CalcularBalanceUseCase(db)
+    balance = usecase.execute(user_id=user_id, mes=3, anio=2025)
+    assert balance["saldo_transacciones"] == 180.0
+    assert balance["saldo_sueldo"] == 2000.0
+    assert balance["saldo_total"] == 2180.0
+    balances = usecase.execute_periodos(user_id=user_id, periodos=[(2, 2025), (3, 2025), (4, 2025)])
+    assert [b["saldo_total"] for b in balances] == [0.0, 2180.0, -50.0]
+    assert [b["mes"] for b in balances] == [2, 3, 4]
+
+def test_resumen_mensual_incremental_unit(db, user_id):
+    from datetime import datetime
+    from app.infrastructure.database.resumen_repository import SQLResumenMensualRepository
+    def resumen():
+        filas = db.query(ResumenMensualORM).filter_by(user_id=user_id).all()
+        return {(f.anio, f.mes): (f.ingresos, f.gastos, f.num_transacciones, f.sueldo) for f in filas}
+    usecase_create = CrearTransaccionUseCase(db)
+    t1 = usecase_create.execute(user_id=user_id, tipo="ingreso", cantidad=100.0, fecha="2025-01-15")
+    t2 = usecase_create.execute(user_id=user_id, tipo="gasto", cantidad=40.0, fecha="2025-01-20")
+    assert resumen() == {(2025, 1): (100.0, 40.0, 2, 0.0)}
+    # Mover t2 a febrero y cambiar importe: se ajustan ambos meses
+    ActualizarTransaccionUseCase(db).execute(user_id=user_id, transaccion_id=t2.id, cantidad=60.0, fecha=datetime(2025, 2, 3))
+    assert resumen() == {(2025, 1): (100.0, 0.0, 1, 0.0), (2025, 2): (0.0, 60.0, 1, 0.0)}
+    EliminarTransaccionUseCase(db).execute(user_id=user_id, transaccion_id=t1.id)
+    incremental = {k: v for k, v in resumen().items() if v[2] or v[3]}
+    # La reconstrucción desde datos crudos coincide con el mantenimiento incremental
+    SQLResumenMensualRepository(db).reconstruir(user_id=user_id)
+    db.commit()
+    assert resumen() == incremental == {(2025, 2): (0.0, 60.0, 1, 0.0)}
+
+def test_lecturas_proyectadas_sin_identity_map_unit(db, user_id):
+    from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+    from app.infrastructure.database.sueldo_repository import SQLSueldoRepository
+    from app.domain.entities.sueldo import Sueldo
+    usecase = CrearTransaccionUseCase(db)
+    usecase.execute(user_id=user_id, tipo="ingreso", cantidad=300.0, descripcion="marzo", fecha="2025-03-10")
+    usecase.execute(user_id=user_id, tipo="gasto", cantidad=20.0, fecha="2025-04-02")
+    SQLSueldoRepository(db).save(Sueldo(cantidad=1500.0, mes=3, anio=2025, user_id=user_id))
+    db.expunge_all()
+
+    repo = SQLTransaccionRepository(db)
+    todas = repo.find_all_by_user(user_id)
+    marzo = repo.find_by_user_and_month(user_id, mes=3, anio=2025)
+    sueldos = SQLSueldoRepository(db).find_all_by_user(user_id)
+    # Las lecturas proyectadas no cargan instancias ORM en la sesión
+    assert len(db.identity_map) == 0
+    assert sorted(t.cantidad for t in todas) == [20.0, 300.0]
+    assert [(t.tipo, t.descripcion, t.fecha.month) for t in marzo] == [("ingreso", "marzo", 3)]
+    assert [(s.cantidad, s.mes, s.anio, s.user_id) for s in sueldos] == [(1500.0, 3, 2025, user_id)]
+
+def test_perfilador_sql_lentas_y_n_mas_uno_unit(tmp_path, caplog):
+    import json
+    from sqlalchemy import text
+    from app.infrastructure.metrics.profiler import PerfiladorSQL, forma_sentencia
+    assert forma_sentencia("SELECT * FROM t WHERE id IN (?, ?, ?)\n AND x = 3") == forma_sentencia("SELECT * FROM t WHERE id IN (?) AND x = 7")
+
+    fichero = tmp_path / "perfil.jsonl"
+    perfilador = PerfiladorSQL(umbral_ms=0, repeticiones=2, fichero=str(fichero))
+    motor = create_engine("sqlite:///:memory:")
+    perfilador.instrumentar_engine(motor)
+    with caplog.at_level("WARNING", logger="app.sql_profiler"):
+        token = perfilador.iniciar_peticion({"type": "http", "method": "GET", "path": "/x"})
+        with motor.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :i"), {"i": i})  # mismo patrón por fila: N+1
+            conn.execute(text("SELECT 1, 2"))
+        resumen = perfilador.finalizar_peticion(token, 200)
+    assert resumen["queries"] == 4 and resumen["slow_queries"] == 4
+    assert [r["veces"] for r in resumen["n_plus_one"]] == [3]
+    assert "SQL lenta" in caplog.text and "Posible N+1 en GET /x" in caplog.text
+    assert json.loads(fichero.read_text().splitlines()[-1])["path"] == "/x"
+
+def test_seed_reparto_y_determinismo_unit():
+    from datetime import date
+    from app.tools.seed import GeneradorUsuario, _dias, _meses, reparto
+    assert reparto(4, 10, 0) == [10, 10, 10, 10]
+    sesgado = reparto(100, 50, 1.0)
+    assert sum(sesgado) == 5000 and sesgado[0] > 10 * sesgado[-1]
+
+    dias, pesos = _dias(date(2023, 1, 1), date(2024, 1, 1))
+    meses = _meses(date(2023, 1, 1), date(2024, 1, 1))
+    generados = []
+    for _ in range(2):
+        generador = GeneradorUsuario(7, 3, dias, pesos, meses)
+        resumen = {}
+        filas = generador.sueldos(1, resumen) + generador.transacciones(1, 200, resumen)
+        generados.append((filas, resumen))
+    # Misma semilla e índice → mismos datos; el rollup en memoria cuadra con las filas
+    assert generados[0] == generados[1]
+    filas, resumen = generados[0]
+    assert len(resumen) == 12 and sum(m[2] for m in resumen.values()) == 200
+
+def test_lecturas_en_replica_con_read_your_writes_unit(tmp_path):
+    from app.infrastructure.config.replica import crear_routing_session, escrituras_recientes, lectura
+    from app.infrastructure.database.transaccion_repository import SQLTransaccionRepository
+    from app.infrastructure.database.version_repository import SQLVersionUsuarioRepository
+    from app.domain.entities.transaccion import Transaccion
+    # Dos instancias: la "réplica" está vacía, así se ve a dónde va cada lectura
+    primario = create_engine(f"sqlite:///{tmp_path / 'primario.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=primario)
+    Base.metadata.create_all(bind=replica)
+    Sesion = sessionmaker(bind=primario, autoflush=False, class_=crear_routing_session(replica))
+
+    db = Sesion()
+    try:
+        usuario = UsuarioORM(email="replica@correo.com", hashed_password="1234")
+        db.add(usuario)
+        db.commit()
+        repo = SQLTransaccionRepository(db)
+        creada = repo.save(Transaccion(tipo="gasto", cantidad=10.0, user_id=usuario.id))
+        # Recién escrito: sus lecturas van al primario (read-your-writes)
+        assert len(repo.find_all_by_user(usuario.id)) == 1
+        # Otro worker (sin la escritura en memoria): la réplica va por detrás en versiones_usuario
+        escrituras_recientes.invalidate(usuario.id)
+        assert len(repo.find_all_by_user(usuario.id)) == 1
+        # La réplica alcanza la versión del primario: lectura en la réplica (sin transacciones)
+        version = db.execute(select(VersionUsuarioORM.version).where(VersionUsuarioORM.user_id == usuario.id)).scalar()
+        # La versión de los ETag se lee del primario aunque el bloque lea de la réplica
+        with lectura(db):
+            assert SQLVersionUsuarioRepository(db).get(usuario.id) == version >= 1
+        with replica.begin() as conn:
+            conn.execute(VersionUsuarioORM.__table__.insert().values(user_id=usuario.id, version=version))
+        # La versión del primario ya leída para el ETag no se vuelve a consultar
+        en_primario = []
+        event.listen(primario, "before_cursor_execute", lambda *args: en_primario.append(args[2]))
+        assert repo.find_all_by_user(usuario.id) == []
+        assert en_primario == []
+        # reintentar=True: lo que no está en la réplica se busca en el primario
+        assert repo.find_by_id(creada.id).cantidad == 10.0
+        # Las escrituras y las lecturas no marcadas siempre van al primario
+        assert db.query(TransaccionORM).count() == 1
+    finally:
+        db.close()
+        escrituras_recientes.clear()
+
+
+def test_eventos_de_dominio_tras_commit_unit(db, user_id):
+    import asyncio
+    from app.domain.services.event_bus import EventBus, event_bus
+    from app.domain.services.eventos import EventoDominio, TransaccionCreada, TransaccionModificada, TransaccionEliminada
+    from app.infrastructure.database.eventos import registrar_evento
+    recibidos = []
+    event_bus.suscribir(EventoDominio, recibidos.append)
+    try:
+        transaccion = CrearTransaccionUseCase(db).execute(user_id=user_id, tipo="gasto", cantidad=10.0)
+        ActualizarTransaccionUseCase(db).execute(user_id=user_id, transaccion_id=transaccion.id, cantidad=15.0)
+        EliminarTransaccionUseCase(db).execute(user_id=user_id, transaccion_id=transaccion.id)
+        # Un rollback descarta los eventos pendientes
+        registrar_evento(db, TransaccionCreada(user_id, 0, transaccion.fecha, "gasto", 1.0))
+        db.rollback()
+    finally:
+        event_bus.cancelar(EventoDominio, recibidos.append)
+    assert [type(e) for e in recibidos] == [TransaccionCreada, TransaccionModificada, TransaccionEliminada]
+    assert recibidos[1].anterior[2] == 10.0 and recibidos[1].nueva[2] == 15.0
+
+    # Segundo plano: cola asyncio; un suscriptor que falla no afecta a los demás
+    bus = EventBus()
+    procesados = []
+
+    async def proyectar(evento):
+        procesados.append(evento.transaccion_id)
+
+    def fallar(evento):
+        raise RuntimeError("suscriptor roto")
+
+    bus.suscribir(TransaccionCreada, fallar)
+    bus.suscribir(TransaccionCreada, proyectar, en_segundo_plano=True)
+    bus.publicar(TransaccionCreada(user_id, 1, transaccion.fecha, "gasto", 1.0))  # sin iniciar: se descarta
+
+    async def escenario():
+        await bus.iniciar()
+        bus.publicar(TransaccionCreada(user_id, 2, transaccion.fecha, "gasto", 1.0))
+        await bus.detener()
+
+    asyncio.run(escenario())
+    assert procesados == [2]
+    assert bus.stats()["descartados"] == 1 and bus.stats()["errores"] == 2
+
+
+def test_particiones_por_mes_y_anio_unit():
+    from datetime import date
+    from app.infrastructure.database.particiones import asegurar_particiones, granularidad_actual, periodos_futuros, periodos_particion
+    meses = periodos_particion(date(2024, 11, 15), date(2025, 1, 3))
+    assert meses == [
+        ("transacciones_p2024_11", date(2024, 11, 1), date(2024, 12, 1)),
+        ("transacciones_p2024_12", date(2024, 12, 1), date(2025, 1, 1)),
+        ("transacciones_p2025_01", date(2025, 1, 1), date(2025, 2, 1)),
+    ]
+    assert [p[0] for p in periodos_futuros(date(2025, 12, 20), 2, "mes")] == ["transacciones_p2025_12", "transacciones_p2026_01", "transacciones_p2026_02"]
+    assert periodos_futuros(date(2025, 6, 1), 1, "anio") == [
+        ("transacciones_p2025", date(2025, 1, 1), date(2026, 1, 1)),
+        ("transacciones_p2026", date(2026, 1, 1), date(2027, 1, 1)),
+    ]
+    assert granularidad_actual(["transacciones_default", "transacciones_p2025"]) == "anio"
+    assert granularidad_actual(["transacciones_p2025_03"]) == "mes"
+    # Fuera de PostgreSQL no hay nada que crear
+    assert asegurar_particiones(engine) == []
+
+
+def test_importacion_async_parsea_fuera_del_event_loop_unit(tmp_path, monkeypatch):
+    import asyncio
+    import io
+    import threading
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from app.application.use_cases.transaccion.importar_transacciones import AsyncImportarTransaccionesUseCase
+    url = f"sqlite:///{tmp_path / 'importar.db'}"
+    Base.metadata.create_all(bind=create_engine(url))
+    hilos = set()
+    validar = AsyncImportarTransaccionesUseCase._validar
+
+    def validar_registrando(self, user_id, fila):
+        hilos.add(threading.get_ident())
+        return validar(self, user_id, fila)
+
+    monkeypatch.setattr(AsyncImportarTransaccionesUseCase, "_validar", validar_registrando)
+    monkeypatch.setattr(AsyncImportarTransaccionesUseCase, "TAMANO_LOTE", 2)
+    csv = "tipo,cantidad,fecha\n" + "gasto,10,2025-01-05\n" * 5 + "otro,1,2025-01-05\n"
+
+    async def importar():
+        motor = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"))
+        try:
+            async with AsyncSession(motor) as sesion:
+                resultado = await AsyncImportarTransaccionesUseCase(sesion).execute(1, io.BytesIO(csv.encode()), "csv")
+            return resultado, threading.get_ident()
+        finally:
+            await motor.dispose()
+
+    resultado, hilo_loop = asyncio.run(importar())
+    assert (resultado["importadas"], resultado["rechazadas"]) == (5, 1)
+    assert resultado["errores"][0]["linea"] == 7
+    # Parseo y validación en el threadpool: el event loop solo espera los INSERT por lotes
+    assert hilos and hilo_loop not in hilos